@@ -0,0 +1,13 @@
+"""
+Benchmarks of the payment plan SDK.
+
+Run from the repository root, with the SDK importable:
+
+    python -m benchmarks                      # every benchmark, table on stderr
+    python -m benchmarks --output results.json
+    python -m benchmarks --filter codec --quick
+
+Benchmarks only call the bundled library, so they run offline. Results are printed as a
+table and written as JSON (see `harness.results_document`), with every timed sample, which
+`python -m benchmarks.compare` checks against a baseline for regressions.
+"""
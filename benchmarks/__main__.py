@@ -0,0 +1,67 @@
+import argparse
+import json
+import re
+import sys
+from .cases import all_benchmarks
+from .harness import format_seconds, results_document, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the payment plan SDK."
+    )
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose name matches this regex")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark (default: 5)")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum seconds per sample (default: 0.05)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="3 samples of 0.01s, for smoke runs"
+    )
+    parser.add_argument("-o", "--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.01
+
+    benchmarks = all_benchmarks()
+    if args.filter:
+        pattern = re.compile(args.filter)
+        benchmarks = [b for b in benchmarks if pattern.search(b.name)]
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+    if not benchmarks:
+        parser.error("no benchmark matches {!r}".format(args.filter))
+
+    def progress(result):
+        print(
+            "{:<48} {:>10} median  {:>10} min  (+-{:.1%}, {} x {})".format(
+                result.name,
+                format_seconds(result.median),
+                format_seconds(result.min),
+                result.stdev / result.mean if result.mean else 0,
+                len(result.samples),
+                result.number,
+            ),
+            file=sys.stderr,
+        )
+
+    results = run(benchmarks, args.repeat, args.min_time, progress)
+    document = results_document(results, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
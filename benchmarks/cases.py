@@ -0,0 +1,207 @@
+"""
+The benchmarks of the SDK, in three groups:
+
+- codec: the Python side of the FFI boundary, without calling Rust: lowering params,
+  lifting encoded plan lists and converting timestamps;
+- end_to_end: `calculate_payment_plan` for 1 to 24 installments, and
+  `calculate_down_payment_plan` for several down payment installment counts;
+- calendar: the business day functions;
+- cache: hits and misses of a PaymentPlanCache, a hit having to stay well below a miss.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+from payment_plan import (
+    DownPaymentParams,
+    Params,
+    calculate_down_payment_plan,
+    calculate_payment_plan,
+    disbursement_date_range,
+    get_non_business_days_between,
+    next_disbursement_date,
+)
+from payment_plan._calls import _calculate_payment_plan_bytes
+from payment_plan.cache import PaymentPlanCache
+from payment_plan._internal.payment_plan_uniffi import (
+    _UniffiConverterSequenceTypeInternalResponse,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeInternalDownPaymentParams,
+    _UniffiConverterTypeInternalParams,
+)
+from .harness import Benchmark
+
+INSTALLMENTS = tuple(range(1, 25))
+
+DOWN_PAYMENT_INSTALLMENTS = (1, 2, 3, 4, 6, 8, 12)
+
+# Installments of the params nested in the down payment params.
+DOWN_PAYMENT_PLAN_INSTALLMENTS = 12
+
+_TZ = timezone(timedelta(hours=-3))
+
+
+def make_params(installments: int = 12, min_installments=None) -> Params:
+    return Params(
+        requested_amount=7800,
+        first_payment_date=datetime(2025, 5, 3, tzinfo=_TZ),
+        disbursement_date=datetime(2025, 4, 5, tzinfo=_TZ),
+        installments=installments,
+        debit_service_percentage=0,
+        mdr=0.05,
+        tac_percentage=0,
+        iof_overall=0.0038,
+        iof_percentage=0.000082,
+        interest_rate=0.0235,
+        min_installment_amount=100,
+        max_total_amount=1000000,
+        disbursement_only_on_business_days=True,
+        min_installments=min_installments,
+    )
+
+
+def make_down_payment_params(
+    installments: int = 4, plan_installments: int = DOWN_PAYMENT_PLAN_INSTALLMENTS
+) -> DownPaymentParams:
+    return DownPaymentParams(
+        params=make_params(plan_installments),
+        requested_amount=1000,
+        min_installment_amount=100,
+        first_payment_date=datetime(2025, 5, 3, tzinfo=_TZ),
+        installments=installments,
+    )
+
+
+def codec_benchmarks() -> List[Benchmark]:
+    params = make_params()
+    params_with_minimum = make_params(min_installments=3)
+    down_payment_params = make_down_payment_params()
+
+    def lower(converter, value):
+        # Lowered buffers are owned by the caller until passed to Rust, so free them here.
+        return lambda: converter.lower(value).free()
+
+    benchmarks = [
+        Benchmark("codec.params_lower", "codec", lower(_UniffiConverterTypeInternalParams, params)),
+        Benchmark(
+            "codec.params_lower_min_installments",
+            "codec",
+            lower(_UniffiConverterTypeInternalParams, params_with_minimum),
+        ),
+        Benchmark(
+            "codec.params_check_lower",
+            "codec",
+            lambda: _UniffiConverterTypeInternalParams.check_lower(params),
+        ),
+        Benchmark(
+            "codec.down_payment_params_lower",
+            "codec",
+            lower(_UniffiConverterTypeInternalDownPaymentParams, down_payment_params),
+        ),
+    ]
+    for installments in (1, 12, 24):
+        # lift_bytes is all of lift but copying the contents out of the Rust buffer,
+        # which would otherwise have to be refilled before every call.
+        data = _calculate_payment_plan_bytes(make_params(installments))
+        benchmarks.append(
+            Benchmark(
+                "codec.response_lift[installments={}]".format(installments),
+                "codec",
+                lambda data=data: _UniffiConverterSequenceTypeInternalResponse.lift_bytes(data),
+                {"installments": installments, "bytes": len(data)},
+            )
+        )
+    timestamp = params.first_payment_date
+    seconds, nanoseconds = _UniffiConverterTimestamp.split(timestamp)
+    benchmarks += [
+        Benchmark(
+            "codec.timestamp_lower", "codec", lambda: _UniffiConverterTimestamp.split(timestamp)
+        ),
+        Benchmark(
+            "codec.timestamp_lift",
+            "codec",
+            lambda: _UniffiConverterTimestamp.from_parts(seconds, nanoseconds),
+        ),
+    ]
+    return benchmarks
+
+
+def end_to_end_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for installments in INSTALLMENTS:
+        params = make_params(installments)
+        benchmarks.append(
+            Benchmark(
+                "calculate_payment_plan[installments={}]".format(installments),
+                "end_to_end",
+                lambda params=params: calculate_payment_plan(params),
+                {"installments": installments},
+            )
+        )
+    for installments in DOWN_PAYMENT_INSTALLMENTS:
+        params = make_down_payment_params(installments)
+        benchmarks.append(
+            Benchmark(
+                "calculate_down_payment_plan[installments={}]".format(installments),
+                "end_to_end",
+                lambda params=params: calculate_down_payment_plan(params),
+                {
+                    "installments": installments,
+                    "plan_installments": DOWN_PAYMENT_PLAN_INSTALLMENTS,
+                },
+            )
+        )
+    return benchmarks
+
+
+def calendar_benchmarks() -> List[Benchmark]:
+    base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+    year_later = base_date + timedelta(days=365)
+    return [
+        Benchmark("next_disbursement_date", "calendar", lambda: next_disbursement_date(base_date)),
+        Benchmark(
+            "disbursement_date_range[days=30]",
+            "calendar",
+            lambda: disbursement_date_range(base_date, 30),
+            {"days": 30},
+        ),
+        Benchmark(
+            "get_non_business_days_between[days=365]",
+            "calendar",
+            lambda: get_non_business_days_between(base_date, year_later),
+            {"days": 365},
+        ),
+    ]
+
+
+def cache_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for installments in (12, 24):
+        params = make_params(installments)
+        cache = PaymentPlanCache()
+        cache.calculate_payment_plan(params)
+
+        def miss(cache=PaymentPlanCache(), params=params):
+            cache.clear()
+            return cache.calculate_payment_plan(params)
+
+        benchmarks += [
+            Benchmark(
+                "cache.hit[installments={}]".format(installments),
+                "cache",
+                lambda cache=cache, params=params: cache.calculate_payment_plan(params),
+                {"installments": installments},
+            ),
+            Benchmark(
+                "cache.miss[installments={}]".format(installments),
+                "cache",
+                miss,
+                {"installments": installments},
+            ),
+        ]
+    return benchmarks
+
+
+def all_benchmarks() -> List[Benchmark]:
+    return (
+        codec_benchmarks() + end_to_end_benchmarks() + calendar_benchmarks() + cache_benchmarks()
+    )
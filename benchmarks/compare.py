@@ -0,0 +1,232 @@
+"""
+Benchmark regression gate.
+
+Compares benchmark results against a baseline written by `python -m benchmarks -o`:
+
+    python -m benchmarks --repeat 10 -o baseline.json     # on the reference version
+    python -m benchmarks.compare baseline.json            # runs the baseline benchmarks again
+    python -m benchmarks.compare baseline.json current.json
+
+A benchmark regressed when its median time grew by more than `--threshold` and a one-sided
+Mann-Whitney U test on the samples of both runs says it is slower at the `--alpha`
+significance level, so that a noisy sample alone can't fail the gate. The command exits
+with status 1 when a tracked benchmark (by default lowering, lifting and
+`calculate_payment_plan`) regressed or is missing from the current results.
+"""
+
+import argparse
+import json
+import re
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+from .cases import all_benchmarks
+from .harness import Result, format_seconds, load_results, results_document, run
+from .stats import mann_whitney_greater, min_p_value
+
+TRACKED = r"^(codec\.params_lower|codec\.response_lift|calculate_payment_plan\[)"
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+MISSING = "missing"
+
+
+class Comparison(NamedTuple):
+    """
+    Comparison of one benchmark; `ratio` is the current median over the baseline one, and
+    `p_slower`/`p_faster` the one-sided p-values of the current run being slower/faster.
+    """
+
+    name: str
+    tracked: bool
+    status: str
+    baseline: Optional[float]
+    current: Optional[float]
+    ratio: Optional[float]
+    p_slower: Optional[float]
+    p_faster: Optional[float]
+
+    @property
+    def failed(self) -> bool:
+        return self.tracked and self.status in (REGRESSED, MISSING)
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(self._asdict(), failed=self.failed)
+
+
+def compare(
+    baseline: Dict[str, Result],
+    current: Dict[str, Result],
+    tracked: str = TRACKED,
+    threshold: float = 0.05,
+    alpha: float = 0.01,
+) -> List[Comparison]:
+    """
+    Compare every baseline benchmark with its current results.
+
+    Benchmarks only in `current` are new and not compared.
+    """
+    pattern = re.compile(tracked)
+    comparisons = []
+    for name, before in baseline.items():
+        is_tracked = bool(pattern.search(name))
+        after = current.get(name)
+        if after is None:
+            comparisons.append(
+                Comparison(name, is_tracked, MISSING, before.median, None, None, None, None)
+            )
+            continue
+        ratio = after.median / before.median
+        p_slower = mann_whitney_greater(after.samples, before.samples)
+        p_faster = mann_whitney_greater(before.samples, after.samples)
+        if ratio > 1 + threshold and p_slower < alpha:
+            status = REGRESSED
+        elif ratio < 1 - threshold and p_faster < alpha:
+            status = IMPROVED
+        else:
+            status = UNCHANGED
+        comparisons.append(
+            Comparison(
+                name, is_tracked, status, before.median, after.median, ratio, p_slower, p_faster
+            )
+        )
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Compare benchmark results against a baseline; exit with 1 on regression.",
+    )
+    parser.add_argument("baseline", help="baseline results JSON")
+    parser.add_argument(
+        "current", nargs="?", help="current results JSON; the benchmarks are run when omitted"
+    )
+    parser.add_argument(
+        "--track",
+        default=TRACKED,
+        help="regex of the benchmarks that fail the gate (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="relative median slowdown tolerated (default: 0.05)",
+    )
+    parser.add_argument(
+        "--alpha", type=float, default=0.01, help="significance level (default: 0.01)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="samples per benchmark when running them (default: 10)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum seconds per sample when running them (default: 0.05)",
+    )
+    parser.add_argument("--save", help="write the current results JSON to this file")
+    parser.add_argument("--json", help="write the comparison JSON to this file")
+    args = parser.parse_args(argv)
+
+    baseline_document = _load(args.baseline)
+    baseline = load_results(baseline_document)
+    if args.current:
+        current_document = _load(args.current)
+    else:
+        benchmarks = [b for b in all_benchmarks() if b.name in baseline]
+        current_document = results_document(
+            run(benchmarks, args.repeat, args.min_time), args.repeat, args.min_time
+        )
+    current = load_results(current_document)
+    if args.save:
+        _dump(current_document, args.save)
+
+    for key in ("python", "implementation", "platform", "machine"):
+        if baseline_document.get(key) != current_document.get(key):
+            print(
+                "warning: baseline {} is {!r}, current is {!r}".format(
+                    key, baseline_document.get(key), current_document.get(key)
+                ),
+                file=sys.stderr,
+            )
+    for result in (baseline, current):
+        for name, samples in _too_few_samples(result, args.alpha):
+            print(
+                "warning: {} has too few samples ({}) to be significant at alpha={}".format(
+                    name, samples, args.alpha
+                ),
+                file=sys.stderr,
+            )
+
+    comparisons = compare(baseline, current, args.track, args.threshold, args.alpha)
+    _print_table(comparisons)
+    if args.json:
+        _dump(
+            {
+                "baseline": args.baseline,
+                "threshold": args.threshold,
+                "alpha": args.alpha,
+                "track": args.track,
+                "comparisons": [comparison.to_json() for comparison in comparisons],
+            },
+            args.json,
+        )
+    failed = [comparison.name for comparison in comparisons if comparison.failed]
+    if failed:
+        print(
+            "{} tracked benchmark(s) regressed or missing: {}".format(
+                len(failed), ", ".join(failed)
+            )
+        )
+        return 1
+    return 0
+
+
+def _too_few_samples(results, alpha):
+    # The test can't reach alpha when even a complete separation of the samples isn't enough.
+    for name, result in results.items():
+        samples = len(result.samples)
+        if min_p_value(samples, samples) >= alpha:
+            yield name, samples
+
+
+def _print_table(comparisons):
+    for comparison in comparisons:
+        marker = "*" if comparison.tracked else " "
+        if comparison.status == MISSING:
+            print(
+                "{} {:<48} {:>10} -> {:>10}  {}".format(
+                    marker, comparison.name, format_seconds(comparison.baseline), "-", MISSING
+                )
+            )
+            continue
+        print(
+            "{} {:<48} {:>10} -> {:>10}  {:+7.1%}  p={:.3g}  {}".format(
+                marker,
+                comparison.name,
+                format_seconds(comparison.baseline),
+                format_seconds(comparison.current),
+                comparison.ratio - 1,
+                comparison.p_slower if comparison.ratio >= 1 else comparison.p_faster,
+                comparison.status,
+            )
+        )
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _dump(document, path):
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
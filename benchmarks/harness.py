@@ -0,0 +1,165 @@
+"""Timing of benchmarks and their JSON results."""
+
+import gc
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+FORMAT_VERSION = 1
+
+
+class Benchmark(NamedTuple):
+    """
+    A function to time, called without arguments.
+
+    `name` identifies the benchmark across runs; `group` and `params` are only reported.
+    """
+
+    name: str
+    group: str
+    function: Callable[[], Any]
+    params: Dict[str, Any] = {}
+
+
+class Result(NamedTuple):
+    """
+    Timings of a benchmark: `samples` are the mean seconds per call of each repeat,
+    each made of `number` calls.
+    """
+
+    name: str
+    group: str
+    params: Dict[str, Any]
+    number: int
+    samples: List[float]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.mean(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "group": self.group,
+            "params": self.params,
+            "number": self.number,
+            "samples": self.samples,
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Result":
+        return cls(data["name"], data["group"], data["params"], data["number"], data["samples"])
+
+
+def measure(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.05) -> Result:
+    """
+    Time `benchmark` in `repeat` samples of at least `min_time` seconds each.
+
+    The number of calls per sample is calibrated first, like `timeit.Timer.autorange`, and
+    the garbage collector is paused while a sample runs.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    function = benchmark.function
+    function()  # Warm up caches and lazily initialized state.
+    number = _calibrate(function, min_time)
+    samples = [_sample(function, number) / number for _ in range(repeat)]
+    return Result(benchmark.name, benchmark.group, dict(benchmark.params), number, samples)
+
+
+def run(
+    benchmarks: List[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.05,
+    progress: Optional[Callable[[Result], None]] = None,
+) -> List[Result]:
+    results = []
+    for benchmark in benchmarks:
+        result = measure(benchmark, repeat, min_time)
+        if progress is not None:
+            progress(result)
+        results.append(result)
+    return results
+
+
+def results_document(results: List[Result], repeat: int, min_time: float) -> Dict[str, Any]:
+    """JSON document of a benchmark run, with the environment it ran in."""
+    return {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "sdk_version": _sdk_version(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "min_time": min_time,
+        "results": [result.to_json() for result in results],
+    }
+
+
+def load_results(document: Dict[str, Any]) -> Dict[str, Result]:
+    """Results of a document written by `results_document`, by benchmark name."""
+    if document.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            "unsupported benchmark results format {!r}".format(document.get("format_version"))
+        )
+    return {data["name"]: Result.from_json(data) for data in document["results"]}
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return "{:.3g} {}".format(seconds / scale, unit)
+    return "{:.3g} ns".format(seconds / 1e-9)
+
+
+def _calibrate(function, min_time):
+    number = 1
+    while True:
+        elapsed = _sample(function, number)
+        if elapsed >= min_time:
+            return number
+        # Aim slightly past min_time, growing by at most 10x per step.
+        number = max(number + 1, min(number * 10, int(number * min_time * 1.2 / max(elapsed, 1e-9))))
+
+
+def _sample(function, number):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        clock = time.perf_counter
+        started = clock()
+        for _ in range(number):
+            function()
+        return clock() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _sdk_version():
+    try:
+        from importlib.metadata import version
+        return version("payment-plan-python-sdk")
+    except Exception:
+        return None
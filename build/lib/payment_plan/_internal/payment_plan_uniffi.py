@@ -0,0 +1,2458 @@
+
+
+# This file was autogenerated by some hot garbage in the `uniffi` crate.
+# Trust me, you don't want to mess with it!
+
+# Common helper code.
+#
+# Ideally this would live in a separate .py file where it can be unittested etc
+# in isolation, and perhaps even published as a re-useable package.
+#
+# However, it's important that the details of how this helper code works (e.g. the
+# way that different builtin types are passed across the FFI) exactly match what's
+# expected by the rust code on the other side of the interface. In practice right
+# now that means coming from the exact some version of `uniffi` that was used to
+# compile the rust component. The easiest way to ensure this is to bundle the Python
+# helpers directly inline like we're doing here.
+
+from __future__ import annotations
+import os
+import sys
+import ctypes
+import enum
+import struct
+import contextlib
+import datetime
+import threading
+import itertools
+import traceback
+import typing
+import weakref
+import platform
+
+# Used for default argument values
+_DEFAULT = object() # type: typing.Any
+
+def _uniffi_build_record(cls, fields):
+    # Unpickles records whose attributes can't be restored one at a time.
+    return cls(**fields)
+
+
+class _UniffiRustBuffer(ctypes.Structure):
+    _fields_ = [
+        ("capacity", ctypes.c_uint64),
+        ("len", ctypes.c_uint64),
+        ("data", ctypes.POINTER(ctypes.c_char)),
+    ]
+
+    @staticmethod
+    def default():
+        return _UniffiRustBuffer(0, 0, None)
+
+    @staticmethod
+    def alloc(size):
+        counts = _UNIFFI_ALLOCATION_COUNTS.current
+        if counts is not None:
+            counts.allocations += 1
+            counts.allocated_bytes += size
+        return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_alloc, size)
+
+    @staticmethod
+    def reserve(rbuf, additional):
+        counts = _UNIFFI_ALLOCATION_COUNTS.current
+        if counts is not None:
+            counts.reserves += 1
+        return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_reserve, rbuf, additional)
+
+    @staticmethod
+    def from_bytes(foreign_bytes):
+        """Copy the memory described by a _UniffiForeignBytes into a new buffer."""
+        counts = _UNIFFI_ALLOCATION_COUNTS.current
+        if counts is not None:
+            counts.allocations += 1
+            counts.allocated_bytes += foreign_bytes.len
+        return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_from_bytes, foreign_bytes)
+
+    @staticmethod
+    def alloc_filled(size, fill):
+        """Allocate a buffer of exactly `size` bytes, whose contents are written by `fill(view)`.
+
+        `fill` is given a writable ctypes buffer of `size` bytes. With the buffer pool
+        enabled (see `use_buffer_pool`) that is the current thread's staging memory, which is
+        then copied into a new buffer by a single `rustbuffer_from_bytes` call; otherwise it
+        is a freshly allocated buffer, which is freed if `fill` fails so it can't leak.
+        """
+        if _UNIFFI_BUFFER_POOL.enabled:
+            staging, foreign_bytes = _UNIFFI_BUFFER_POOL.staging().get(size)
+            fill(staging)
+            return _UniffiRustBuffer.from_bytes(foreign_bytes)
+        rbuf = _UniffiRustBuffer.alloc(size)
+        try:
+            fill(rbuf.view(0, size))
+        except:
+            rbuf.free()
+            raise
+        rbuf.len = size
+        return rbuf
+
+    @staticmethod
+    def alloc_from_struct(record_struct, values):
+        """Allocate a buffer of exactly `record_struct.size` bytes and pack `values` into it.
+
+        Values that don't fit the layout raise ValueError.
+        """
+        def fill(view):
+            try:
+                record_struct.pack_into(view, 0, *values)
+            except struct.error as e:
+                raise ValueError("can't encode value: {}".format(e)) from None
+        return _UniffiRustBuffer.alloc_filled(record_struct.size, fill)
+
+    def free(self):
+        return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_free, self)
+
+    def view(self, offset, size):
+        """Writable ctypes view over `size` bytes of the buffer, starting at `offset`."""
+        address = ctypes.cast(self.data, ctypes.c_void_p).value + offset
+        return (ctypes.c_char * size).from_address(address)
+
+    def __str__(self):
+        return "_UniffiRustBuffer(capacity={}, len={}, data={})".format(
+            self.capacity,
+            self.len,
+            self.data[0:self.len]
+        )
+
+    @staticmethod
+    @contextlib.contextmanager
+    def alloc_with_builder(capacity=None):
+        """Context-manger to allocate a buffer using a _UniffiRustBufferBuilder.
+
+        The allocated buffer will be automatically freed if an error occurs, ensuring that
+        we don't accidentally leak it. With the exact `capacity` of what will be written,
+        the buffer is allocated once and never grown.
+        """
+        builder = _UniffiRustBufferBuilder(capacity)
+        try:
+            yield builder
+        except:
+            builder.discard()
+            raise
+
+    @contextlib.contextmanager
+    def consume_with_stream(self):
+        """Context-manager to consume a buffer using a _UniffiRustBufferStream.
+
+        The _UniffiRustBuffer will be freed once the context-manager exits, ensuring that we don't
+        leak it even if an error occurs.
+        """
+        try:
+            s = _UniffiRustBufferStream.from_rust_buffer(self)
+            yield s
+            if s.remaining() != 0:
+                raise RuntimeError("junk data left in buffer at end of consume_with_stream")
+        finally:
+            self.free()
+
+    def consume_bytes(self):
+        """Copy the contents of the buffer into a bytes object and free the buffer."""
+        try:
+            if self.len == 0:
+                return b""
+            return ctypes.string_at(self.data, self.len)
+        finally:
+            self.free()
+
+    @contextlib.contextmanager
+    def read_with_stream(self):
+        """Context-manager to read a buffer using a _UniffiRustBufferStream.
+
+        This is like consume_with_stream, but doesn't free the buffer afterwards.
+        It should only be used with borrowed `_UniffiRustBuffer` data.
+        """
+        s = _UniffiRustBufferStream.from_rust_buffer(self)
+        yield s
+        if s.remaining() != 0:
+            raise RuntimeError("junk data left in buffer at end of read_with_stream")
+
+class RustBufferAllocations:
+    """Counts of the RustBuffer allocations made within `count_allocations()`."""
+
+    __slots__ = ("allocations", "reserves", "allocated_bytes")
+
+    def __init__(self):
+        self.allocations = 0
+        self.reserves = 0
+        self.allocated_bytes = 0
+
+    def __repr__(self):
+        return "RustBufferAllocations(allocations={}, reserves={}, allocated_bytes={})".format(
+            self.allocations, self.reserves, self.allocated_bytes
+        )
+
+class _UniffiAllocationCounts(threading.local):
+    # The counts being updated by the current thread, if any.
+    current = None
+
+_UNIFFI_ALLOCATION_COUNTS = _UniffiAllocationCounts()
+
+@contextlib.contextmanager
+def count_allocations():
+    """Context-manager counting the RustBuffer allocations made from the current thread.
+
+    Yields a RustBufferAllocations, updated as buffers are allocated (`allocations`,
+    `allocated_bytes`) or grown (`reserves`) on the Python side of the calls made within it.
+    Buffers allocated by the Rust library for results are not counted.
+    """
+    previous = _UNIFFI_ALLOCATION_COUNTS.current
+    counts = _UNIFFI_ALLOCATION_COUNTS.current = RustBufferAllocations()
+    try:
+        yield counts
+    finally:
+        _UNIFFI_ALLOCATION_COUNTS.current = previous
+
+class BufferPoolStats(typing.NamedTuple):
+    """Point-in-time counters of the lowering buffer pool, over the threads still alive."""
+
+    enabled: bool
+    threads: int
+    staging_buffers: int
+    staging_bytes: int
+    reuses: int
+    allocations: int
+
+class _UniffiStagingBuffers:
+    # One thread's staging memory: per payload size, a reusable ctypes buffer along with
+    # the _UniffiForeignBytes pointing at it.
+    MAX_SIZES = 8
+
+    def __init__(self):
+        self.buffers = {}
+        self.reuses = 0
+        self.allocations = 0
+
+    def get(self, size):
+        try:
+            entry = self.buffers[size]
+        except KeyError:
+            if len(self.buffers) >= self.MAX_SIZES:
+                self.buffers.clear()
+            buffer = (ctypes.c_char * size)()
+            entry = self.buffers[size] = (buffer, _UniffiForeignBytes(size, buffer))
+            self.allocations += 1
+        else:
+            self.reuses += 1
+        return entry
+
+class _UniffiBufferPool:
+    def __init__(self):
+        self.enabled = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Staging memory of every thread, dropped along with the thread.
+        self._all = weakref.WeakSet()
+
+    def staging(self):
+        try:
+            return self._local.staging
+        except AttributeError:
+            staging = self._local.staging = _UniffiStagingBuffers()
+            with self._lock:
+                self._all.add(staging)
+            return staging
+
+    def stats(self):
+        with self._lock:
+            all_staging = list(self._all)
+        return BufferPoolStats(
+            enabled=self.enabled,
+            threads=len(all_staging),
+            staging_buffers=sum(len(staging.buffers) for staging in all_staging),
+            staging_bytes=sum(size for staging in all_staging for size in list(staging.buffers)),
+            reuses=sum(staging.reuses for staging in all_staging),
+            allocations=sum(staging.allocations for staging in all_staging),
+        )
+
+_UNIFFI_BUFFER_POOL = _UniffiBufferPool()
+
+def use_buffer_pool(enabled: bool = True) -> None:
+    """Enable or disable the pool of staging buffers used to lower params.
+
+    When enabled, params are encoded into staging memory kept per thread and per size, and
+    copied into the buffer handed to the Rust library with a single `rustbuffer_from_bytes`
+    call, instead of being encoded straight into a freshly allocated buffer.
+    """
+    _UNIFFI_BUFFER_POOL.enabled = enabled
+
+def buffer_pool_stats() -> BufferPoolStats:
+    """Return the counters of the lowering buffer pool."""
+    return _UNIFFI_BUFFER_POOL.stats()
+
+class _UniffiForeignBytes(ctypes.Structure):
+    _fields_ = [
+        ("len", ctypes.c_int32),
+        ("data", ctypes.POINTER(ctypes.c_char)),
+    ]
+
+    def __str__(self):
+        return "_UniffiForeignBytes(len={}, data={})".format(self.len, self.data[0:self.len])
+
+
+class _UniffiRustBufferStream:
+    """
+    Helper for structured reading of bytes from a _UniffiRustBuffer
+    """
+
+    _I8 = struct.Struct(">b")
+    _U8 = struct.Struct(">B")
+    _I16 = struct.Struct(">h")
+    _U16 = struct.Struct(">H")
+    _I32 = struct.Struct(">i")
+    _U32 = struct.Struct(">I")
+    _I64 = struct.Struct(">q")
+    _U64 = struct.Struct(">Q")
+    _FLOAT = struct.Struct(">f")
+    _DOUBLE = struct.Struct(">d")
+
+    def __init__(self, data, len):
+        self.data = memoryview(data)
+        self.len = len
+        self.offset = 0
+        # Timestamps decoded so far, keyed by their wire value; see `_UniffiConverterTimestamp.read_parts`.
+        self.timestamps = {}
+
+    @classmethod
+    def from_rust_buffer(cls, buf):
+        # Copy the contents out once; every read below is then a plain offset
+        # into that copy instead of a slice of the ctypes pointer.
+        if buf.len == 0:
+            return cls(b"", 0)
+        return cls(ctypes.string_at(buf.data, buf.len), buf.len)
+
+    def remaining(self):
+        return self.len - self.offset
+
+    def read_struct(self, record_struct):
+        """Unpack a whole fixed-layout record, returning the tuple of its values."""
+        if self.offset + record_struct.size > self.len:
+            raise InternalError("read past end of rust buffer")
+        values = record_struct.unpack_from(self.data, self.offset)
+        self.offset += record_struct.size
+        return values
+
+    def read_records(self, record_struct, count):
+        """Unpack `count` consecutive fixed-layout records into a list of tuples."""
+        size = record_struct.size * count
+        if self.offset + size > self.len:
+            raise InternalError("read past end of rust buffer")
+        records = list(record_struct.iter_unpack(self.data[self.offset:self.offset+size]))
+        self.offset += size
+        return records
+
+    def _unpack_from(self, record_struct):
+        return self.read_struct(record_struct)[0]
+
+    def read(self, size):
+        if self.offset + size > self.len:
+            raise InternalError("read past end of rust buffer")
+        data = self.data[self.offset:self.offset+size].tobytes()
+        self.offset += size
+        return data
+
+    def read_i8(self):
+        return self._unpack_from(self._I8)
+
+    def read_u8(self):
+        return self._unpack_from(self._U8)
+
+    def read_i16(self):
+        return self._unpack_from(self._I16)
+
+    def read_u16(self):
+        return self._unpack_from(self._U16)
+
+    def read_i32(self):
+        return self._unpack_from(self._I32)
+
+    def read_u32(self):
+        return self._unpack_from(self._U32)
+
+    def read_i64(self):
+        return self._unpack_from(self._I64)
+
+    def read_u64(self):
+        return self._unpack_from(self._U64)
+
+    def read_float(self):
+        v = self._unpack_from(self._FLOAT)
+        return v
+
+    def read_double(self):
+        return self._unpack_from(self._DOUBLE)
+
+class _UniffiRustBufferBuilder:
+    """
+    Helper for structured writing of bytes into a _UniffiRustBuffer.
+    """
+
+    def __init__(self, capacity=None):
+        self.rbuf = _UniffiRustBuffer.alloc(16 if capacity is None else capacity)
+        self.rbuf.len = 0
+
+    def finalize(self):
+        rbuf = self.rbuf
+        self.rbuf = None
+        return rbuf
+
+    def discard(self):
+        if self.rbuf is not None:
+            rbuf = self.finalize()
+            rbuf.free()
+
+    @contextlib.contextmanager
+    def _reserve(self, num_bytes):
+        if self.rbuf.len + num_bytes > self.rbuf.capacity:
+            self.rbuf = _UniffiRustBuffer.reserve(self.rbuf, num_bytes)
+        yield None
+        self.rbuf.len += num_bytes
+
+    def _pack_into(self, size, format, value):
+        with self._reserve(size):
+            struct.pack_into(format, self.rbuf.view(self.rbuf.len, size), 0, value)
+
+    def write(self, value):
+        size = len(value)
+        if size == 0:
+            return
+        with self._reserve(size):
+            ctypes.memmove(self.rbuf.view(self.rbuf.len, size), value, size)
+
+    def write_i8(self, v):
+        self._pack_into(1, ">b", v)
+
+    def write_u8(self, v):
+        self._pack_into(1, ">B", v)
+
+    def write_i16(self, v):
+        self._pack_into(2, ">h", v)
+
+    def write_u16(self, v):
+        self._pack_into(2, ">H", v)
+
+    def write_i32(self, v):
+        self._pack_into(4, ">i", v)
+
+    def write_u32(self, v):
+        self._pack_into(4, ">I", v)
+
+    def write_i64(self, v):
+        self._pack_into(8, ">q", v)
+
+    def write_u64(self, v):
+        self._pack_into(8, ">Q", v)
+
+    def write_float(self, v):
+        self._pack_into(4, ">f", v)
+
+    def write_double(self, v):
+        self._pack_into(8, ">d", v)
+
+    def write_c_size_t(self, v):
+        self._pack_into(ctypes.sizeof(ctypes.c_size_t) , "@N", v)
+# A handful of classes and functions to support the generated data structures.
+# This would be a good candidate for isolating in its own ffi-support lib.
+
+class InternalError(Exception):
+    pass
+
+class _UniffiRustCallStatus(ctypes.Structure):
+    """
+    Error runtime.
+    """
+    _fields_ = [
+        ("code", ctypes.c_int8),
+        ("error_buf", _UniffiRustBuffer),
+    ]
+
+    # These match the values from the uniffi::rustcalls module
+    CALL_SUCCESS = 0
+    CALL_ERROR = 1
+    CALL_UNEXPECTED_ERROR = 2
+
+    @staticmethod
+    def default():
+        return _UniffiRustCallStatus(code=_UniffiRustCallStatus.CALL_SUCCESS, error_buf=_UniffiRustBuffer.default())
+
+    def __str__(self):
+        if self.code == _UniffiRustCallStatus.CALL_SUCCESS:
+            return "_UniffiRustCallStatus(CALL_SUCCESS)"
+        elif self.code == _UniffiRustCallStatus.CALL_ERROR:
+            return "_UniffiRustCallStatus(CALL_ERROR)"
+        elif self.code == _UniffiRustCallStatus.CALL_UNEXPECTED_ERROR:
+            return "_UniffiRustCallStatus(CALL_UNEXPECTED_ERROR)"
+        else:
+            return "_UniffiRustCallStatus(<invalid code>)"
+
+def _uniffi_rust_call(fn, *args):
+    # Call a rust function
+    return _uniffi_rust_call_with_error(None, fn, *args)
+
+def _uniffi_rust_call_with_error(error_ffi_converter, fn, *args):
+    # Call a rust function and handle any errors
+    #
+    # This function is used for rust calls that return Result<> and therefore can set the CALL_ERROR status code.
+    # error_ffi_converter must be set to the _UniffiConverter for the error class that corresponds to the result.
+    call_status = _UniffiRustCallStatus.default()
+
+    args_with_error = args + (ctypes.byref(call_status),)
+    result = fn(*args_with_error)
+    _uniffi_check_call_status(error_ffi_converter, call_status)
+    return result
+
+def _uniffi_check_call_status(error_ffi_converter, call_status):
+    if call_status.code == _UniffiRustCallStatus.CALL_SUCCESS:
+        pass
+    elif call_status.code == _UniffiRustCallStatus.CALL_ERROR:
+        if error_ffi_converter is None:
+            call_status.error_buf.free()
+            raise InternalError("_uniffi_rust_call_with_error: CALL_ERROR, but error_ffi_converter is None")
+        else:
+            raise error_ffi_converter.lift(call_status.error_buf)
+    elif call_status.code == _UniffiRustCallStatus.CALL_UNEXPECTED_ERROR:
+        # When the rust code sees a panic, it tries to construct a _UniffiRustBuffer
+        # with the message.  But if that code panics, then it just sends back
+        # an empty buffer.
+        if call_status.error_buf.len > 0:
+            msg = _UniffiConverterString.lift(call_status.error_buf)
+        else:
+            msg = "Unknown rust panic"
+        raise InternalError(msg)
+    else:
+        raise InternalError("Invalid _UniffiRustCallStatus code: {}".format(
+            call_status.code))
+
+def _uniffi_trait_interface_call(call_status, make_call, write_return_value):
+    try:
+        return write_return_value(make_call())
+    except Exception as e:
+        call_status.code = _UniffiRustCallStatus.CALL_UNEXPECTED_ERROR
+        call_status.error_buf = _UniffiConverterString.lower(repr(e))
+
+def _uniffi_trait_interface_call_with_error(call_status, make_call, write_return_value, error_type, lower_error):
+    try:
+        try:
+            return write_return_value(make_call())
+        except error_type as e:
+            call_status.code = _UniffiRustCallStatus.CALL_ERROR
+            call_status.error_buf = lower_error(e)
+    except Exception as e:
+        call_status.code = _UniffiRustCallStatus.CALL_UNEXPECTED_ERROR
+        call_status.error_buf = _UniffiConverterString.lower(repr(e))
+class _UniffiHandleMap:
+    """
+    A map where inserting, getting and removing data is synchronized with a lock.
+    """
+
+    def __init__(self):
+        # type Handle = int
+        self._map = {}  # type: Dict[Handle, Any]
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    def insert(self, obj):
+        with self._lock:
+            handle = next(self._counter)
+            self._map[handle] = obj
+            return handle
+
+    def get(self, handle):
+        try:
+            with self._lock:
+                return self._map[handle]
+        except KeyError:
+            raise InternalError("_UniffiHandleMap.get: Invalid handle")
+
+    def remove(self, handle):
+        try:
+            with self._lock:
+                return self._map.pop(handle)
+        except KeyError:
+            raise InternalError("_UniffiHandleMap.remove: Invalid handle")
+
+    def __len__(self):
+        return len(self._map)
+# Types conforming to `_UniffiConverterPrimitive` pass themselves directly over the FFI.
+class _UniffiConverterPrimitive:
+    @classmethod
+    def lift(cls, value):
+        return value
+
+    @classmethod
+    def lower(cls, value):
+        return value
+
+class _UniffiConverterPrimitiveInt(_UniffiConverterPrimitive):
+    @classmethod
+    def check_lower(cls, value):
+        try:
+            value = value.__index__()
+        except Exception:
+            raise TypeError("'{}' object cannot be interpreted as an integer".format(type(value).__name__))
+        if not isinstance(value, int):
+            raise TypeError("__index__ returned non-int (type {})".format(type(value).__name__))
+        if not cls.VALUE_MIN <= value < cls.VALUE_MAX:
+            raise ValueError("{} requires {} <= value < {}".format(cls.CLASS_NAME, cls.VALUE_MIN, cls.VALUE_MAX))
+
+class _UniffiConverterPrimitiveFloat(_UniffiConverterPrimitive):
+    @classmethod
+    def check_lower(cls, value):
+        try:
+            value = value.__float__()
+        except Exception:
+            raise TypeError("must be real number, not {}".format(type(value).__name__))
+        if not isinstance(value, float):
+            raise TypeError("__float__ returned non-float (type {})".format(type(value).__name__))
+
+# Helper class for wrapper types that will always go through a _UniffiRustBuffer.
+# Classes should inherit from this and implement the `read` and `write` static methods.
+class _UniffiConverterRustBuffer:
+    @classmethod
+    def lift(cls, rbuf):
+        with rbuf.consume_with_stream() as stream:
+            return cls.read(stream)
+
+    @classmethod
+    def lift_bytes(cls, data):
+        """Like `lift`, but reads from a copy of the buffer contents (see `_UniffiRustBuffer.consume_bytes`)."""
+        stream = _UniffiRustBufferStream(data, len(data))
+        value = cls.read(stream)
+        if stream.remaining() != 0:
+            raise RuntimeError("junk data left in buffer at end of lift_bytes")
+        return value
+
+    @classmethod
+    def encoded_size(cls, value):
+        """Exact number of bytes `write` writes for `value`, or None if not known up front."""
+        return None
+
+    @classmethod
+    def lower(cls, value):
+        with _UniffiRustBuffer.alloc_with_builder(cls.encoded_size(value)) as builder:
+            cls.write(value, builder)
+            return builder.finalize()
+
+# Contains loading, initialization code, and the FFI Function declarations.
+# Define some ctypes FFI types that we use in the library
+
+"""
+Function pointer for a Rust task, which a callback function that takes a opaque pointer
+"""
+_UNIFFI_RUST_TASK = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int8)
+
+def _uniffi_future_callback_t(return_type):
+    """
+    Factory function to create callback function types for async functions
+    """
+    return ctypes.CFUNCTYPE(None, ctypes.c_uint64, return_type, _UniffiRustCallStatus)
+
+def _uniffi_load_indirect():
+    """
+    This is how we find and load the dynamic library provided by the component.
+    For now we just look it up by name.
+    """
+    if sys.platform == "darwin":
+        libname = "lib{}.dylib"
+    elif sys.platform.startswith("win"):
+        # As of python3.8, ctypes does not seem to search $PATH when loading DLLs.
+        # We could use `os.add_dll_directory` to configure the search path, but
+        # it doesn't feel right to mess with application-wide settings. Let's
+        # assume that the `.dll` is next to the `.py` file and load by full path.
+        libname = os.path.join(
+            os.path.dirname(__file__),
+            "{}.dll",
+        )
+    else:
+        # Anything else must be an ELF platform - Linux, *BSD, Solaris/illumos
+        libname = "lib{}.so"
+
+    libname = libname.format("payment_plan_uniffi")
+    path = os.path.join(os.path.dirname(__file__), libname)
+    lib = ctypes.cdll.LoadLibrary(path)
+    return lib
+
+def _uniffi_check_contract_api_version(lib):
+    # Get the bindings contract version from our ComponentInterface
+    bindings_contract_version = 26
+    # Get the scaffolding contract version by calling the into the dylib
+    scaffolding_contract_version = lib.ffi_payment_plan_uniffi_uniffi_contract_version()
+    if bindings_contract_version != scaffolding_contract_version:
+        raise InternalError("UniFFI contract version mismatch: try cleaning and rebuilding your project")
+
+def _uniffi_check_api_checksums(lib):
+    if lib.uniffi_payment_plan_uniffi_checksum_func_calculate_down_payment_plan() != 17012:
+        raise InternalError("UniFFI API checksum mismatch: try cleaning and rebuilding your project")
+    if lib.uniffi_payment_plan_uniffi_checksum_func_calculate_payment_plan() != 32631:
+        raise InternalError("UniFFI API checksum mismatch: try cleaning and rebuilding your project")
+    if lib.uniffi_payment_plan_uniffi_checksum_func_disbursement_date_range() != 5651:
+        raise InternalError("UniFFI API checksum mismatch: try cleaning and rebuilding your project")
+    if lib.uniffi_payment_plan_uniffi_checksum_func_get_non_business_days_between() != 34693:
+        raise InternalError("UniFFI API checksum mismatch: try cleaning and rebuilding your project")
+    if lib.uniffi_payment_plan_uniffi_checksum_func_next_disbursement_date() != 25001:
+        raise InternalError("UniFFI API checksum mismatch: try cleaning and rebuilding your project")
+
+# A ctypes library to expose the extern-C FFI definitions.
+# This is an implementation detail which will be called internally by the public API.
+
+_UniffiLib = _uniffi_load_indirect()
+_UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK = ctypes.CFUNCTYPE(None,ctypes.c_uint64,ctypes.c_int8,
+)
+_UNIFFI_FOREIGN_FUTURE_FREE = ctypes.CFUNCTYPE(None,ctypes.c_uint64,
+)
+_UNIFFI_CALLBACK_INTERFACE_FREE = ctypes.CFUNCTYPE(None,ctypes.c_uint64,
+)
+class _UniffiForeignFuture(ctypes.Structure):
+    _fields_ = [
+        ("handle", ctypes.c_uint64),
+        ("free", _UNIFFI_FOREIGN_FUTURE_FREE),
+    ]
+class _UniffiForeignFutureStructU8(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_uint8),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_U8 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructU8,
+)
+class _UniffiForeignFutureStructI8(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_int8),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_I8 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructI8,
+)
+class _UniffiForeignFutureStructU16(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_uint16),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_U16 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructU16,
+)
+class _UniffiForeignFutureStructI16(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_int16),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_I16 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructI16,
+)
+class _UniffiForeignFutureStructU32(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_uint32),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_U32 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructU32,
+)
+class _UniffiForeignFutureStructI32(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_int32),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_I32 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructI32,
+)
+class _UniffiForeignFutureStructU64(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_uint64),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_U64 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructU64,
+)
+class _UniffiForeignFutureStructI64(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_int64),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_I64 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructI64,
+)
+class _UniffiForeignFutureStructF32(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_float),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_F32 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructF32,
+)
+class _UniffiForeignFutureStructF64(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_double),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_F64 = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructF64,
+)
+class _UniffiForeignFutureStructPointer(ctypes.Structure):
+    _fields_ = [
+        ("return_value", ctypes.c_void_p),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_POINTER = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructPointer,
+)
+class _UniffiForeignFutureStructRustBuffer(ctypes.Structure):
+    _fields_ = [
+        ("return_value", _UniffiRustBuffer),
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_RUST_BUFFER = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructRustBuffer,
+)
+class _UniffiForeignFutureStructVoid(ctypes.Structure):
+    _fields_ = [
+        ("call_status", _UniffiRustCallStatus),
+    ]
+_UNIFFI_FOREIGN_FUTURE_COMPLETE_VOID = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructVoid,
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_down_payment_plan.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_down_payment_plan.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_payment_plan.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_payment_plan.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_disbursement_date_range.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_disbursement_date_range.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_get_non_business_days_between.argtypes = (
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_get_non_business_days_between.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_next_disbursement_date.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_payment_plan_uniffi_fn_func_next_disbursement_date.restype = _UniffiRustBuffer
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_alloc.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_alloc.restype = _UniffiRustBuffer
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_from_bytes.argtypes = (
+    _UniffiForeignBytes,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_from_bytes.restype = _UniffiRustBuffer
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_free.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_free.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_reserve.argtypes = (
+    _UniffiRustBuffer,
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_reserve.restype = _UniffiRustBuffer
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u8.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u8.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u8.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u8.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u8.restype = ctypes.c_uint8
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i8.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i8.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i8.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i8.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i8.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i8.restype = ctypes.c_int8
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u16.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u16.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u16.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u16.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u16.restype = ctypes.c_uint16
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i16.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i16.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i16.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i16.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i16.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i16.restype = ctypes.c_int16
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u32.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u32.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u32.restype = ctypes.c_uint32
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i32.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i32.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i32.restype = ctypes.c_int32
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u64.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_u64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_u64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_u64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u64.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_u64.restype = ctypes.c_uint64
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i64.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_i64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_i64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_i64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i64.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_i64.restype = ctypes.c_int64
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_f32.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_f32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_f32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_f32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_f32.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_f32.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_f32.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_f32.restype = ctypes.c_float
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_f64.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_f64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_f64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_f64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_f64.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_f64.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_f64.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_f64.restype = ctypes.c_double
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_pointer.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_pointer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_pointer.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_pointer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_pointer.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_pointer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_pointer.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_pointer.restype = ctypes.c_void_p
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_rust_buffer.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_rust_buffer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_rust_buffer.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_rust_buffer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_rust_buffer.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_rust_buffer.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_rust_buffer.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_rust_buffer.restype = _UniffiRustBuffer
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_void.argtypes = (
+    ctypes.c_uint64,
+    _UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK,
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_poll_void.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_void.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_cancel_void.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_void.argtypes = (
+    ctypes.c_uint64,
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_free_void.restype = None
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_void.argtypes = (
+    ctypes.c_uint64,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.ffi_payment_plan_uniffi_rust_future_complete_void.restype = None
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_calculate_down_payment_plan.argtypes = (
+)
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_calculate_down_payment_plan.restype = ctypes.c_uint16
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_calculate_payment_plan.argtypes = (
+)
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_calculate_payment_plan.restype = ctypes.c_uint16
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_disbursement_date_range.argtypes = (
+)
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_disbursement_date_range.restype = ctypes.c_uint16
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_get_non_business_days_between.argtypes = (
+)
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_get_non_business_days_between.restype = ctypes.c_uint16
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_next_disbursement_date.argtypes = (
+)
+_UniffiLib.uniffi_payment_plan_uniffi_checksum_func_next_disbursement_date.restype = ctypes.c_uint16
+_UniffiLib.ffi_payment_plan_uniffi_uniffi_contract_version.argtypes = (
+)
+_UniffiLib.ffi_payment_plan_uniffi_uniffi_contract_version.restype = ctypes.c_uint32
+
+_uniffi_check_contract_api_version(_UniffiLib)
+# _uniffi_check_api_checksums(_UniffiLib)
+
+# Public interface members begin here.
+
+
+class _UniffiConverterUInt16(_UniffiConverterPrimitiveInt):
+    CLASS_NAME = "u16"
+    VALUE_MIN = 0
+    VALUE_MAX = 2**16
+
+    @staticmethod
+    def read(buf):
+        return buf.read_u16()
+
+    @staticmethod
+    def write(value, buf):
+        buf.write_u16(value)
+
+class _UniffiConverterUInt32(_UniffiConverterPrimitiveInt):
+    CLASS_NAME = "u32"
+    VALUE_MIN = 0
+    VALUE_MAX = 2**32
+
+    @staticmethod
+    def read(buf):
+        return buf.read_u32()
+
+    @staticmethod
+    def write(value, buf):
+        buf.write_u32(value)
+
+class _UniffiConverterInt64(_UniffiConverterPrimitiveInt):
+    CLASS_NAME = "i64"
+    VALUE_MIN = -2**63
+    VALUE_MAX = 2**63
+
+    @staticmethod
+    def read(buf):
+        return buf.read_i64()
+
+    @staticmethod
+    def write(value, buf):
+        buf.write_i64(value)
+
+class _UniffiConverterDouble(_UniffiConverterPrimitiveFloat):
+    @staticmethod
+    def read(buf):
+        return buf.read_double()
+
+    @staticmethod
+    def write(value, buf):
+        buf.write_double(value)
+
+class _UniffiConverterBool:
+    @classmethod
+    def check_lower(cls, value):
+        return not not value
+
+    @classmethod
+    def lower(cls, value):
+        return 1 if value else 0
+
+    @staticmethod
+    def lift(value):
+        return value != 0
+
+    @classmethod
+    def read(cls, buf):
+        return cls.lift(buf.read_u8())
+
+    @classmethod
+    def write(cls, value, buf):
+        buf.write_u8(value)
+
+class _UniffiConverterString:
+    @staticmethod
+    def check_lower(value):
+        if not isinstance(value, str):
+            raise TypeError("argument must be str, not {}".format(type(value).__name__))
+        return value
+
+    @staticmethod
+    def read(buf):
+        size = buf.read_i32()
+        if size < 0:
+            raise InternalError("Unexpected negative string length")
+        utf8_bytes = buf.read(size)
+        return utf8_bytes.decode("utf-8")
+
+    @staticmethod
+    def write(value, buf):
+        utf8_bytes = value.encode("utf-8")
+        buf.write_i32(len(utf8_bytes))
+        buf.write(utf8_bytes)
+
+    @staticmethod
+    def lift(buf):
+        with buf.consume_with_stream() as stream:
+            return stream.read(stream.remaining()).decode("utf-8")
+
+    @staticmethod
+    def lower(value):
+        utf8_bytes = value.encode("utf-8")
+        with _UniffiRustBuffer.alloc_with_builder(len(utf8_bytes)) as builder:
+            builder.write(utf8_bytes)
+            return builder.finalize()
+
+# The Timestamp type.
+Timestamp = datetime.datetime
+
+# The Unix epoch, which timestamps are encoded relative to.
+_UNIFFI_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+class _UniffiTimestampMode(threading.local):
+    # When set, timestamps are decoded as integer nanoseconds since the epoch
+    # instead of datetimes.
+    raw = False
+
+_UNIFFI_TIMESTAMP_MODE = _UniffiTimestampMode()
+
+@contextlib.contextmanager
+def raw_timestamps():
+    """Context-manager that decodes timestamps as integer nanoseconds since the epoch.
+
+    This only affects values returned by calls made from the current thread while the
+    context is active; it is meant for callers that only order or serialize dates and
+    don't need `datetime` objects.
+    """
+    previous = _UNIFFI_TIMESTAMP_MODE.raw
+    _UNIFFI_TIMESTAMP_MODE.raw = True
+    try:
+        yield
+    finally:
+        _UNIFFI_TIMESTAMP_MODE.raw = previous
+
+class _UniffiValidationMode(threading.local):
+    # When set, params are only type-checked before being lowered; see `trusted_inputs`.
+    trusted = False
+
+_UNIFFI_VALIDATION_MODE = _UniffiValidationMode()
+
+@contextlib.contextmanager
+def trusted_inputs():
+    """Context-manager that skips the field by field validation of params.
+
+    Inside it, calls made from the current thread only check that params are of the
+    expected record type; field values are then checked as a whole while being encoded,
+    which raises ValueError (or TypeError for timestamps) for values that don't fit.
+    Meant for params coming from an already validated source; the `trusted=True` argument
+    of the calculation functions does the same for a single call.
+    """
+    previous = _UNIFFI_VALIDATION_MODE.trusted
+    _UNIFFI_VALIDATION_MODE.trusted = True
+    try:
+        yield
+    finally:
+        _UNIFFI_VALIDATION_MODE.trusted = previous
+
+def _uniffi_check_params(converter, params, trusted):
+    if trusted or _UNIFFI_VALIDATION_MODE.trusted:
+        converter.check_type(params)
+    else:
+        converter.check_lower(params)
+
+# There is a loss of precision when converting from Rust timestamps,
+# which are accurate to the nanosecond,
+# to Python datetimes, which are accurate to the microsecond.
+class _UniffiConverterTimestamp(_UniffiConverterRustBuffer):
+    FORMAT = "qI"
+    _STRUCT = struct.Struct(">" + FORMAT)
+
+    @staticmethod
+    def read(buf):
+        seconds, nanoseconds = buf.read_struct(_UniffiConverterTimestamp._STRUCT)
+        return _UniffiConverterTimestamp.read_parts(buf, seconds, nanoseconds)
+
+    @staticmethod
+    def read_parts(buf, seconds, nanoseconds):
+        """Like `from_parts`, but shares one instance per distinct value read from `buf`.
+
+        Plans repeat the same handful of dates many times over, so interning them for the
+        duration of a decode avoids holding a separate datetime for every occurrence.
+        Decoded datetimes all use the `timezone.utc` singleton, so tz objects are shared too.
+        """
+        key = (seconds, nanoseconds)
+        try:
+            return buf.timestamps[key]
+        except KeyError:
+            value = buf.timestamps[key] = _UniffiConverterTimestamp.from_parts(seconds, nanoseconds)
+            return value
+
+    @staticmethod
+    def from_parts(seconds, nanoseconds):
+        """Build the datetime for a `(seconds, nanoseconds)` pair read off the wire.
+
+        A negative `seconds` means the whole value, nanoseconds included, lies before the epoch.
+        """
+        if _UNIFFI_TIMESTAMP_MODE.raw:
+            if seconds >= 0:
+                return seconds * 1_000_000_000 + nanoseconds
+            return seconds * 1_000_000_000 - nanoseconds
+
+        # Round to the nearest microsecond, ties to even, like timedelta does.
+        microseconds, remainder = divmod(nanoseconds, 1000)
+        if remainder > 500 or (remainder == 500 and microseconds & 1):
+            microseconds += 1
+        # Add a timedelta to the epoch rather than using fromtimestamp(), so that we
+        # get OverflowError rather than ValueError when seconds is too large.
+        if seconds >= 0:
+            return _UNIFFI_EPOCH + datetime.timedelta(0, seconds, microseconds)
+        else:
+            return _UNIFFI_EPOCH - datetime.timedelta(0, -seconds, microseconds)
+
+    @staticmethod
+    def check_lower(value):
+        pass
+
+    @staticmethod
+    def split(value):
+        """Return the `(seconds, nanoseconds)` pair that `value` is written as."""
+        delta = value - _UNIFFI_EPOCH
+        if delta.days >= 0:
+            return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+        delta = -delta
+        return -(delta.days * 86400 + delta.seconds), delta.microseconds * 1000
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTimestamp._STRUCT.size
+
+    @staticmethod
+    def write(value, buf):
+        seconds, nanoseconds = _UniffiConverterTimestamp.split(value)
+        buf.write_i64(seconds)
+        buf.write_u32(nanoseconds)
+
+
+class InternalDownPaymentParams:
+    __slots__ = (
+        "params",
+        "requested_amount",
+        "min_installment_amount",
+        "first_payment_date",
+        "installments",
+    )
+    params: "InternalParams"
+    requested_amount: "float"
+    min_installment_amount: "float"
+    first_payment_date: "Timestamp"
+    installments: "int"
+    def __init__(self, *, params: "InternalParams", requested_amount: "float", min_installment_amount: "float", first_payment_date: "Timestamp", installments: "int"):
+        self.params = params
+        self.requested_amount = requested_amount
+        self.min_installment_amount = min_installment_amount
+        self.first_payment_date = first_payment_date
+        self.installments = installments
+
+    def __str__(self):
+        return "InternalDownPaymentParams(params={}, requested_amount={}, min_installment_amount={}, first_payment_date={}, installments={})".format(self.params, self.requested_amount, self.min_installment_amount, self.first_payment_date, self.installments)
+
+    def __eq__(self, other):
+        if self.params != other.params:
+            return False
+        if self.requested_amount != other.requested_amount:
+            return False
+        if self.min_installment_amount != other.min_installment_amount:
+            return False
+        if self.first_payment_date != other.first_payment_date:
+            return False
+        if self.installments != other.installments:
+            return False
+        return True
+
+    def key(self):
+        """Tuple of the fields compared by `__eq__`, with timestamps normalized to their wire value."""
+        return (
+            self.params.key(),
+            self.requested_amount,
+            self.min_installment_amount,
+            _UniffiConverterTimestamp.split(self.first_payment_date),
+            self.installments,
+        )
+
+    def freeze(self):
+        """Return an immutable, hashable copy of these params, with `params` frozen as well."""
+        return FrozenInternalDownPaymentParams(**{name: getattr(self, name) for name in InternalDownPaymentParams.__slots__})
+
+class FrozenInternalDownPaymentParams(InternalDownPaymentParams):
+    """Immutable `InternalDownPaymentParams` that hashes on `key()`; see `InternalDownPaymentParams.freeze`."""
+    __slots__ = ("_hash",)
+
+    def __init__(self, *, params: "InternalParams", **kwargs):
+        super().__init__(params=params.freeze(), **kwargs)
+        object.__setattr__(self, "_hash", hash(self.key()))
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_hash"):
+            raise AttributeError("{} is immutable".format(type(self).__name__))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (_uniffi_build_record, (type(self), {name: getattr(self, name) for name in InternalDownPaymentParams.__slots__}))
+
+    def freeze(self):
+        return self
+
+class _UniffiConverterTypeInternalDownPaymentParams(_UniffiConverterRustBuffer):
+    # The nested params come first, followed by the fixed-width down payment fields.
+    FORMAT = "ddqII"
+
+    @staticmethod
+    def read(buf):
+        return InternalDownPaymentParams(
+            params=_UniffiConverterTypeInternalParams.read(buf),
+            requested_amount=_UniffiConverterDouble.read(buf),
+            min_installment_amount=_UniffiConverterDouble.read(buf),
+            first_payment_date=_UniffiConverterTimestamp.read(buf),
+            installments=_UniffiConverterUInt32.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterTypeInternalParams.check_lower(value.params)
+        _UniffiConverterDouble.check_lower(value.requested_amount)
+        _UniffiConverterDouble.check_lower(value.min_installment_amount)
+        _UniffiConverterTimestamp.check_lower(value.first_payment_date)
+        _UniffiConverterUInt32.check_lower(value.installments)
+
+    @staticmethod
+    def check_type(value):
+        if not isinstance(value, InternalDownPaymentParams):
+            raise TypeError("expected InternalDownPaymentParams, not {}".format(type(value).__name__))
+        _UniffiConverterTypeInternalParams.check_type(value.params)
+
+    @staticmethod
+    def pack_values(value):
+        first_payment_seconds, first_payment_nanoseconds = _UniffiConverterTimestamp.split(value.first_payment_date)
+        return _UniffiConverterTypeInternalParams.pack_values(value.params) + (
+            value.requested_amount,
+            value.min_installment_amount,
+            first_payment_seconds,
+            first_payment_nanoseconds,
+            value.installments,
+        )
+
+    @staticmethod
+    def record_struct(value):
+        return _UniffiConverterTypeInternalDownPaymentParams._STRUCTS[value.params.min_installments is not None]
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalDownPaymentParams.record_struct(value).size
+
+    @classmethod
+    def lower(cls, value):
+        return _UniffiRustBuffer.alloc_from_struct(cls.record_struct(value), cls.pack_values(value))
+
+    @staticmethod
+    def write(value, buf):
+        record_struct = _UniffiConverterTypeInternalDownPaymentParams.record_struct(value)
+        buf.write(record_struct.pack(*_UniffiConverterTypeInternalDownPaymentParams.pack_values(value)))
+
+
+class InternalDownPaymentResponse:
+    __slots__ = (
+        "installment_amount",
+        "total_amount",
+        "installment_quantity",
+        "first_payment_date",
+        "plans",
+    )
+    installment_amount: "float"
+    total_amount: "float"
+    installment_quantity: "int"
+    first_payment_date: "Timestamp"
+    plans: "typing.List[InternalResponse]"
+    def __init__(self, *, installment_amount: "float", total_amount: "float", installment_quantity: "int", first_payment_date: "Timestamp", plans: "typing.List[InternalResponse]"):
+        self.installment_amount = installment_amount
+        self.total_amount = total_amount
+        self.installment_quantity = installment_quantity
+        self.first_payment_date = first_payment_date
+        self.plans = plans
+
+    def __str__(self):
+        return "InternalDownPaymentResponse(installment_amount={}, total_amount={}, installment_quantity={}, first_payment_date={}, plans={})".format(self.installment_amount, self.total_amount, self.installment_quantity, self.first_payment_date, self.plans)
+
+    def __eq__(self, other):
+        if self.installment_amount != other.installment_amount:
+            return False
+        if self.total_amount != other.total_amount:
+            return False
+        if self.installment_quantity != other.installment_quantity:
+            return False
+        if self.first_payment_date != other.first_payment_date:
+            return False
+        if self.plans != other.plans:
+            return False
+        return True
+
+class _UniffiConverterTypeInternalDownPaymentResponse(_UniffiConverterRustBuffer):
+    # Fixed-width fields preceding the `plans` sequence.
+    _HEAD = struct.Struct(">ddIqI")
+
+    @staticmethod
+    def read(buf):
+        head = buf.read_struct(_UniffiConverterTypeInternalDownPaymentResponse._HEAD)
+        return InternalDownPaymentResponse(
+            installment_amount=head[0],
+            total_amount=head[1],
+            installment_quantity=head[2],
+            first_payment_date=_UniffiConverterTimestamp.read_parts(buf, head[3], head[4]),
+            plans=_UniffiConverterSequenceTypeInternalResponse.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterDouble.check_lower(value.installment_amount)
+        _UniffiConverterDouble.check_lower(value.total_amount)
+        _UniffiConverterUInt32.check_lower(value.installment_quantity)
+        _UniffiConverterTimestamp.check_lower(value.first_payment_date)
+        _UniffiConverterSequenceTypeInternalResponse.check_lower(value.plans)
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalDownPaymentResponse._HEAD.size + _UniffiConverterSequenceTypeInternalResponse.encoded_size(value.plans)
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterDouble.write(value.installment_amount, buf)
+        _UniffiConverterDouble.write(value.total_amount, buf)
+        _UniffiConverterUInt32.write(value.installment_quantity, buf)
+        _UniffiConverterTimestamp.write(value.first_payment_date, buf)
+        _UniffiConverterSequenceTypeInternalResponse.write(value.plans, buf)
+
+
+class InternalInvoice:
+    __slots__ = (
+        "accumulated_days",
+        "factor",
+        "accumulated_factor",
+        "main_iof_tac",
+        "debit_service",
+        "due_date",
+    )
+    accumulated_days: "int"
+    factor: "float"
+    accumulated_factor: "float"
+    main_iof_tac: "float"
+    debit_service: "float"
+    due_date: "Timestamp"
+    def __init__(self, *, accumulated_days: "int", factor: "float", accumulated_factor: "float", main_iof_tac: "float", debit_service: "float", due_date: "Timestamp"):
+        self.accumulated_days = accumulated_days
+        self.factor = factor
+        self.accumulated_factor = accumulated_factor
+        self.main_iof_tac = main_iof_tac
+        self.debit_service = debit_service
+        self.due_date = due_date
+
+    def __str__(self):
+        return "InternalInvoice(accumulated_days={}, factor={}, accumulated_factor={}, main_iof_tac={}, debit_service={}, due_date={})".format(self.accumulated_days, self.factor, self.accumulated_factor, self.main_iof_tac, self.debit_service, self.due_date)
+
+    def __eq__(self, other):
+        if self.accumulated_days != other.accumulated_days:
+            return False
+        if self.factor != other.factor:
+            return False
+        if self.accumulated_factor != other.accumulated_factor:
+            return False
+        if self.main_iof_tac != other.main_iof_tac:
+            return False
+        if self.debit_service != other.debit_service:
+            return False
+        if self.due_date != other.due_date:
+            return False
+        return True
+
+class _UniffiConverterTypeInternalInvoice(_UniffiConverterRustBuffer):
+    # Invoices are entirely fixed-width, so sequences of them are unpacked in bulk.
+    _STRUCT = struct.Struct(">qddddqI")
+
+    @staticmethod
+    def read(buf):
+        return _UniffiConverterTypeInternalInvoice.from_values(buf, buf.read_struct(_UniffiConverterTypeInternalInvoice._STRUCT))
+
+    @staticmethod
+    def from_values(buf, values):
+        return InternalInvoice(
+            accumulated_days=values[0],
+            factor=values[1],
+            accumulated_factor=values[2],
+            main_iof_tac=values[3],
+            debit_service=values[4],
+            due_date=_UniffiConverterTimestamp.read_parts(buf, values[5], values[6]),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterInt64.check_lower(value.accumulated_days)
+        _UniffiConverterDouble.check_lower(value.factor)
+        _UniffiConverterDouble.check_lower(value.accumulated_factor)
+        _UniffiConverterDouble.check_lower(value.main_iof_tac)
+        _UniffiConverterDouble.check_lower(value.debit_service)
+        _UniffiConverterTimestamp.check_lower(value.due_date)
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalInvoice._STRUCT.size
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterInt64.write(value.accumulated_days, buf)
+        _UniffiConverterDouble.write(value.factor, buf)
+        _UniffiConverterDouble.write(value.accumulated_factor, buf)
+        _UniffiConverterDouble.write(value.main_iof_tac, buf)
+        _UniffiConverterDouble.write(value.debit_service, buf)
+        _UniffiConverterTimestamp.write(value.due_date, buf)
+
+
+class InternalParams:
+    __slots__ = (
+        "requested_amount",
+        "first_payment_date",
+        "disbursement_date",
+        "installments",
+        "debit_service_percentage",
+        "mdr",
+        "tac_percentage",
+        "iof_overall",
+        "iof_percentage",
+        "interest_rate",
+        "min_installment_amount",
+        "max_total_amount",
+        "disbursement_only_on_business_days",
+        "min_installments",
+    )
+    requested_amount: "float"
+    first_payment_date: "Timestamp"
+    disbursement_date: "Timestamp"
+    installments: "int"
+    debit_service_percentage: "int"
+    mdr: "float"
+    tac_percentage: "float"
+    iof_overall: "float"
+    iof_percentage: "float"
+    interest_rate: "float"
+    min_installment_amount: "float"
+    max_total_amount: "float"
+    disbursement_only_on_business_days: "bool"
+    min_installments: "typing.Optional[int]"
+    def __init__(self, *, requested_amount: "float", first_payment_date: "Timestamp", disbursement_date: "Timestamp", installments: "int", debit_service_percentage: "int", mdr: "float", tac_percentage: "float", iof_overall: "float", iof_percentage: "float", interest_rate: "float", min_installment_amount: "float", max_total_amount: "float", disbursement_only_on_business_days: "bool", min_installments: "typing.Optional[int]"):
+        self.requested_amount = requested_amount
+        self.first_payment_date = first_payment_date
+        self.disbursement_date = disbursement_date
+        self.installments = installments
+        self.debit_service_percentage = debit_service_percentage
+        self.mdr = mdr
+        self.tac_percentage = tac_percentage
+        self.iof_overall = iof_overall
+        self.iof_percentage = iof_percentage
+        self.interest_rate = interest_rate
+        self.min_installment_amount = min_installment_amount
+        self.max_total_amount = max_total_amount
+        self.disbursement_only_on_business_days = disbursement_only_on_business_days
+        self.min_installments = min_installments
+
+    def __str__(self):
+        return "InternalParams(requested_amount={}, first_payment_date={}, disbursement_date={}, installments={}, debit_service_percentage={}, mdr={}, tac_percentage={}, iof_overall={}, iof_percentage={}, interest_rate={}, min_installment_amount={}, max_total_amount={}, disbursement_only_on_business_days={}, min_installments={})".format(self.requested_amount, self.first_payment_date, self.disbursement_date, self.installments, self.debit_service_percentage, self.mdr, self.tac_percentage, self.iof_overall, self.iof_percentage, self.interest_rate, self.min_installment_amount, self.max_total_amount, self.disbursement_only_on_business_days, self.min_installments)
+
+    def __eq__(self, other):
+        if self.requested_amount != other.requested_amount:
+            return False
+        if self.first_payment_date != other.first_payment_date:
+            return False
+        if self.disbursement_date != other.disbursement_date:
+            return False
+        if self.installments != other.installments:
+            return False
+        if self.debit_service_percentage != other.debit_service_percentage:
+            return False
+        if self.mdr != other.mdr:
+            return False
+        if self.tac_percentage != other.tac_percentage:
+            return False
+        if self.iof_overall != other.iof_overall:
+            return False
+        if self.iof_percentage != other.iof_percentage:
+            return False
+        if self.interest_rate != other.interest_rate:
+            return False
+        if self.min_installment_amount != other.min_installment_amount:
+            return False
+        if self.max_total_amount != other.max_total_amount:
+            return False
+        if self.disbursement_only_on_business_days != other.disbursement_only_on_business_days:
+            return False
+        if self.min_installments != other.min_installments:
+            return False
+        return True
+
+    def key(self):
+        """Tuple of the fields compared by `__eq__`, with timestamps normalized to their wire value."""
+        return (
+            self.requested_amount,
+            _UniffiConverterTimestamp.split(self.first_payment_date),
+            _UniffiConverterTimestamp.split(self.disbursement_date),
+            self.installments,
+            self.debit_service_percentage,
+            self.mdr,
+            self.tac_percentage,
+            self.iof_overall,
+            self.iof_percentage,
+            self.interest_rate,
+            self.min_installment_amount,
+            self.max_total_amount,
+            self.disbursement_only_on_business_days,
+            self.min_installments,
+        )
+
+    def freeze(self):
+        """Return an immutable, hashable copy of these params, suitable as a cache key."""
+        return FrozenInternalParams(**{name: getattr(self, name) for name in InternalParams.__slots__})
+
+class FrozenInternalParams(InternalParams):
+    """Immutable `InternalParams` that hashes on `key()`; see `InternalParams.freeze`."""
+    __slots__ = ("_hash",)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_hash", hash(self.key()))
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_hash"):
+            raise AttributeError("{} is immutable".format(type(self).__name__))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (_uniffi_build_record, (type(self), {name: getattr(self, name) for name in InternalParams.__slots__}))
+
+    def freeze(self):
+        return self
+
+class _UniffiConverterTypeInternalParams(_UniffiConverterRustBuffer):
+    # Every field but the trailing `Option<u32>` has a fixed width, so the record is
+    # packed in one go with the layout matching the presence of `min_installments`.
+    FORMAT = "dqIqIIHdddddddB"
+    MIN_INSTALLMENTS_FORMATS = ("B", "BI")
+    _STRUCTS = (
+        struct.Struct(">" + FORMAT + MIN_INSTALLMENTS_FORMATS[0]),
+        struct.Struct(">" + FORMAT + MIN_INSTALLMENTS_FORMATS[1]),
+    )
+
+    @staticmethod
+    def read(buf):
+        return InternalParams(
+            requested_amount=_UniffiConverterDouble.read(buf),
+            first_payment_date=_UniffiConverterTimestamp.read(buf),
+            disbursement_date=_UniffiConverterTimestamp.read(buf),
+            installments=_UniffiConverterUInt32.read(buf),
+            debit_service_percentage=_UniffiConverterUInt16.read(buf),
+            mdr=_UniffiConverterDouble.read(buf),
+            tac_percentage=_UniffiConverterDouble.read(buf),
+            iof_overall=_UniffiConverterDouble.read(buf),
+            iof_percentage=_UniffiConverterDouble.read(buf),
+            interest_rate=_UniffiConverterDouble.read(buf),
+            min_installment_amount=_UniffiConverterDouble.read(buf),
+            max_total_amount=_UniffiConverterDouble.read(buf),
+            disbursement_only_on_business_days=_UniffiConverterBool.read(buf),
+            min_installments=_UniffiConverterOptionalUInt32.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterDouble.check_lower(value.requested_amount)
+        _UniffiConverterTimestamp.check_lower(value.first_payment_date)
+        _UniffiConverterTimestamp.check_lower(value.disbursement_date)
+        _UniffiConverterUInt32.check_lower(value.installments)
+        _UniffiConverterUInt16.check_lower(value.debit_service_percentage)
+        _UniffiConverterDouble.check_lower(value.mdr)
+        _UniffiConverterDouble.check_lower(value.tac_percentage)
+        _UniffiConverterDouble.check_lower(value.iof_overall)
+        _UniffiConverterDouble.check_lower(value.iof_percentage)
+        _UniffiConverterDouble.check_lower(value.interest_rate)
+        _UniffiConverterDouble.check_lower(value.min_installment_amount)
+        _UniffiConverterDouble.check_lower(value.max_total_amount)
+        _UniffiConverterBool.check_lower(value.disbursement_only_on_business_days)
+        _UniffiConverterOptionalUInt32.check_lower(value.min_installments)
+
+    @staticmethod
+    def check_type(value):
+        if not isinstance(value, InternalParams):
+            raise TypeError("expected InternalParams, not {}".format(type(value).__name__))
+
+    @staticmethod
+    def pack_values(value):
+        first_payment_seconds, first_payment_nanoseconds = _UniffiConverterTimestamp.split(value.first_payment_date)
+        disbursement_seconds, disbursement_nanoseconds = _UniffiConverterTimestamp.split(value.disbursement_date)
+        values = (
+            value.requested_amount,
+            first_payment_seconds,
+            first_payment_nanoseconds,
+            disbursement_seconds,
+            disbursement_nanoseconds,
+            value.installments,
+            value.debit_service_percentage,
+            value.mdr,
+            value.tac_percentage,
+            value.iof_overall,
+            value.iof_percentage,
+            value.interest_rate,
+            value.min_installment_amount,
+            value.max_total_amount,
+            value.disbursement_only_on_business_days,
+        )
+        if value.min_installments is None:
+            return values + (0,)
+        return values + (1, value.min_installments)
+
+    @staticmethod
+    def record_struct(value):
+        return _UniffiConverterTypeInternalParams._STRUCTS[value.min_installments is not None]
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalParams.record_struct(value).size
+
+    @classmethod
+    def lower(cls, value):
+        return _UniffiRustBuffer.alloc_from_struct(cls.record_struct(value), cls.pack_values(value))
+
+    @staticmethod
+    def write(value, buf):
+        record_struct = _UniffiConverterTypeInternalParams.record_struct(value)
+        buf.write(record_struct.pack(*_UniffiConverterTypeInternalParams.pack_values(value)))
+
+_UniffiConverterTypeInternalDownPaymentParams._STRUCTS = tuple(
+    struct.Struct(">" + _UniffiConverterTypeInternalParams.FORMAT + tail + _UniffiConverterTypeInternalDownPaymentParams.FORMAT)
+    for tail in _UniffiConverterTypeInternalParams.MIN_INSTALLMENTS_FORMATS
+)
+
+
+class InternalResponse:
+    __slots__ = (
+        "installment",
+        "due_date",
+        "disbursement_date",
+        "accumulated_days",
+        "days_index",
+        "accumulated_days_index",
+        "interest_rate",
+        "installment_amount",
+        "installment_amount_without_tac",
+        "total_amount",
+        "debit_service",
+        "customer_debit_service_amount",
+        "customer_amount",
+        "calculation_basis_for_effective_interest_rate",
+        "merchant_debit_service_amount",
+        "merchant_total_amount",
+        "settled_to_merchant",
+        "mdr_amount",
+        "effective_interest_rate",
+        "total_effective_cost",
+        "eir_yearly",
+        "tec_yearly",
+        "eir_monthly",
+        "tec_monthly",
+        "total_iof",
+        "contract_amount",
+        "contract_amount_without_tac",
+        "tac_amount",
+        "iof_percentage",
+        "overall_iof",
+        "pre_disbursement_amount",
+        "paid_total_iof",
+        "paid_contract_amount",
+        "invoices",
+    )
+    installment: "int"
+    due_date: "Timestamp"
+    disbursement_date: "Timestamp"
+    accumulated_days: "int"
+    days_index: "float"
+    accumulated_days_index: "float"
+    interest_rate: "float"
+    installment_amount: "float"
+    installment_amount_without_tac: "float"
+    total_amount: "float"
+    debit_service: "float"
+    customer_debit_service_amount: "float"
+    customer_amount: "float"
+    calculation_basis_for_effective_interest_rate: "float"
+    merchant_debit_service_amount: "float"
+    merchant_total_amount: "float"
+    settled_to_merchant: "float"
+    mdr_amount: "float"
+    effective_interest_rate: "float"
+    total_effective_cost: "float"
+    eir_yearly: "float"
+    tec_yearly: "float"
+    eir_monthly: "float"
+    tec_monthly: "float"
+    total_iof: "float"
+    contract_amount: "float"
+    contract_amount_without_tac: "float"
+    tac_amount: "float"
+    iof_percentage: "float"
+    overall_iof: "float"
+    pre_disbursement_amount: "float"
+    paid_total_iof: "float"
+    paid_contract_amount: "float"
+    invoices: "typing.List[InternalInvoice]"
+    def __init__(self, *, installment: "int", due_date: "Timestamp", disbursement_date: "Timestamp", accumulated_days: "int", days_index: "float", accumulated_days_index: "float", interest_rate: "float", installment_amount: "float", installment_amount_without_tac: "float", total_amount: "float", debit_service: "float", customer_debit_service_amount: "float", customer_amount: "float", calculation_basis_for_effective_interest_rate: "float", merchant_debit_service_amount: "float", merchant_total_amount: "float", settled_to_merchant: "float", mdr_amount: "float", effective_interest_rate: "float", total_effective_cost: "float", eir_yearly: "float", tec_yearly: "float", eir_monthly: "float", tec_monthly: "float", total_iof: "float", contract_amount: "float", contract_amount_without_tac: "float", tac_amount: "float", iof_percentage: "float", overall_iof: "float", pre_disbursement_amount: "float", paid_total_iof: "float", paid_contract_amount: "float", invoices: "typing.List[InternalInvoice]"):
+        self.installment = installment
+        self.due_date = due_date
+        self.disbursement_date = disbursement_date
+        self.accumulated_days = accumulated_days
+        self.days_index = days_index
+        self.accumulated_days_index = accumulated_days_index
+        self.interest_rate = interest_rate
+        self.installment_amount = installment_amount
+        self.installment_amount_without_tac = installment_amount_without_tac
+        self.total_amount = total_amount
+        self.debit_service = debit_service
+        self.customer_debit_service_amount = customer_debit_service_amount
+        self.customer_amount = customer_amount
+        self.calculation_basis_for_effective_interest_rate = calculation_basis_for_effective_interest_rate
+        self.merchant_debit_service_amount = merchant_debit_service_amount
+        self.merchant_total_amount = merchant_total_amount
+        self.settled_to_merchant = settled_to_merchant
+        self.mdr_amount = mdr_amount
+        self.effective_interest_rate = effective_interest_rate
+        self.total_effective_cost = total_effective_cost
+        self.eir_yearly = eir_yearly
+        self.tec_yearly = tec_yearly
+        self.eir_monthly = eir_monthly
+        self.tec_monthly = tec_monthly
+        self.total_iof = total_iof
+        self.contract_amount = contract_amount
+        self.contract_amount_without_tac = contract_amount_without_tac
+        self.tac_amount = tac_amount
+        self.iof_percentage = iof_percentage
+        self.overall_iof = overall_iof
+        self.pre_disbursement_amount = pre_disbursement_amount
+        self.paid_total_iof = paid_total_iof
+        self.paid_contract_amount = paid_contract_amount
+        self.invoices = invoices
+
+    def __str__(self):
+        return "InternalResponse(installment={}, due_date={}, disbursement_date={}, accumulated_days={}, days_index={}, accumulated_days_index={}, interest_rate={}, installment_amount={}, installment_amount_without_tac={}, total_amount={}, debit_service={}, customer_debit_service_amount={}, customer_amount={}, calculation_basis_for_effective_interest_rate={}, merchant_debit_service_amount={}, merchant_total_amount={}, settled_to_merchant={}, mdr_amount={}, effective_interest_rate={}, total_effective_cost={}, eir_yearly={}, tec_yearly={}, eir_monthly={}, tec_monthly={}, total_iof={}, contract_amount={}, contract_amount_without_tac={}, tac_amount={}, iof_percentage={}, overall_iof={}, pre_disbursement_amount={}, paid_total_iof={}, paid_contract_amount={}, invoices={})".format(self.installment, self.due_date, self.disbursement_date, self.accumulated_days, self.days_index, self.accumulated_days_index, self.interest_rate, self.installment_amount, self.installment_amount_without_tac, self.total_amount, self.debit_service, self.customer_debit_service_amount, self.customer_amount, self.calculation_basis_for_effective_interest_rate, self.merchant_debit_service_amount, self.merchant_total_amount, self.settled_to_merchant, self.mdr_amount, self.effective_interest_rate, self.total_effective_cost, self.eir_yearly, self.tec_yearly, self.eir_monthly, self.tec_monthly, self.total_iof, self.contract_amount, self.contract_amount_without_tac, self.tac_amount, self.iof_percentage, self.overall_iof, self.pre_disbursement_amount, self.paid_total_iof, self.paid_contract_amount, self.invoices)
+
+    def __eq__(self, other):
+        if self.installment != other.installment:
+            return False
+        if self.due_date != other.due_date:
+            return False
+        if self.disbursement_date != other.disbursement_date:
+            return False
+        if self.accumulated_days != other.accumulated_days:
+            return False
+        if self.days_index != other.days_index:
+            return False
+        if self.accumulated_days_index != other.accumulated_days_index:
+            return False
+        if self.interest_rate != other.interest_rate:
+            return False
+        if self.installment_amount != other.installment_amount:
+            return False
+        if self.installment_amount_without_tac != other.installment_amount_without_tac:
+            return False
+        if self.total_amount != other.total_amount:
+            return False
+        if self.debit_service != other.debit_service:
+            return False
+        if self.customer_debit_service_amount != other.customer_debit_service_amount:
+            return False
+        if self.customer_amount != other.customer_amount:
+            return False
+        if self.calculation_basis_for_effective_interest_rate != other.calculation_basis_for_effective_interest_rate:
+            return False
+        if self.merchant_debit_service_amount != other.merchant_debit_service_amount:
+            return False
+        if self.merchant_total_amount != other.merchant_total_amount:
+            return False
+        if self.settled_to_merchant != other.settled_to_merchant:
+            return False
+        if self.mdr_amount != other.mdr_amount:
+            return False
+        if self.effective_interest_rate != other.effective_interest_rate:
+            return False
+        if self.total_effective_cost != other.total_effective_cost:
+            return False
+        if self.eir_yearly != other.eir_yearly:
+            return False
+        if self.tec_yearly != other.tec_yearly:
+            return False
+        if self.eir_monthly != other.eir_monthly:
+            return False
+        if self.tec_monthly != other.tec_monthly:
+            return False
+        if self.total_iof != other.total_iof:
+            return False
+        if self.contract_amount != other.contract_amount:
+            return False
+        if self.contract_amount_without_tac != other.contract_amount_without_tac:
+            return False
+        if self.tac_amount != other.tac_amount:
+            return False
+        if self.iof_percentage != other.iof_percentage:
+            return False
+        if self.overall_iof != other.overall_iof:
+            return False
+        if self.pre_disbursement_amount != other.pre_disbursement_amount:
+            return False
+        if self.paid_total_iof != other.paid_total_iof:
+            return False
+        if self.paid_contract_amount != other.paid_contract_amount:
+            return False
+        if self.invoices != other.invoices:
+            return False
+        return True
+
+class _UniffiConverterTypeInternalResponse(_UniffiConverterRustBuffer):
+    # Fixed-width fields, up to and including the length prefix of `invoices`.
+    _HEAD = struct.Struct(">IqIqIq" + "d" * 29 + "i")
+
+    @staticmethod
+    def read(buf):
+        head = buf.read_struct(_UniffiConverterTypeInternalResponse._HEAD)
+        invoice_count = head[35]
+        if invoice_count < 0:
+            raise InternalError("Unexpected negative sequence length")
+        invoices = [
+            _UniffiConverterTypeInternalInvoice.from_values(buf, values)
+            for values in buf.read_records(_UniffiConverterTypeInternalInvoice._STRUCT, invoice_count)
+        ]
+        return InternalResponse(
+            installment=head[0],
+            due_date=_UniffiConverterTimestamp.read_parts(buf, head[1], head[2]),
+            disbursement_date=_UniffiConverterTimestamp.read_parts(buf, head[3], head[4]),
+            accumulated_days=head[5],
+            days_index=head[6],
+            accumulated_days_index=head[7],
+            interest_rate=head[8],
+            installment_amount=head[9],
+            installment_amount_without_tac=head[10],
+            total_amount=head[11],
+            debit_service=head[12],
+            customer_debit_service_amount=head[13],
+            customer_amount=head[14],
+            calculation_basis_for_effective_interest_rate=head[15],
+            merchant_debit_service_amount=head[16],
+            merchant_total_amount=head[17],
+            settled_to_merchant=head[18],
+            mdr_amount=head[19],
+            effective_interest_rate=head[20],
+            total_effective_cost=head[21],
+            eir_yearly=head[22],
+            tec_yearly=head[23],
+            eir_monthly=head[24],
+            tec_monthly=head[25],
+            total_iof=head[26],
+            contract_amount=head[27],
+            contract_amount_without_tac=head[28],
+            tac_amount=head[29],
+            iof_percentage=head[30],
+            overall_iof=head[31],
+            pre_disbursement_amount=head[32],
+            paid_total_iof=head[33],
+            paid_contract_amount=head[34],
+            invoices=invoices,
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterUInt32.check_lower(value.installment)
+        _UniffiConverterTimestamp.check_lower(value.due_date)
+        _UniffiConverterTimestamp.check_lower(value.disbursement_date)
+        _UniffiConverterInt64.check_lower(value.accumulated_days)
+        _UniffiConverterDouble.check_lower(value.days_index)
+        _UniffiConverterDouble.check_lower(value.accumulated_days_index)
+        _UniffiConverterDouble.check_lower(value.interest_rate)
+        _UniffiConverterDouble.check_lower(value.installment_amount)
+        _UniffiConverterDouble.check_lower(value.installment_amount_without_tac)
+        _UniffiConverterDouble.check_lower(value.total_amount)
+        _UniffiConverterDouble.check_lower(value.debit_service)
+        _UniffiConverterDouble.check_lower(value.customer_debit_service_amount)
+        _UniffiConverterDouble.check_lower(value.customer_amount)
+        _UniffiConverterDouble.check_lower(value.calculation_basis_for_effective_interest_rate)
+        _UniffiConverterDouble.check_lower(value.merchant_debit_service_amount)
+        _UniffiConverterDouble.check_lower(value.merchant_total_amount)
+        _UniffiConverterDouble.check_lower(value.settled_to_merchant)
+        _UniffiConverterDouble.check_lower(value.mdr_amount)
+        _UniffiConverterDouble.check_lower(value.effective_interest_rate)
+        _UniffiConverterDouble.check_lower(value.total_effective_cost)
+        _UniffiConverterDouble.check_lower(value.eir_yearly)
+        _UniffiConverterDouble.check_lower(value.tec_yearly)
+        _UniffiConverterDouble.check_lower(value.eir_monthly)
+        _UniffiConverterDouble.check_lower(value.tec_monthly)
+        _UniffiConverterDouble.check_lower(value.total_iof)
+        _UniffiConverterDouble.check_lower(value.contract_amount)
+        _UniffiConverterDouble.check_lower(value.contract_amount_without_tac)
+        _UniffiConverterDouble.check_lower(value.tac_amount)
+        _UniffiConverterDouble.check_lower(value.iof_percentage)
+        _UniffiConverterDouble.check_lower(value.overall_iof)
+        _UniffiConverterDouble.check_lower(value.pre_disbursement_amount)
+        _UniffiConverterDouble.check_lower(value.paid_total_iof)
+        _UniffiConverterDouble.check_lower(value.paid_contract_amount)
+        _UniffiConverterSequenceTypeInternalInvoice.check_lower(value.invoices)
+
+    @staticmethod
+    def encoded_size(value):
+        # The head ends with the length prefix of `invoices`.
+        return _UniffiConverterTypeInternalResponse._HEAD.size + _UniffiConverterTypeInternalInvoice._STRUCT.size * len(value.invoices)
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterUInt32.write(value.installment, buf)
+        _UniffiConverterTimestamp.write(value.due_date, buf)
+        _UniffiConverterTimestamp.write(value.disbursement_date, buf)
+        _UniffiConverterInt64.write(value.accumulated_days, buf)
+        _UniffiConverterDouble.write(value.days_index, buf)
+        _UniffiConverterDouble.write(value.accumulated_days_index, buf)
+        _UniffiConverterDouble.write(value.interest_rate, buf)
+        _UniffiConverterDouble.write(value.installment_amount, buf)
+        _UniffiConverterDouble.write(value.installment_amount_without_tac, buf)
+        _UniffiConverterDouble.write(value.total_amount, buf)
+        _UniffiConverterDouble.write(value.debit_service, buf)
+        _UniffiConverterDouble.write(value.customer_debit_service_amount, buf)
+        _UniffiConverterDouble.write(value.customer_amount, buf)
+        _UniffiConverterDouble.write(value.calculation_basis_for_effective_interest_rate, buf)
+        _UniffiConverterDouble.write(value.merchant_debit_service_amount, buf)
+        _UniffiConverterDouble.write(value.merchant_total_amount, buf)
+        _UniffiConverterDouble.write(value.settled_to_merchant, buf)
+        _UniffiConverterDouble.write(value.mdr_amount, buf)
+        _UniffiConverterDouble.write(value.effective_interest_rate, buf)
+        _UniffiConverterDouble.write(value.total_effective_cost, buf)
+        _UniffiConverterDouble.write(value.eir_yearly, buf)
+        _UniffiConverterDouble.write(value.tec_yearly, buf)
+        _UniffiConverterDouble.write(value.eir_monthly, buf)
+        _UniffiConverterDouble.write(value.tec_monthly, buf)
+        _UniffiConverterDouble.write(value.total_iof, buf)
+        _UniffiConverterDouble.write(value.contract_amount, buf)
+        _UniffiConverterDouble.write(value.contract_amount_without_tac, buf)
+        _UniffiConverterDouble.write(value.tac_amount, buf)
+        _UniffiConverterDouble.write(value.iof_percentage, buf)
+        _UniffiConverterDouble.write(value.overall_iof, buf)
+        _UniffiConverterDouble.write(value.pre_disbursement_amount, buf)
+        _UniffiConverterDouble.write(value.paid_total_iof, buf)
+        _UniffiConverterDouble.write(value.paid_contract_amount, buf)
+        _UniffiConverterSequenceTypeInternalInvoice.write(value.invoices, buf)
+
+
+# Error
+# We want to define each variant as a nested class that's also a subclass,
+# which is tricky in Python.  To accomplish this we're going to create each
+# class separately, then manually add the child classes to the base class's
+# __dict__.  All of this happens in dummy class to avoid polluting the module
+# namespace.
+class Error(Exception):
+    pass
+
+_UniffiTempError = Error
+
+class Error:  # type: ignore
+    class InvalidParams(_UniffiTempError):
+        def __init__(self):
+            pass
+
+        def __repr__(self):
+            return "Error.InvalidParams({})".format(str(self))
+    _UniffiTempError.InvalidParams = InvalidParams # type: ignore
+    class CalculationError(_UniffiTempError):
+        def __init__(self):
+            pass
+
+        def __repr__(self):
+            return "Error.CalculationError({})".format(str(self))
+    _UniffiTempError.CalculationError = CalculationError # type: ignore
+
+Error = _UniffiTempError # type: ignore
+del _UniffiTempError
+
+
+class _UniffiConverterTypeError(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        variant = buf.read_i32()
+        if variant == 1:
+            return Error.InvalidParams(
+            )
+        if variant == 2:
+            return Error.CalculationError(
+            )
+        raise InternalError("Raw enum value doesn't match any cases")
+
+    @staticmethod
+    def check_lower(value):
+        if isinstance(value, Error.InvalidParams):
+            return
+        if isinstance(value, Error.CalculationError):
+            return
+
+    @staticmethod
+    def write(value, buf):
+        if isinstance(value, Error.InvalidParams):
+            buf.write_i32(1)
+        if isinstance(value, Error.CalculationError):
+            buf.write_i32(2)
+
+
+
+class _UniffiConverterOptionalUInt32(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        if value is not None:
+            _UniffiConverterUInt32.check_lower(value)
+
+    @classmethod
+    def encoded_size(cls, value):
+        return 1 if value is None else 5
+
+    @classmethod
+    def write(cls, value, buf):
+        if value is None:
+            buf.write_u8(0)
+            return
+
+        buf.write_u8(1)
+        _UniffiConverterUInt32.write(value, buf)
+
+    @classmethod
+    def read(cls, buf):
+        flag = buf.read_u8()
+        if flag == 0:
+            return None
+        elif flag == 1:
+            return _UniffiConverterUInt32.read(buf)
+        else:
+            raise InternalError("Unexpected flag byte for optional type")
+
+
+
+class _UniffiConverterSequenceTimestamp(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterTimestamp.check_lower(item)
+
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTimestamp.encoded_size(item) for item in value)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterTimestamp.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterTimestamp.read_parts(buf, seconds, nanoseconds)
+            for seconds, nanoseconds in buf.read_records(_UniffiConverterTimestamp._STRUCT, count)
+        ]
+
+
+
+class _UniffiConverterSequenceTypeInternalDownPaymentResponse(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterTypeInternalDownPaymentResponse.check_lower(item)
+
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalDownPaymentResponse.encoded_size(item) for item in value)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterTypeInternalDownPaymentResponse.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterTypeInternalDownPaymentResponse.read(buf) for i in range(count)
+        ]
+
+
+
+class _UniffiConverterSequenceTypeInternalInvoice(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterTypeInternalInvoice.check_lower(item)
+
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalInvoice.encoded_size(item) for item in value)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterTypeInternalInvoice.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterTypeInternalInvoice.read(buf) for i in range(count)
+        ]
+
+
+
+class _UniffiConverterSequenceTypeInternalResponse(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterTypeInternalResponse.check_lower(item)
+
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalResponse.encoded_size(item) for item in value)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterTypeInternalResponse.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterTypeInternalResponse.read(buf) for i in range(count)
+        ]
+
+# Async support
+
+def calculate_down_payment_plan(params: "InternalDownPaymentParams") -> "typing.List[InternalDownPaymentResponse]":
+    _UniffiConverterTypeInternalDownPaymentParams.check_lower(params)
+    
+    return _UniffiConverterSequenceTypeInternalDownPaymentResponse.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeError,_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_down_payment_plan,
+        _UniffiConverterTypeInternalDownPaymentParams.lower(params)))
+
+
+def calculate_payment_plan(params: "InternalParams") -> "typing.List[InternalResponse]":
+    _UniffiConverterTypeInternalParams.check_lower(params)
+    
+    return _UniffiConverterSequenceTypeInternalResponse.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeError,_UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_payment_plan,
+        _UniffiConverterTypeInternalParams.lower(params)))
+
+
+def disbursement_date_range(base_date: "Timestamp",days: "int") -> "typing.List[Timestamp]":
+    _UniffiConverterTimestamp.check_lower(base_date)
+    
+    _UniffiConverterUInt32.check_lower(days)
+    
+    return _UniffiConverterSequenceTimestamp.lift(_uniffi_rust_call(_UniffiLib.uniffi_payment_plan_uniffi_fn_func_disbursement_date_range,
+        _UniffiConverterTimestamp.lower(base_date),
+        _UniffiConverterUInt32.lower(days)))
+
+
+def get_non_business_days_between(start_date: "Timestamp",end_date: "Timestamp") -> "typing.List[Timestamp]":
+    _UniffiConverterTimestamp.check_lower(start_date)
+    
+    _UniffiConverterTimestamp.check_lower(end_date)
+    
+    return _UniffiConverterSequenceTimestamp.lift(_uniffi_rust_call(_UniffiLib.uniffi_payment_plan_uniffi_fn_func_get_non_business_days_between,
+        _UniffiConverterTimestamp.lower(start_date),
+        _UniffiConverterTimestamp.lower(end_date)))
+
+
+def next_disbursement_date(base_date: "Timestamp") -> "Timestamp":
+    _UniffiConverterTimestamp.check_lower(base_date)
+    
+    return _UniffiConverterTimestamp.lift(_uniffi_rust_call(_UniffiLib.uniffi_payment_plan_uniffi_fn_func_next_disbursement_date,
+        _UniffiConverterTimestamp.lower(base_date)))
+
+
+__all__ = [
+    "InternalError",
+    "Error",
+    "InternalDownPaymentParams",
+    "InternalDownPaymentResponse",
+    "FrozenInternalDownPaymentParams",
+    "FrozenInternalParams",
+    "InternalInvoice",
+    "InternalParams",
+    "InternalResponse",
+    "calculate_down_payment_plan",
+    "calculate_payment_plan",
+    "disbursement_date_range",
+    "get_non_business_days_between",
+    "next_disbursement_date",
+    "BufferPoolStats",
+    "RustBufferAllocations",
+    "buffer_pool_stats",
+    "count_allocations",
+    "raw_timestamps",
+    "trusted_inputs",
+    "use_buffer_pool",
+]
+
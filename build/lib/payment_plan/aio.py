@@ -0,0 +1,206 @@
+"""
+asyncio versions of the payment plan functions.
+
+Each call runs on a dedicated thread pool so that the event loop is never blocked by a
+calculation. At most `max_concurrency` calls run at a time; further calls wait, without
+holding a thread, until one finishes. A waiting call can be cancelled like any other
+awaitable and is then never started. A call that has already started runs to completion
+even if the awaiting task is cancelled, and keeps its slot until it does.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+from . import (
+    DownPaymentParams,
+    DownPaymentResponse,
+    Params,
+    Response,
+    calculate_down_payment_plan as _calculate_down_payment_plan,
+    calculate_payment_plan as _calculate_payment_plan,
+    disbursement_date_range as _disbursement_date_range,
+    get_non_business_days_between as _get_non_business_days_between,
+    next_disbursement_date as _next_disbursement_date,
+)
+
+
+class _Limiter:
+    # Per event loop: asyncio primitives can't be shared across loops.
+
+    def __init__(self, max_concurrency, max_waiting):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_waiting = max_waiting
+        self.waiting = 0
+
+    async def acquire(self):
+        if self._semaphore.locked():
+            if self._max_waiting is not None and self.waiting >= self._max_waiting:
+                raise asyncio.QueueFull(
+                    "too many payment plan calls waiting to run ({})".format(self.waiting)
+                )
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+    def release(self):
+        self._semaphore.release()
+
+
+class _Runner:
+    def __init__(self, max_concurrency, max_waiting):
+        self.max_concurrency = max_concurrency
+        self.max_waiting = max_waiting
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="payment-plan-aio"
+        )
+        self._limiters = weakref.WeakKeyDictionary()
+        # Calls waiting or running, across event loops. A retired runner (see `configure`)
+        # shuts its executor down once the last of them is done.
+        self._active = 0
+        self._retired = False
+        self._lock = threading.Lock()
+
+    def limiter(self, loop):
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = _Limiter(
+                self.max_concurrency, self.max_waiting
+            )
+        return limiter
+
+    async def run(self, fn, *args):
+        if not self._enter():
+            # Retired and shut down between `_get_runner()` and here.
+            return await _get_runner().run(fn, *args)
+        loop = asyncio.get_running_loop()
+        limiter = self.limiter(loop)
+        try:
+            await limiter.acquire()
+        except BaseException:
+            self._leave()
+            raise
+        try:
+            future = loop.run_in_executor(self.executor, fn, *args)
+        except BaseException:
+            limiter.release()
+            self._leave()
+            raise
+
+        def done(finished):
+            # Only free the slot once the thread is done, even if the caller stopped waiting,
+            # and mark the outcome as retrieved in case nobody is left to await it.
+            limiter.release()
+            self._leave()
+            if not finished.cancelled():
+                finished.exception()
+
+        future.add_done_callback(done)
+        return await asyncio.shield(future)
+
+    def retire(self):
+        with self._lock:
+            self._retired = True
+            idle = not self._active
+        if idle:
+            self.executor.shutdown(wait=False)
+
+    def _enter(self):
+        with self._lock:
+            if self._retired and not self._active:
+                return False
+            self._active += 1
+            return True
+
+    def _leave(self):
+        with self._lock:
+            self._active -= 1
+            idle = self._retired and not self._active
+        if idle:
+            self.executor.shutdown(wait=False)
+
+
+_runner = None  # type: Optional[_Runner]
+_runner_lock = threading.Lock()
+
+
+def configure(
+    max_concurrency: Optional[int] = None, max_waiting: Optional[int] = None
+) -> None:
+    """
+    Sets the concurrency limits of the asyncio functions.
+
+    Calls that are already running or waiting keep the previous limits.
+
+    Args:
+        max_concurrency (Optional[int]): Maximum number of calls running at once; defaults to the number of CPUs.
+        max_waiting (Optional[int]): Maximum number of calls waiting for a free slot, per event loop,
+            or None for no limit. Calls beyond it raise asyncio.QueueFull instead of waiting.
+    """
+    global _runner
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if max_waiting is not None and max_waiting < 0:
+        raise ValueError("max_waiting must not be negative")
+    with _runner_lock:
+        previous, _runner = _runner, _Runner(max_concurrency, max_waiting)
+    if previous is not None:
+        previous.retire()
+
+
+def _get_runner():
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = _Runner(os.cpu_count() or 1, None)
+        return _runner
+
+
+async def calculate_payment_plan(params: Params) -> List[Response]:
+    """Awaitable `payment_plan.calculate_payment_plan`."""
+    return await _get_runner().run(_calculate_payment_plan, params)
+
+
+async def calculate_down_payment_plan(
+    params: DownPaymentParams,
+) -> List[DownPaymentResponse]:
+    """Awaitable `payment_plan.calculate_down_payment_plan`."""
+    return await _get_runner().run(_calculate_down_payment_plan, params)
+
+
+async def next_disbursement_date(base_date: datetime) -> datetime:
+    """Awaitable `payment_plan.next_disbursement_date`."""
+    return await _get_runner().run(_next_disbursement_date, base_date)
+
+
+async def disbursement_date_range(
+    base_date: datetime, days: int
+) -> Tuple[datetime, datetime]:
+    """Awaitable `payment_plan.disbursement_date_range`."""
+    return await _get_runner().run(_disbursement_date_range, base_date, days)
+
+
+async def get_non_business_days_between(
+    start_date: datetime, end_date: datetime
+) -> List[datetime]:
+    """Awaitable `payment_plan.get_non_business_days_between`."""
+    return await _get_runner().run(
+        _get_non_business_days_between, start_date, end_date
+    )
+
+
+__all__ = [
+    "configure",
+    "calculate_down_payment_plan",
+    "calculate_payment_plan",
+    "next_disbursement_date",
+    "disbursement_date_range",
+    "get_non_business_days_between",
+]
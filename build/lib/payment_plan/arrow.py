@@ -0,0 +1,226 @@
+"""
+Apache Arrow and Parquet export of batch payment plan calculations.
+
+Requires PyArrow and NumPy, which are optional dependencies
+(`pip install payment-plan-python-sdk[arrow]`).
+
+Results are streamed as two tables with fixed schemas:
+
+- plans (`PLANS_SCHEMA`): one row per plan, mirroring Response, plus `params_index`, the
+  position of the params in the input, and `invoice_count`;
+- invoices (`INVOICES_SCHEMA`): one row per invoice, mirroring Invoice, keyed to its plan by
+  `params_index` and `installment`.
+
+Encoded results are decoded straight into arrays (see `payment_plan.columnar`), without
+building Response objects, and only `batch_size` plans are held in memory at a time.
+"""
+
+import collections
+import os
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+from ._internal.payment_plan_uniffi import InternalParams as Params
+from .batch import _TASKS_PER_WORKER, _executor, _run_many
+from .columnar import (
+    INVOICE_DTYPE,
+    PLAN_DTYPE,
+    _Table,
+    _calculate_bytes,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "payment_plan.arrow requires PyArrow; install it with "
+        "`pip install payment-plan-python-sdk[arrow]`"
+    ) from e
+
+
+def _arrow_type(dtype):
+    if dtype.kind == "M":
+        return pa.timestamp("ns", tz="UTC")
+    return pa.from_numpy_dtype(dtype)
+
+
+PLANS_SCHEMA = pa.schema(
+    [
+        (name, _arrow_type(PLAN_DTYPE[name]))
+        for name in PLAN_DTYPE.names
+        if name != "invoice_start"
+    ]
+)
+
+INVOICES_SCHEMA = pa.schema(
+    [("params_index", pa.int64()), ("installment", pa.uint32())]
+    + [
+        (name, _arrow_type(INVOICE_DTYPE[name]))
+        for name in INVOICE_DTYPE.names
+        if name != "plan"
+    ]
+)
+
+
+class ExportSummary(NamedTuple):
+    """
+    Counters of a Parquet export.
+
+    Params that failed with `Error.InvalidParams`, `Error.CalculationError` or a validation
+    error (TypeError/ValueError) have no rows; their error is in `errors`, keyed by index.
+    """
+
+    params: int
+    plans: int
+    invoices: int
+    errors: Dict[int, Exception]
+
+
+def payment_plan_record_batches(
+    params_iterable: Iterable[Params],
+    batch_size: int = 65536,
+    max_workers: Optional[int] = None,
+    errors: Optional[Dict[int, Exception]] = None,
+) -> Iterator[Tuple["pa.RecordBatch", "pa.RecordBatch"]]:
+    """
+    Calculates the payment plans of many params into Arrow record batches.
+
+    Input is consumed lazily and calculated on the thread pool of
+    `payment_plan.calculate_payment_plan_many`.
+
+    Args:
+        params_iterable (Iterable[Params]): The params to calculate the payment plans for.
+        batch_size (int): Number of plans above which a pair of record batches is yielded.
+        max_workers (Optional[int]): Number of worker threads; defaults to the number of CPUs.
+        errors (Optional[Dict[int, Exception]]): Filled with the errors of the failed params, by index.
+
+    Returns:
+        Iterator[Tuple[pa.RecordBatch, pa.RecordBatch]]: Pairs of plans and invoices batches,
+            with `PLANS_SCHEMA` and `INVOICES_SCHEMA`.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if errors is None:
+        errors = {}
+    return _record_batches(
+        _executor(max_workers),
+        enumerate(params_iterable),
+        max_workers * _TASKS_PER_WORKER,
+        batch_size,
+        errors,
+    )
+
+
+def write_payment_plans_parquet(
+    params_iterable: Iterable[Params],
+    plans_path,
+    invoices_path=None,
+    batch_size: int = 65536,
+    max_workers: Optional[int] = None,
+    compression: str = "snappy",
+) -> ExportSummary:
+    """
+    Calculates the payment plans of many params and writes them to Parquet files.
+
+    Each pair of record batches is written as it is produced, so memory use is bounded by
+    `batch_size` no matter how many params are exported.
+
+    Args:
+        params_iterable (Iterable[Params]): The params to calculate the payment plans for.
+        plans_path: Path or file-like object of the plans Parquet file.
+        invoices_path: Path or file-like object of the invoices Parquet file, or None to skip invoices.
+        batch_size (int): Number of plans written per row group.
+        max_workers (Optional[int]): Number of worker threads; defaults to the number of CPUs.
+        compression (str): Parquet compression codec.
+
+    Returns:
+        ExportSummary: How many params, plans and invoices were exported, and the failed params.
+    """
+    errors = {}
+    counts = collections.Counter()
+
+    def counted(items):
+        for item in items:
+            counts["params"] += 1
+            yield item
+
+    batches = payment_plan_record_batches(counted(params_iterable), batch_size, max_workers, errors)
+    plans_writer = pq.ParquetWriter(plans_path, PLANS_SCHEMA, compression=compression)
+    try:
+        invoices_writer = None
+        if invoices_path is not None:
+            invoices_writer = pq.ParquetWriter(
+                invoices_path, INVOICES_SCHEMA, compression=compression
+            )
+        try:
+            for plans, invoices in batches:
+                plans_writer.write_batch(plans)
+                if invoices_writer is not None:
+                    invoices_writer.write_batch(invoices)
+                counts["plans"] += plans.num_rows
+                counts["invoices"] += invoices.num_rows
+        finally:
+            if invoices_writer is not None:
+                invoices_writer.close()
+    finally:
+        plans_writer.close()
+    return ExportSummary(
+        params=counts["params"],
+        plans=counts["plans"],
+        invoices=counts["invoices"],
+        errors=errors,
+    )
+
+
+def _record_batches(executor, items, window, batch_size, errors):
+    table = _Table(batch_size, batch_size)
+    for index, data, error in _run_many(executor, items, window, True, _calculate_bytes):
+        if error is not None:
+            errors[index] = error
+        else:
+            table.append(index, data)
+        if table.plan_count >= batch_size:
+            yield _to_record_batches(table)
+            table = _Table(batch_size, batch_size)
+    if table.plan_count:
+        yield _to_record_batches(table)
+
+
+def _to_record_batches(table):
+    plans, invoices = table.finish(as_columns=False)
+    plans_batch = pa.RecordBatch.from_arrays(
+        [_arrow_array(plans[field.name], field.type) for field in PLANS_SCHEMA],
+        schema=PLANS_SCHEMA,
+    )
+    keys = {
+        "params_index": plans["params_index"][invoices["plan"]],
+        "installment": plans["installment"][invoices["plan"]],
+    }
+    invoices_batch = pa.RecordBatch.from_arrays(
+        [
+            _arrow_array(
+                keys[field.name] if field.name in keys else invoices[field.name], field.type
+            )
+            for field in INVOICES_SCHEMA
+        ],
+        schema=INVOICES_SCHEMA,
+    )
+    return plans_batch, invoices_batch
+
+
+def _arrow_array(column, arrow_type):
+    if pa.types.is_timestamp(arrow_type):
+        column = column.view("int64")
+    return pa.array(column, type=arrow_type)
+
+
+__all__ = [
+    "ExportSummary",
+    "INVOICES_SCHEMA",
+    "PLANS_SCHEMA",
+    "payment_plan_record_batches",
+    "write_payment_plans_parquet",
+]
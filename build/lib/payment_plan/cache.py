@@ -0,0 +1,156 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, NamedTuple, Optional
+from . import (
+    DownPaymentParams,
+    DownPaymentResponse,
+    Params,
+    Response,
+    calculate_down_payment_plan,
+    calculate_payment_plan,
+)
+from ._internal.payment_plan_uniffi import _UNIFFI_TIMESTAMP_MODE
+
+
+class CacheStats(NamedTuple):
+    """Point-in-time counters of a `PaymentPlanCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class PaymentPlanCache:
+    """
+    Bounded LRU cache around `calculate_payment_plan` and `calculate_down_payment_plan`.
+
+    Results are keyed on the frozen form of the params (see `Params.freeze`), so params that
+    compare equal share an entry no matter how their timestamps are expressed.
+    Results decoded within `payment_plan.raw_timestamps()` are cached apart from the others.
+    Every call returns a fresh copy of the cached result, so callers are free to mutate it.
+    Failed calculations are not cached.
+
+    Args:
+        max_entries (Optional[int]): Maximum number of cached results, or None for no limit.
+        max_bytes (Optional[int]): Maximum estimated memory held by cached results, or None for no limit.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, Any]
+        self._sizes = {}  # type: dict[Hashable, int]
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def calculate_payment_plan(self, params: Params) -> List[Response]:
+        """Cached `payment_plan.calculate_payment_plan`."""
+        return self._get_or_calculate(
+            (Params, params.freeze(), _UNIFFI_TIMESTAMP_MODE.raw),
+            calculate_payment_plan,
+            params,
+        )
+
+    def calculate_down_payment_plan(
+        self, params: DownPaymentParams
+    ) -> List[DownPaymentResponse]:
+        """Cached `payment_plan.calculate_down_payment_plan`."""
+        return self._get_or_calculate(
+            (DownPaymentParams, params.freeze(), _UNIFFI_TIMESTAMP_MODE.raw),
+            calculate_down_payment_plan,
+            params,
+        )
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached result; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_or_calculate(self, key, calculate, params):
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _copy(result)
+
+        # Calculate outside the lock; concurrent misses on one key just store it twice.
+        result = calculate(params)
+        size = _estimate_size(result)
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._sizes[key]
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._size_bytes += size
+            self._evict()
+        return _copy(result)
+
+    def _evict(self):
+        # The entry just stored is never evicted, even when it alone exceeds max_bytes.
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._size_bytes > self.max_bytes)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self._size_bytes -= self._sizes.pop(key)
+            self._evictions += 1
+
+
+def _copy(value):
+    # Records and lists are copied; their leaf values (numbers, datetimes) are immutable.
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    slots = getattr(type(value), "__slots__", None)
+    if slots is None:
+        return value
+    copy = object.__new__(type(value))
+    for name in slots:
+        setattr(copy, name, _copy(getattr(value, name)))
+    return copy
+
+
+def _estimate_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, list):
+        return size + sum(_estimate_size(item) for item in value)
+    for name in getattr(type(value), "__slots__", ()):
+        size += _estimate_size(getattr(value, name))
+    return size
+
+
+__all__ = [
+    "CacheStats",
+    "PaymentPlanCache",
+]
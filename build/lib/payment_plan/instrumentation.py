@@ -0,0 +1,193 @@
+"""
+Per-call timing of the phases of the payment plan functions.
+
+Registered hooks are called after every call to `calculate_payment_plan`,
+`calculate_down_payment_plan`, `next_disbursement_date`, `disbursement_date_range` and
+`get_non_business_days_between` with a CallTiming, which splits the call into:
+
+- check: validation of the arguments (`check_lower`, or the type check of trusted inputs);
+- lower: encoding of the arguments into Rust buffers;
+- call: the Rust call itself;
+- lift: decoding of the result.
+
+Calls made through templates, batches and columnar results are reported under the function
+they stand for; calls made in the worker processes of a ProcessPoolEngine are not reported.
+
+While no hook is registered the functions run exactly as before, at the cost of a single
+global lookup per call. Hooks run on the calling thread; an exception raised by a hook is
+logged and doesn't affect the call.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+from ._internal import payment_plan_uniffi as _uniffi
+from .responses import LazyResponses, ResponseProjection
+
+_logger = logging.getLogger(__name__)
+
+
+class CallTiming(NamedTuple):
+    """
+    Phases of one call, in seconds.
+
+    A phase that raised is timed up to the error; the phases after it are None.
+    `plans` and `invoices` count the Response and Invoice records decoded by the call,
+    so invoices that were skipped (`include_invoices=False`) or not decoded yet (`lazy=True`)
+    are not counted. `params` is the params record of `calculate_payment_plan` and
+    `calculate_down_payment_plan` calls, and None for the other functions.
+    """
+
+    function: str
+    check_seconds: Optional[float]
+    lower_seconds: Optional[float]
+    call_seconds: Optional[float]
+    lift_seconds: Optional[float]
+    input_bytes: int
+    output_bytes: int
+    plans: int
+    invoices: int
+    error: Optional[BaseException]
+    params: Optional[object] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(
+            duration
+            for duration in (self.check_seconds, self.lower_seconds, self.call_seconds, self.lift_seconds)
+            if duration is not None
+        )
+
+
+Hook = Callable[[CallTiming], None]
+
+_hooks = []  # type: List[Hook]
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    """Register `hook` to be called with the CallTiming of every call."""
+    global _hooks
+    with _hooks_lock:
+        # Replaced rather than mutated, so that calls in flight keep a consistent list.
+        _hooks = _hooks + [hook]
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregister `hook`; timing stops once no hook is left."""
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = hooks
+
+
+class timing_hook:
+    """
+    Context manager registering a hook for the duration of a block.
+
+    Example:
+        with timing_hook(timings.append):
+            calculate_payment_plan(params)
+    """
+
+    def __init__(self, hook: Hook):
+        self.hook = hook
+
+    def __enter__(self):
+        add_hook(self.hook)
+        return self.hook
+
+    def __exit__(self, *exc_info):
+        remove_hook(self.hook)
+
+
+def _call(function, check, lower, call, params=None):
+    # Runs a call of `function` made of its phases: `check()` validates the arguments and
+    # returns the function lifting the result, `lower()` returns the lowered arguments and
+    # `call(*args)` makes the Rust call. While hooks are registered, each phase is timed and
+    # the hooks get the CallTiming; `params` is the params record of the call, if any.
+    hooks = _hooks
+    if not hooks:
+        lift = check()
+        return lift(call(*lower()))
+    clock = time.perf_counter
+    durations = [None, None, None, None]
+    input_bytes = output_bytes = 0
+    result = error = None
+    phase = 0
+    started = clock()
+    try:
+        lift = check()
+        now = clock()
+        durations[0], started, phase = now - started, now, 1
+        args = lower()
+        now = clock()
+        durations[1], started, phase = now - started, now, 2
+        input_bytes = sum(arg.len for arg in args if isinstance(arg, _uniffi._UniffiRustBuffer))
+        rbuf = call(*args)
+        now = clock()
+        durations[2], started, phase = now - started, now, 3
+        output_bytes = rbuf.len if isinstance(rbuf, _uniffi._UniffiRustBuffer) else 0
+        result = lift(rbuf)
+        durations[3] = clock() - started
+        return result
+    except BaseException as e:
+        durations[phase] = clock() - started
+        error = e
+        raise
+    finally:
+        _report(hooks, function, durations, input_bytes, output_bytes, result, error, params)
+
+
+def _report(hooks, function, durations, input_bytes, output_bytes, result, error, params):
+    plans, invoices = _count(result)
+    timing = CallTiming(
+        function,
+        durations[0],
+        durations[1],
+        durations[2],
+        durations[3],
+        input_bytes,
+        output_bytes,
+        plans,
+        invoices,
+        error,
+        params,
+    )
+    for hook in hooks:
+        try:
+            hook(timing)
+        except Exception:
+            _logger.exception("payment plan timing hook %r failed", hook)
+
+
+def _count(result):
+    # Number of (plans, invoices) records decoded into `result`.
+    if isinstance(result, LazyResponses):
+        return len(result), 0
+    if not isinstance(result, list):
+        return 0, 0
+    plans = invoices = 0
+    for item in result:
+        if isinstance(item, _uniffi.InternalDownPaymentResponse):
+            nested_plans, nested_invoices = _count(item.plans)
+            plans += nested_plans
+            invoices += nested_invoices
+        elif isinstance(item, _uniffi.InternalResponse):
+            plans += 1
+            invoices += len(item.invoices)
+        elif isinstance(item, ResponseProjection):
+            plans += 1
+            if "invoices" in item.fields:
+                invoices += len(item.invoices)
+    return plans, invoices
+
+
+__all__ = [
+    "CallTiming",
+    "add_hook",
+    "remove_hook",
+    "timing_hook",
+]
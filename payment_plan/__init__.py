@@ -1,18 +1,40 @@
 from datetime import datetime
 from typing import List, Tuple
 from ._internal.payment_plan_uniffi import (
+    Error,
     InternalDownPaymentParams as DownPaymentParams,
     InternalDownPaymentResponse as DownPaymentResponse,
     InternalParams as Params,
     InternalResponse as Response,
     InternalInvoice as Invoice,
+)
+from ._calls import (
     calculate_down_payment_plan,
     calculate_payment_plan,
+    raw_timestamps,
+    trusted_inputs,
     next_disbursement_date as _next_disbursement_date,
     disbursement_date_range as _disbursement_date_range,
     get_non_business_days_between as _get_non_business_days_between,
-    get_non_business_days_between,
 )
+from .batch import (
+    BatchResult,
+    ProcessPoolEngine,
+    calculate_payment_plan_many,
+    shutdown_workers,
+)
+from .buffers import (
+    BufferPoolStats,
+    RustBufferAllocations,
+    buffer_pool_stats,
+    count_allocations,
+    use_buffer_pool,
+)
+from .business_calendar import BusinessCalendar, DisbursementDateCache
+from .records import FrozenDownPaymentParams, FrozenParams
+from .responses import LazyResponses, ResponseProjection, ResponseView
+from .templates import DownPaymentParamsTemplate, ParamsTemplate
+from .tracing import _enable_when_configured
 
 
 def next_disbursement_date(base_date: datetime) -> datetime:
@@ -86,14 +108,37 @@ def get_non_business_days_between(
 
 
 __all__ = [
+    "BatchResult",
+    "BufferPoolStats",
+    "BusinessCalendar",
+    "DisbursementDateCache",
     "DownPaymentParams",
+    "DownPaymentParamsTemplate",
     "DownPaymentResponse",
+    "Error",
+    "FrozenDownPaymentParams",
+    "FrozenParams",
+    "LazyResponses",
     "Params",
+    "ParamsTemplate",
+    "ProcessPoolEngine",
     "Response",
+    "RustBufferAllocations",
+    "ResponseProjection",
+    "ResponseView",
     "Invoice",
+    "buffer_pool_stats",
     "calculate_down_payment_plan",
     "calculate_payment_plan",
+    "calculate_payment_plan_many",
+    "count_allocations",
     "next_disbursement_date",
     "disbursement_date_range",
     "get_non_business_days_between",
+    "raw_timestamps",
+    "shutdown_workers",
+    "trusted_inputs",
+    "use_buffer_pool",
 ]
+
+_enable_when_configured()
@@ -0,0 +1,264 @@
+"""
+The payment plan functions, built over the generated bindings.
+
+The generated functions only take their arguments; the decoding and validation options of
+the SDK are implemented here, on the same converters and FFI functions, and every call goes
+through `instrumentation._call` so that timing hooks see it.
+"""
+
+import contextlib
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Union
+from ._internal.payment_plan_uniffi import (
+    InternalDownPaymentParams as DownPaymentParams,
+    InternalDownPaymentResponse as DownPaymentResponse,
+    InternalParams as Params,
+    InternalResponse as Response,
+    _UniffiConverterSequenceTimestamp,
+    _UniffiConverterSequenceTypeInternalDownPaymentResponse,
+    _UniffiConverterSequenceTypeInternalResponse,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeError,
+    _UniffiConverterTypeInternalDownPaymentParams,
+    _UniffiConverterTypeInternalParams,
+    _UniffiConverterUInt32,
+    _UniffiLib,
+    _UNIFFI_TIMESTAMP_MODE,
+    _uniffi_rust_call,
+    _uniffi_rust_call_with_error,
+)
+from .instrumentation import _call
+from .responses import LazyResponses, ResponseProjection, _projection
+
+
+class _ValidationMode(threading.local):
+    # When set, params are only type-checked before being lowered; see `trusted_inputs`.
+    trusted = False
+
+
+_VALIDATION_MODE = _ValidationMode()
+
+
+@contextlib.contextmanager
+def trusted_inputs():
+    """
+    Context-manager that skips the field by field validation of params.
+
+    Inside it, calls made from the current thread only check that params are of the
+    expected record type; field values are then checked as a whole while being encoded,
+    which raises ValueError (or TypeError for timestamps) for values that don't fit.
+    Meant for params coming from an already validated source; the `trusted=True` argument
+    of the calculation functions does the same for a single call.
+    """
+    previous = _VALIDATION_MODE.trusted
+    _VALIDATION_MODE.trusted = True
+    try:
+        yield
+    finally:
+        _VALIDATION_MODE.trusted = previous
+
+
+def raw_timestamps():
+    """
+    Context-manager that decodes timestamps as integer nanoseconds since the epoch.
+
+    This only affects values returned by calls made from the current thread while the
+    context is active; it is meant for callers that only order or serialize dates and
+    don't need `datetime` objects.
+    """
+    return _timestamp_mode(True)
+
+
+def calculate_payment_plan(
+    params: Params,
+    fields: Optional[Iterable[str]] = None,
+    include_invoices: bool = True,
+    lazy: bool = False,
+    trusted: bool = False,
+) -> Union[List[Response], List[ResponseProjection], LazyResponses]:
+    """
+    Calculates the payment plans for the given params.
+
+    With `fields` (a collection of Response field names) or `include_invoices=False`,
+    only the projected fields are decoded and each plan is a ResponseProjection instead of
+    a Response; the other fields are skipped without being materialized.
+    Invoices are projected through `include_invoices`, never through `fields`.
+
+    With `lazy=True`, the result is copied out of the Rust buffer once and returned as a
+    LazyResponses sequence, whose ResponseView items decode each field or invoice list only
+    when it is read.
+
+    With `trusted=True`, params are only type-checked, as within `trusted_inputs()`.
+    """
+
+    def check():
+        _check_params(_UniffiConverterTypeInternalParams, params, trusted)
+        return _payment_plan_lifter(fields, include_invoices, lazy)
+
+    def lower():
+        return (_UniffiConverterTypeInternalParams.lower(params),)
+
+    return _call("calculate_payment_plan", check, lower, _calculate_payment_plan_call, params)
+
+
+def calculate_down_payment_plan(
+    params: DownPaymentParams, trusted: bool = False
+) -> List[DownPaymentResponse]:
+    """
+    Calculates the down payment plans for the given params.
+
+    With `trusted=True`, params are only type-checked, as within `trusted_inputs()`.
+    """
+
+    def check():
+        _check_params(_UniffiConverterTypeInternalDownPaymentParams, params, trusted)
+        return _UniffiConverterSequenceTypeInternalDownPaymentResponse.lift
+
+    def lower():
+        return (_UniffiConverterTypeInternalDownPaymentParams.lower(params),)
+
+    return _call(
+        "calculate_down_payment_plan", check, lower, _calculate_down_payment_plan_call, params
+    )
+
+
+def next_disbursement_date(base_date: datetime) -> datetime:
+    def check():
+        _UniffiConverterTimestamp.check_lower(base_date)
+        return _UniffiConverterTimestamp.lift
+
+    def lower():
+        return (_UniffiConverterTimestamp.lower(base_date),)
+
+    def call(rbuf):
+        return _uniffi_rust_call(
+            _UniffiLib.uniffi_payment_plan_uniffi_fn_func_next_disbursement_date, rbuf
+        )
+
+    return _call("next_disbursement_date", check, lower, call)
+
+
+def disbursement_date_range(base_date: datetime, days: int) -> List[datetime]:
+    def check():
+        _UniffiConverterTimestamp.check_lower(base_date)
+        _UniffiConverterUInt32.check_lower(days)
+        return _UniffiConverterSequenceTimestamp.lift
+
+    def lower():
+        return (_UniffiConverterTimestamp.lower(base_date), _UniffiConverterUInt32.lower(days))
+
+    def call(base_date_rbuf, days_value):
+        return _uniffi_rust_call(
+            _UniffiLib.uniffi_payment_plan_uniffi_fn_func_disbursement_date_range,
+            base_date_rbuf,
+            days_value,
+        )
+
+    return _call("disbursement_date_range", check, lower, call)
+
+
+def get_non_business_days_between(start_date: datetime, end_date: datetime) -> List[datetime]:
+    def check():
+        _UniffiConverterTimestamp.check_lower(start_date)
+        _UniffiConverterTimestamp.check_lower(end_date)
+        return _UniffiConverterSequenceTimestamp.lift
+
+    def lower():
+        return (_UniffiConverterTimestamp.lower(start_date), _UniffiConverterTimestamp.lower(end_date))
+
+    def call(start_rbuf, end_rbuf):
+        return _uniffi_rust_call(
+            _UniffiLib.uniffi_payment_plan_uniffi_fn_func_get_non_business_days_between,
+            start_rbuf,
+            end_rbuf,
+        )
+
+    return _call("get_non_business_days_between", check, lower, call)
+
+
+def _calculate_payment_plan_bytes(params: Params, trusted: bool = False) -> bytes:
+    # Same as calculate_payment_plan, but returns the encoded result for lifting elsewhere,
+    # e.g. in another process, with `_UniffiConverterSequenceTypeInternalResponse.lift_bytes`.
+
+    def check():
+        _check_params(_UniffiConverterTypeInternalParams, params, trusted)
+        return _consume_bytes
+
+    def lower():
+        return (_UniffiConverterTypeInternalParams.lower(params),)
+
+    return _call("calculate_payment_plan", check, lower, _calculate_payment_plan_call, params)
+
+
+def _calculate_down_payment_plan_bytes(params: DownPaymentParams, trusted: bool = False) -> bytes:
+    # Same as calculate_down_payment_plan, but returns the encoded result, for
+    # `_UniffiConverterSequenceTypeInternalDownPaymentResponse.lift_bytes`.
+
+    def check():
+        _check_params(_UniffiConverterTypeInternalDownPaymentParams, params, trusted)
+        return _consume_bytes
+
+    def lower():
+        return (_UniffiConverterTypeInternalDownPaymentParams.lower(params),)
+
+    return _call(
+        "calculate_down_payment_plan", check, lower, _calculate_down_payment_plan_call, params
+    )
+
+
+@contextlib.contextmanager
+def _timestamp_mode(raw):
+    # Decodes timestamps as `raw_timestamps()` does if `raw` is set, and as datetimes
+    # otherwise: re-applies the mode of a caller to work run for it on another thread.
+    previous = _UNIFFI_TIMESTAMP_MODE.raw
+    _UNIFFI_TIMESTAMP_MODE.raw = raw
+    try:
+        yield
+    finally:
+        _UNIFFI_TIMESTAMP_MODE.raw = previous
+
+
+def _check_params(converter, params, trusted):
+    if trusted or _VALIDATION_MODE.trusted:
+        converter.check_type(params)
+    else:
+        converter.check_lower(params)
+
+
+def _calculate_payment_plan_call(rbuf):
+    return _uniffi_rust_call_with_error(
+        _UniffiConverterTypeError,
+        _UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_payment_plan,
+        rbuf,
+    )
+
+
+def _calculate_down_payment_plan_call(rbuf):
+    return _uniffi_rust_call_with_error(
+        _UniffiConverterTypeError,
+        _UniffiLib.uniffi_payment_plan_uniffi_fn_func_calculate_down_payment_plan,
+        rbuf,
+    )
+
+
+def _consume_bytes(rbuf):
+    return rbuf.consume_bytes()
+
+
+def _payment_plan_lifter(fields, include_invoices, lazy):
+    # Returns the function lifting a calculate_payment_plan result buffer as requested by
+    # the decoding options of calculate_payment_plan, which are validated here.
+    if lazy:
+        if fields is not None or not include_invoices:
+            raise ValueError("lazy results can't be combined with fields or include_invoices")
+        return lambda rbuf: LazyResponses(rbuf.consume_bytes())
+    if fields is not None or not include_invoices:
+        projection = _projection(fields, include_invoices)
+
+        def lift_projected(rbuf):
+            with rbuf.consume_with_stream() as stream:
+                return projection.read_list(stream)
+
+        return lift_projected
+    return _UniffiConverterSequenceTypeInternalResponse.lift
@@ -52,9 +52,55 @@ class _UniffiRustBuffer(ctypes.Structure):
     def reserve(rbuf, additional):
         return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_reserve, rbuf, additional)
 
+    @staticmethod
+    def from_bytes(foreign_bytes):
+        """Copy the memory described by a _UniffiForeignBytes into a new buffer."""
+        return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_from_bytes, foreign_bytes)
+
+    # When set, `alloc_filled(size, fill)` calls are handed over to it.
+    alloc_filled_hook = None
+
+    @staticmethod
+    def alloc_filled(size, fill):
+        """Allocate a buffer of exactly `size` bytes, whose contents are written by `fill(view)`.
+
+        `fill` is given a writable ctypes buffer of `size` bytes: a freshly allocated buffer,
+        which is freed if `fill` fails so it can't leak, unless `alloc_filled_hook` is set
+        and provides the buffer instead.
+        """
+        hook = _UniffiRustBuffer.alloc_filled_hook
+        if hook is not None:
+            return hook(size, fill)
+        rbuf = _UniffiRustBuffer.alloc(size)
+        try:
+            fill(rbuf.view(0, size))
+        except:
+            rbuf.free()
+            raise
+        rbuf.len = size
+        return rbuf
+
+    @staticmethod
+    def alloc_from_struct(record_struct, values):
+        """Allocate a buffer of exactly `record_struct.size` bytes and pack `values` into it.
+
+        Values that don't fit the layout raise ValueError.
+        """
+        def fill(view):
+            try:
+                record_struct.pack_into(view, 0, *values)
+            except struct.error as e:
+                raise ValueError("can't encode value: {}".format(e)) from None
+        return _UniffiRustBuffer.alloc_filled(record_struct.size, fill)
+
     def free(self):
         return _uniffi_rust_call(_UniffiLib.ffi_payment_plan_uniffi_rustbuffer_free, self)
 
+    def view(self, offset, size):
+        """Writable ctypes view over `size` bytes of the buffer, starting at `offset`."""
+        address = ctypes.cast(self.data, ctypes.c_void_p).value + offset
+        return (ctypes.c_char * size).from_address(address)
+
     def __str__(self):
         return "_UniffiRustBuffer(capacity={}, len={}, data={})".format(
             self.capacity,
@@ -62,14 +108,16 @@ class _UniffiRustBuffer(ctypes.Structure):
             self.data[0:self.len]
         )
 
+    @staticmethod
     @contextlib.contextmanager
-    def alloc_with_builder(*args):
+    def alloc_with_builder(capacity=None):
         """Context-manger to allocate a buffer using a _UniffiRustBufferBuilder.
 
         The allocated buffer will be automatically freed if an error occurs, ensuring that
-        we don't accidentally leak it.
+        we don't accidentally leak it. With the exact `capacity` of what will be written,
+        the buffer is allocated once and never grown.
         """
-        builder = _UniffiRustBufferBuilder()
+        builder = _UniffiRustBufferBuilder(capacity)
         try:
             yield builder
         except:
@@ -91,6 +139,15 @@ class _UniffiRustBuffer(ctypes.Structure):
         finally:
             self.free()
 
+    def consume_bytes(self):
+        """Copy the contents of the buffer into a bytes object and free the buffer."""
+        try:
+            if self.len == 0:
+                return b""
+            return ctypes.string_at(self.data, self.len)
+        finally:
+            self.free()
+
     @contextlib.contextmanager
     def read_with_stream(self):
         """Context-manager to read a buffer using a _UniffiRustBufferStream.
@@ -118,70 +175,100 @@ class _UniffiRustBufferStream:
     Helper for structured reading of bytes from a _UniffiRustBuffer
     """
 
+    _I8 = struct.Struct(">b")
+    _U8 = struct.Struct(">B")
+    _I16 = struct.Struct(">h")
+    _U16 = struct.Struct(">H")
+    _I32 = struct.Struct(">i")
+    _U32 = struct.Struct(">I")
+    _I64 = struct.Struct(">q")
+    _U64 = struct.Struct(">Q")
+    _FLOAT = struct.Struct(">f")
+    _DOUBLE = struct.Struct(">d")
+
     def __init__(self, data, len):
-        self.data = data
+        self.data = memoryview(data)
         self.len = len
         self.offset = 0
+        # Timestamps decoded so far, keyed by their wire value; see `_UniffiConverterTimestamp.read_parts`.
+        self.timestamps = {}
 
     @classmethod
     def from_rust_buffer(cls, buf):
-        return cls(buf.data, buf.len)
+        # Copy the contents out once; every read below is then a plain offset
+        # into that copy instead of a slice of the ctypes pointer.
+        if buf.len == 0:
+            return cls(b"", 0)
+        return cls(ctypes.string_at(buf.data, buf.len), buf.len)
 
     def remaining(self):
         return self.len - self.offset
 
-    def _unpack_from(self, size, format):
+    def read_struct(self, record_struct):
+        """Unpack a whole fixed-layout record, returning the tuple of its values."""
+        if self.offset + record_struct.size > self.len:
+            raise InternalError("read past end of rust buffer")
+        values = record_struct.unpack_from(self.data, self.offset)
+        self.offset += record_struct.size
+        return values
+
+    def read_records(self, record_struct, count):
+        """Unpack `count` consecutive fixed-layout records into a list of tuples."""
+        size = record_struct.size * count
         if self.offset + size > self.len:
             raise InternalError("read past end of rust buffer")
-        value = struct.unpack(format, self.data[self.offset:self.offset+size])[0]
+        records = list(record_struct.iter_unpack(self.data[self.offset:self.offset+size]))
         self.offset += size
-        return value
+        return records
+
+    def _unpack_from(self, record_struct):
+        return self.read_struct(record_struct)[0]
 
     def read(self, size):
         if self.offset + size > self.len:
             raise InternalError("read past end of rust buffer")
-        data = self.data[self.offset:self.offset+size]
+        data = self.data[self.offset:self.offset+size].tobytes()
         self.offset += size
         return data
 
     def read_i8(self):
-        return self._unpack_from(1, ">b")
+        return self._unpack_from(self._I8)
 
     def read_u8(self):
-        return self._unpack_from(1, ">B")
+        return self._unpack_from(self._U8)
 
     def read_i16(self):
-        return self._unpack_from(2, ">h")
+        return self._unpack_from(self._I16)
 
     def read_u16(self):
-        return self._unpack_from(2, ">H")
+        return self._unpack_from(self._U16)
 
     def read_i32(self):
-        return self._unpack_from(4, ">i")
+        return self._unpack_from(self._I32)
 
     def read_u32(self):
-        return self._unpack_from(4, ">I")
+        return self._unpack_from(self._U32)
 
     def read_i64(self):
-        return self._unpack_from(8, ">q")
+        return self._unpack_from(self._I64)
 
     def read_u64(self):
-        return self._unpack_from(8, ">Q")
+        return self._unpack_from(self._U64)
 
     def read_float(self):
-        v = self._unpack_from(4, ">f")
+        v = self._unpack_from(self._FLOAT)
         return v
 
     def read_double(self):
-        return self._unpack_from(8, ">d")
+        return self._unpack_from(self._DOUBLE)
 
 class _UniffiRustBufferBuilder:
     """
     Helper for structured writing of bytes into a _UniffiRustBuffer.
     """
 
-    def __init__(self):
-        self.rbuf = _UniffiRustBuffer.alloc(16)
+    def __init__(self, capacity=None):
+        self.rbuf = _UniffiRustBuffer.alloc(16 if capacity is None else capacity)
         self.rbuf.len = 0
 
     def finalize(self):
@@ -203,14 +290,14 @@ class _UniffiRustBufferBuilder:
 
     def _pack_into(self, size, format, value):
         with self._reserve(size):
-            # XXX TODO: I feel like I should be able to use `struct.pack_into` here but can't figure it out.
-            for i, byte in enumerate(struct.pack(format, value)):
-                self.rbuf.data[self.rbuf.len + i] = byte
+            struct.pack_into(format, self.rbuf.view(self.rbuf.len, size), 0, value)
 
     def write(self, value):
-        with self._reserve(len(value)):
-            for i, byte in enumerate(value):
-                self.rbuf.data[self.rbuf.len + i] = byte
+        size = len(value)
+        if size == 0:
+            return
+        with self._reserve(size):
+            ctypes.memmove(self.rbuf.view(self.rbuf.len, size), value, size)
 
     def write_i8(self, v):
         self._pack_into(1, ">b", v)
@@ -406,9 +493,23 @@ class _UniffiConverterRustBuffer:
         with rbuf.consume_with_stream() as stream:
             return cls.read(stream)
 
+    @classmethod
+    def lift_bytes(cls, data):
+        """Like `lift`, but reads from a copy of the buffer contents (see `_UniffiRustBuffer.consume_bytes`)."""
+        stream = _UniffiRustBufferStream(data, len(data))
+        value = cls.read(stream)
+        if stream.remaining() != 0:
+            raise RuntimeError("junk data left in buffer at end of lift_bytes")
+        return value
+
+    @classmethod
+    def encoded_size(cls, value):
+        """Exact number of bytes `write` writes for `value`, or None if not known up front."""
+        return None
+
     @classmethod
     def lower(cls, value):
-        with _UniffiRustBuffer.alloc_with_builder() as builder:
+        with _UniffiRustBuffer.alloc_with_builder(cls.encoded_size(value)) as builder:
             cls.write(value, builder)
             return builder.finalize()
 
@@ -993,49 +1094,105 @@ class _UniffiConverterString:
 
     @staticmethod
     def lower(value):
-        with _UniffiRustBuffer.alloc_with_builder() as builder:
-            builder.write(value.encode("utf-8"))
+        utf8_bytes = value.encode("utf-8")
+        with _UniffiRustBuffer.alloc_with_builder(len(utf8_bytes)) as builder:
+            builder.write(utf8_bytes)
             return builder.finalize()
 
 # The Timestamp type.
 Timestamp = datetime.datetime
 
+# The Unix epoch, which timestamps are encoded relative to.
+_UNIFFI_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+class _UniffiTimestampMode(threading.local):
+    # When set, timestamps are decoded as integer nanoseconds since the epoch
+    # instead of datetimes; see `payment_plan.raw_timestamps`.
+    raw = False
+
+_UNIFFI_TIMESTAMP_MODE = _UniffiTimestampMode()
+
 # There is a loss of precision when converting from Rust timestamps,
 # which are accurate to the nanosecond,
-# to Python datetimes, which have a variable precision due to the use of float as representation.
+# to Python datetimes, which are accurate to the microsecond.
 class _UniffiConverterTimestamp(_UniffiConverterRustBuffer):
+    FORMAT = "qI"
+    _STRUCT = struct.Struct(">" + FORMAT)
+
     @staticmethod
     def read(buf):
-        seconds = buf.read_i64()
-        microseconds = buf.read_u32() / 1000
-        # Use fromtimestamp(0) then add the seconds using a timedelta.  This
-        # ensures that we get OverflowError rather than ValueError when
-        # seconds is too large.
+        seconds, nanoseconds = buf.read_struct(_UniffiConverterTimestamp._STRUCT)
+        return _UniffiConverterTimestamp.read_parts(buf, seconds, nanoseconds)
+
+    @staticmethod
+    def read_parts(buf, seconds, nanoseconds):
+        """Like `from_parts`, but shares one instance per distinct value read from `buf`.
+
+        Plans repeat the same handful of dates many times over, so interning them for the
+        duration of a decode avoids holding a separate datetime for every occurrence.
+        Decoded datetimes all use the `timezone.utc` singleton, so tz objects are shared too.
+        """
+        key = (seconds, nanoseconds)
+        try:
+            return buf.timestamps[key]
+        except KeyError:
+            value = buf.timestamps[key] = _UniffiConverterTimestamp.from_parts(seconds, nanoseconds)
+            return value
+
+    @staticmethod
+    def from_parts(seconds, nanoseconds):
+        """Build the datetime for a `(seconds, nanoseconds)` pair read off the wire.
+
+        A negative `seconds` means the whole value, nanoseconds included, lies before the epoch.
+        """
+        if _UNIFFI_TIMESTAMP_MODE.raw:
+            if seconds >= 0:
+                return seconds * 1_000_000_000 + nanoseconds
+            return seconds * 1_000_000_000 - nanoseconds
+
+        # Round to the nearest microsecond, ties to even, like timedelta does.
+        microseconds, remainder = divmod(nanoseconds, 1000)
+        if remainder > 500 or (remainder == 500 and microseconds & 1):
+            microseconds += 1
+        # Add a timedelta to the epoch rather than using fromtimestamp(), so that we
+        # get OverflowError rather than ValueError when seconds is too large.
         if seconds >= 0:
-            return datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc) + datetime.timedelta(seconds=seconds, microseconds=microseconds)
+            return _UNIFFI_EPOCH + datetime.timedelta(0, seconds, microseconds)
         else:
-            return datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc) - datetime.timedelta(seconds=-seconds, microseconds=microseconds)
+            return _UNIFFI_EPOCH - datetime.timedelta(0, -seconds, microseconds)
 
     @staticmethod
     def check_lower(value):
         pass
 
     @staticmethod
-    def write(value, buf):
-        if value >= datetime.datetime.fromtimestamp(0, datetime.timezone.utc):
-            sign = 1
-            delta = value - datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
-        else:
-            sign = -1
-            delta = datetime.datetime.fromtimestamp(0, datetime.timezone.utc) - value
+    def split(value):
+        """Return the `(seconds, nanoseconds)` pair that `value` is written as."""
+        delta = value - _UNIFFI_EPOCH
+        if delta.days >= 0:
+            return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+        delta = -delta
+        return -(delta.days * 86400 + delta.seconds), delta.microseconds * 1000
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTimestamp._STRUCT.size
 
-        seconds = delta.seconds + delta.days * 24 * 3600
-        nanoseconds = delta.microseconds * 1000
-        buf.write_i64(sign * seconds)
+    @staticmethod
+    def write(value, buf):
+        seconds, nanoseconds = _UniffiConverterTimestamp.split(value)
+        buf.write_i64(seconds)
         buf.write_u32(nanoseconds)
 
 
 class InternalDownPaymentParams:
+    __slots__ = (
+        "params",
+        "requested_amount",
+        "min_installment_amount",
+        "first_payment_date",
+        "installments",
+    )
     params: "InternalParams"
     requested_amount: "float"
     min_installment_amount: "float"
@@ -1065,6 +1222,9 @@ class InternalDownPaymentParams:
         return True
 
 class _UniffiConverterTypeInternalDownPaymentParams(_UniffiConverterRustBuffer):
+    # The nested params come first, followed by the fixed-width down payment fields.
+    FORMAT = "ddqII"
+
     @staticmethod
     def read(buf):
         return InternalDownPaymentParams(
@@ -1083,16 +1243,49 @@ class _UniffiConverterTypeInternalDownPaymentParams(_UniffiConverterRustBuffer):
         _UniffiConverterTimestamp.check_lower(value.first_payment_date)
         _UniffiConverterUInt32.check_lower(value.installments)
 
+    @staticmethod
+    def check_type(value):
+        if not isinstance(value, InternalDownPaymentParams):
+            raise TypeError("expected InternalDownPaymentParams, not {}".format(type(value).__name__))
+        _UniffiConverterTypeInternalParams.check_type(value.params)
+
+    @staticmethod
+    def pack_values(value):
+        first_payment_seconds, first_payment_nanoseconds = _UniffiConverterTimestamp.split(value.first_payment_date)
+        return _UniffiConverterTypeInternalParams.pack_values(value.params) + (
+            value.requested_amount,
+            value.min_installment_amount,
+            first_payment_seconds,
+            first_payment_nanoseconds,
+            value.installments,
+        )
+
+    @staticmethod
+    def record_struct(value):
+        return _UniffiConverterTypeInternalDownPaymentParams._STRUCTS[value.params.min_installments is not None]
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalDownPaymentParams.record_struct(value).size
+
+    @classmethod
+    def lower(cls, value):
+        return _UniffiRustBuffer.alloc_from_struct(cls.record_struct(value), cls.pack_values(value))
+
     @staticmethod
     def write(value, buf):
-        _UniffiConverterTypeInternalParams.write(value.params, buf)
-        _UniffiConverterDouble.write(value.requested_amount, buf)
-        _UniffiConverterDouble.write(value.min_installment_amount, buf)
-        _UniffiConverterTimestamp.write(value.first_payment_date, buf)
-        _UniffiConverterUInt32.write(value.installments, buf)
+        record_struct = _UniffiConverterTypeInternalDownPaymentParams.record_struct(value)
+        buf.write(record_struct.pack(*_UniffiConverterTypeInternalDownPaymentParams.pack_values(value)))
 
 
 class InternalDownPaymentResponse:
+    __slots__ = (
+        "installment_amount",
+        "total_amount",
+        "installment_quantity",
+        "first_payment_date",
+        "plans",
+    )
     installment_amount: "float"
     total_amount: "float"
     installment_quantity: "int"
@@ -1122,13 +1315,17 @@ class InternalDownPaymentResponse:
         return True
 
 class _UniffiConverterTypeInternalDownPaymentResponse(_UniffiConverterRustBuffer):
+    # Fixed-width fields preceding the `plans` sequence.
+    _HEAD = struct.Struct(">ddIqI")
+
     @staticmethod
     def read(buf):
+        head = buf.read_struct(_UniffiConverterTypeInternalDownPaymentResponse._HEAD)
         return InternalDownPaymentResponse(
-            installment_amount=_UniffiConverterDouble.read(buf),
-            total_amount=_UniffiConverterDouble.read(buf),
-            installment_quantity=_UniffiConverterUInt32.read(buf),
-            first_payment_date=_UniffiConverterTimestamp.read(buf),
+            installment_amount=head[0],
+            total_amount=head[1],
+            installment_quantity=head[2],
+            first_payment_date=_UniffiConverterTimestamp.read_parts(buf, head[3], head[4]),
             plans=_UniffiConverterSequenceTypeInternalResponse.read(buf),
         )
 
@@ -1140,6 +1337,10 @@ class _UniffiConverterTypeInternalDownPaymentResponse(_UniffiConverterRustBuffer
         _UniffiConverterTimestamp.check_lower(value.first_payment_date)
         _UniffiConverterSequenceTypeInternalResponse.check_lower(value.plans)
 
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalDownPaymentResponse._HEAD.size + _UniffiConverterSequenceTypeInternalResponse.encoded_size(value.plans)
+
     @staticmethod
     def write(value, buf):
         _UniffiConverterDouble.write(value.installment_amount, buf)
@@ -1150,6 +1351,14 @@ class _UniffiConverterTypeInternalDownPaymentResponse(_UniffiConverterRustBuffer
 
 
 class InternalInvoice:
+    __slots__ = (
+        "accumulated_days",
+        "factor",
+        "accumulated_factor",
+        "main_iof_tac",
+        "debit_service",
+        "due_date",
+    )
     accumulated_days: "int"
     factor: "float"
     accumulated_factor: "float"
@@ -1183,15 +1392,22 @@ class InternalInvoice:
         return True
 
 class _UniffiConverterTypeInternalInvoice(_UniffiConverterRustBuffer):
+    # Invoices are entirely fixed-width, so sequences of them are unpacked in bulk.
+    _STRUCT = struct.Struct(">qddddqI")
+
     @staticmethod
     def read(buf):
+        return _UniffiConverterTypeInternalInvoice.from_values(buf, buf.read_struct(_UniffiConverterTypeInternalInvoice._STRUCT))
+
+    @staticmethod
+    def from_values(buf, values):
         return InternalInvoice(
-            accumulated_days=_UniffiConverterInt64.read(buf),
-            factor=_UniffiConverterDouble.read(buf),
-            accumulated_factor=_UniffiConverterDouble.read(buf),
-            main_iof_tac=_UniffiConverterDouble.read(buf),
-            debit_service=_UniffiConverterDouble.read(buf),
-            due_date=_UniffiConverterTimestamp.read(buf),
+            accumulated_days=values[0],
+            factor=values[1],
+            accumulated_factor=values[2],
+            main_iof_tac=values[3],
+            debit_service=values[4],
+            due_date=_UniffiConverterTimestamp.read_parts(buf, values[5], values[6]),
         )
 
     @staticmethod
@@ -1203,6 +1419,10 @@ class _UniffiConverterTypeInternalInvoice(_UniffiConverterRustBuffer):
         _UniffiConverterDouble.check_lower(value.debit_service)
         _UniffiConverterTimestamp.check_lower(value.due_date)
 
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalInvoice._STRUCT.size
+
     @staticmethod
     def write(value, buf):
         _UniffiConverterInt64.write(value.accumulated_days, buf)
@@ -1214,6 +1434,22 @@ class _UniffiConverterTypeInternalInvoice(_UniffiConverterRustBuffer):
 
 
 class InternalParams:
+    __slots__ = (
+        "requested_amount",
+        "first_payment_date",
+        "disbursement_date",
+        "installments",
+        "debit_service_percentage",
+        "mdr",
+        "tac_percentage",
+        "iof_overall",
+        "iof_percentage",
+        "interest_rate",
+        "min_installment_amount",
+        "max_total_amount",
+        "disbursement_only_on_business_days",
+        "min_installments",
+    )
     requested_amount: "float"
     first_payment_date: "Timestamp"
     disbursement_date: "Timestamp"
@@ -1279,6 +1515,15 @@ class InternalParams:
         return True
 
 class _UniffiConverterTypeInternalParams(_UniffiConverterRustBuffer):
+    # Every field but the trailing `Option<u32>` has a fixed width, so the record is
+    # packed in one go with the layout matching the presence of `min_installments`.
+    FORMAT = "dqIqIIHdddddddB"
+    MIN_INSTALLMENTS_FORMATS = ("B", "BI")
+    _STRUCTS = (
+        struct.Struct(">" + FORMAT + MIN_INSTALLMENTS_FORMATS[0]),
+        struct.Struct(">" + FORMAT + MIN_INSTALLMENTS_FORMATS[1]),
+    )
+
     @staticmethod
     def read(buf):
         return InternalParams(
@@ -1315,25 +1560,96 @@ class _UniffiConverterTypeInternalParams(_UniffiConverterRustBuffer):
         _UniffiConverterBool.check_lower(value.disbursement_only_on_business_days)
         _UniffiConverterOptionalUInt32.check_lower(value.min_installments)
 
+    @staticmethod
+    def check_type(value):
+        if not isinstance(value, InternalParams):
+            raise TypeError("expected InternalParams, not {}".format(type(value).__name__))
+
+    @staticmethod
+    def pack_values(value):
+        first_payment_seconds, first_payment_nanoseconds = _UniffiConverterTimestamp.split(value.first_payment_date)
+        disbursement_seconds, disbursement_nanoseconds = _UniffiConverterTimestamp.split(value.disbursement_date)
+        values = (
+            value.requested_amount,
+            first_payment_seconds,
+            first_payment_nanoseconds,
+            disbursement_seconds,
+            disbursement_nanoseconds,
+            value.installments,
+            value.debit_service_percentage,
+            value.mdr,
+            value.tac_percentage,
+            value.iof_overall,
+            value.iof_percentage,
+            value.interest_rate,
+            value.min_installment_amount,
+            value.max_total_amount,
+            value.disbursement_only_on_business_days,
+        )
+        if value.min_installments is None:
+            return values + (0,)
+        return values + (1, value.min_installments)
+
+    @staticmethod
+    def record_struct(value):
+        return _UniffiConverterTypeInternalParams._STRUCTS[value.min_installments is not None]
+
+    @staticmethod
+    def encoded_size(value):
+        return _UniffiConverterTypeInternalParams.record_struct(value).size
+
+    @classmethod
+    def lower(cls, value):
+        return _UniffiRustBuffer.alloc_from_struct(cls.record_struct(value), cls.pack_values(value))
+
     @staticmethod
     def write(value, buf):
-        _UniffiConverterDouble.write(value.requested_amount, buf)
-        _UniffiConverterTimestamp.write(value.first_payment_date, buf)
-        _UniffiConverterTimestamp.write(value.disbursement_date, buf)
-        _UniffiConverterUInt32.write(value.installments, buf)
-        _UniffiConverterUInt16.write(value.debit_service_percentage, buf)
-        _UniffiConverterDouble.write(value.mdr, buf)
-        _UniffiConverterDouble.write(value.tac_percentage, buf)
-        _UniffiConverterDouble.write(value.iof_overall, buf)
-        _UniffiConverterDouble.write(value.iof_percentage, buf)
-        _UniffiConverterDouble.write(value.interest_rate, buf)
-        _UniffiConverterDouble.write(value.min_installment_amount, buf)
-        _UniffiConverterDouble.write(value.max_total_amount, buf)
-        _UniffiConverterBool.write(value.disbursement_only_on_business_days, buf)
-        _UniffiConverterOptionalUInt32.write(value.min_installments, buf)
+        record_struct = _UniffiConverterTypeInternalParams.record_struct(value)
+        buf.write(record_struct.pack(*_UniffiConverterTypeInternalParams.pack_values(value)))
+
+_UniffiConverterTypeInternalDownPaymentParams._STRUCTS = tuple(
+    struct.Struct(">" + _UniffiConverterTypeInternalParams.FORMAT + tail + _UniffiConverterTypeInternalDownPaymentParams.FORMAT)
+    for tail in _UniffiConverterTypeInternalParams.MIN_INSTALLMENTS_FORMATS
+)
 
 
 class InternalResponse:
+    __slots__ = (
+        "installment",
+        "due_date",
+        "disbursement_date",
+        "accumulated_days",
+        "days_index",
+        "accumulated_days_index",
+        "interest_rate",
+        "installment_amount",
+        "installment_amount_without_tac",
+        "total_amount",
+        "debit_service",
+        "customer_debit_service_amount",
+        "customer_amount",
+        "calculation_basis_for_effective_interest_rate",
+        "merchant_debit_service_amount",
+        "merchant_total_amount",
+        "settled_to_merchant",
+        "mdr_amount",
+        "effective_interest_rate",
+        "total_effective_cost",
+        "eir_yearly",
+        "tec_yearly",
+        "eir_monthly",
+        "tec_monthly",
+        "total_iof",
+        "contract_amount",
+        "contract_amount_without_tac",
+        "tac_amount",
+        "iof_percentage",
+        "overall_iof",
+        "pre_disbursement_amount",
+        "paid_total_iof",
+        "paid_contract_amount",
+        "invoices",
+    )
     installment: "int"
     due_date: "Timestamp"
     disbursement_date: "Timestamp"
@@ -1479,43 +1795,54 @@ class InternalResponse:
         return True
 
 class _UniffiConverterTypeInternalResponse(_UniffiConverterRustBuffer):
+    # Fixed-width fields, up to and including the length prefix of `invoices`.
+    _HEAD = struct.Struct(">IqIqIq" + "d" * 29 + "i")
+
     @staticmethod
     def read(buf):
+        head = buf.read_struct(_UniffiConverterTypeInternalResponse._HEAD)
+        invoice_count = head[35]
+        if invoice_count < 0:
+            raise InternalError("Unexpected negative sequence length")
+        invoices = [
+            _UniffiConverterTypeInternalInvoice.from_values(buf, values)
+            for values in buf.read_records(_UniffiConverterTypeInternalInvoice._STRUCT, invoice_count)
+        ]
         return InternalResponse(
-            installment=_UniffiConverterUInt32.read(buf),
-            due_date=_UniffiConverterTimestamp.read(buf),
-            disbursement_date=_UniffiConverterTimestamp.read(buf),
-            accumulated_days=_UniffiConverterInt64.read(buf),
-            days_index=_UniffiConverterDouble.read(buf),
-            accumulated_days_index=_UniffiConverterDouble.read(buf),
-            interest_rate=_UniffiConverterDouble.read(buf),
-            installment_amount=_UniffiConverterDouble.read(buf),
-            installment_amount_without_tac=_UniffiConverterDouble.read(buf),
-            total_amount=_UniffiConverterDouble.read(buf),
-            debit_service=_UniffiConverterDouble.read(buf),
-            customer_debit_service_amount=_UniffiConverterDouble.read(buf),
-            customer_amount=_UniffiConverterDouble.read(buf),
-            calculation_basis_for_effective_interest_rate=_UniffiConverterDouble.read(buf),
-            merchant_debit_service_amount=_UniffiConverterDouble.read(buf),
-            merchant_total_amount=_UniffiConverterDouble.read(buf),
-            settled_to_merchant=_UniffiConverterDouble.read(buf),
-            mdr_amount=_UniffiConverterDouble.read(buf),
-            effective_interest_rate=_UniffiConverterDouble.read(buf),
-            total_effective_cost=_UniffiConverterDouble.read(buf),
-            eir_yearly=_UniffiConverterDouble.read(buf),
-            tec_yearly=_UniffiConverterDouble.read(buf),
-            eir_monthly=_UniffiConverterDouble.read(buf),
-            tec_monthly=_UniffiConverterDouble.read(buf),
-            total_iof=_UniffiConverterDouble.read(buf),
-            contract_amount=_UniffiConverterDouble.read(buf),
-            contract_amount_without_tac=_UniffiConverterDouble.read(buf),
-            tac_amount=_UniffiConverterDouble.read(buf),
-            iof_percentage=_UniffiConverterDouble.read(buf),
-            overall_iof=_UniffiConverterDouble.read(buf),
-            pre_disbursement_amount=_UniffiConverterDouble.read(buf),
-            paid_total_iof=_UniffiConverterDouble.read(buf),
-            paid_contract_amount=_UniffiConverterDouble.read(buf),
-            invoices=_UniffiConverterSequenceTypeInternalInvoice.read(buf),
+            installment=head[0],
+            due_date=_UniffiConverterTimestamp.read_parts(buf, head[1], head[2]),
+            disbursement_date=_UniffiConverterTimestamp.read_parts(buf, head[3], head[4]),
+            accumulated_days=head[5],
+            days_index=head[6],
+            accumulated_days_index=head[7],
+            interest_rate=head[8],
+            installment_amount=head[9],
+            installment_amount_without_tac=head[10],
+            total_amount=head[11],
+            debit_service=head[12],
+            customer_debit_service_amount=head[13],
+            customer_amount=head[14],
+            calculation_basis_for_effective_interest_rate=head[15],
+            merchant_debit_service_amount=head[16],
+            merchant_total_amount=head[17],
+            settled_to_merchant=head[18],
+            mdr_amount=head[19],
+            effective_interest_rate=head[20],
+            total_effective_cost=head[21],
+            eir_yearly=head[22],
+            tec_yearly=head[23],
+            eir_monthly=head[24],
+            tec_monthly=head[25],
+            total_iof=head[26],
+            contract_amount=head[27],
+            contract_amount_without_tac=head[28],
+            tac_amount=head[29],
+            iof_percentage=head[30],
+            overall_iof=head[31],
+            pre_disbursement_amount=head[32],
+            paid_total_iof=head[33],
+            paid_contract_amount=head[34],
+            invoices=invoices,
         )
 
     @staticmethod
@@ -1555,6 +1882,11 @@ class _UniffiConverterTypeInternalResponse(_UniffiConverterRustBuffer):
         _UniffiConverterDouble.check_lower(value.paid_contract_amount)
         _UniffiConverterSequenceTypeInternalInvoice.check_lower(value.invoices)
 
+    @staticmethod
+    def encoded_size(value):
+        # The head ends with the length prefix of `invoices`.
+        return _UniffiConverterTypeInternalResponse._HEAD.size + _UniffiConverterTypeInternalInvoice._STRUCT.size * len(value.invoices)
+
     @staticmethod
     def write(value, buf):
         _UniffiConverterUInt32.write(value.installment, buf)
@@ -1658,6 +1990,10 @@ class _UniffiConverterOptionalUInt32(_UniffiConverterRustBuffer):
         if value is not None:
             _UniffiConverterUInt32.check_lower(value)
 
+    @classmethod
+    def encoded_size(cls, value):
+        return 1 if value is None else 5
+
     @classmethod
     def write(cls, value, buf):
         if value is None:
@@ -1685,6 +2021,10 @@ class _UniffiConverterSequenceTimestamp(_UniffiConverterRustBuffer):
         for item in value:
             _UniffiConverterTimestamp.check_lower(item)
 
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTimestamp.encoded_size(item) for item in value)
+
     @classmethod
     def write(cls, value, buf):
         items = len(value)
@@ -1699,7 +2039,8 @@ class _UniffiConverterSequenceTimestamp(_UniffiConverterRustBuffer):
             raise InternalError("Unexpected negative sequence length")
 
         return [
-            _UniffiConverterTimestamp.read(buf) for i in range(count)
+            _UniffiConverterTimestamp.read_parts(buf, seconds, nanoseconds)
+            for seconds, nanoseconds in buf.read_records(_UniffiConverterTimestamp._STRUCT, count)
         ]
 
 
@@ -1710,6 +2051,10 @@ class _UniffiConverterSequenceTypeInternalDownPaymentResponse(_UniffiConverterRu
         for item in value:
             _UniffiConverterTypeInternalDownPaymentResponse.check_lower(item)
 
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalDownPaymentResponse.encoded_size(item) for item in value)
+
     @classmethod
     def write(cls, value, buf):
         items = len(value)
@@ -1735,6 +2080,10 @@ class _UniffiConverterSequenceTypeInternalInvoice(_UniffiConverterRustBuffer):
         for item in value:
             _UniffiConverterTypeInternalInvoice.check_lower(item)
 
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalInvoice.encoded_size(item) for item in value)
+
     @classmethod
     def write(cls, value, buf):
         items = len(value)
@@ -1760,6 +2109,10 @@ class _UniffiConverterSequenceTypeInternalResponse(_UniffiConverterRustBuffer):
         for item in value:
             _UniffiConverterTypeInternalResponse.check_lower(item)
 
+    @classmethod
+    def encoded_size(cls, value):
+        return 4 + sum(_UniffiConverterTypeInternalResponse.encoded_size(item) for item in value)
+
     @classmethod
     def write(cls, value, buf):
         items = len(value)
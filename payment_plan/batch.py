@@ -0,0 +1,297 @@
+import atexit
+import collections
+import functools
+import itertools
+import os
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+from ._internal.payment_plan_uniffi import (
+    Error,
+    InternalParams as Params,
+    InternalResponse as Response,
+    _UniffiConverterSequenceTypeInternalResponse,
+    _UNIFFI_TIMESTAMP_MODE,
+)
+from ._calls import (
+    _VALIDATION_MODE,
+    _calculate_payment_plan_bytes,
+    _timestamp_mode,
+    calculate_payment_plan,
+)
+
+# Errors that belong to a single params item; anything else aborts the batch.
+_ITEM_ERRORS = (Error, TypeError, ValueError)
+
+# How many tasks per worker are kept in flight while consuming the input.
+_TASKS_PER_WORKER = 4
+
+_executors = {}  # type: dict[int, ThreadPoolExecutor]
+_executors_lock = threading.Lock()
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of one item of a batch calculation.
+
+    Exactly one of `result` and `error` is set.
+    """
+
+    index: int
+    params: Params
+    result: Optional[List[Response]]
+    error: Optional[Exception]
+
+
+def calculate_payment_plan_many(
+    params_iterable: Iterable[Params],
+    max_workers: Optional[int] = None,
+    ordered: bool = True,
+    trusted: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Calculates the payment plans of many params concurrently.
+
+    The Rust calculation releases the GIL, so running calls on a thread pool overlaps the
+    calculations of several items. The pool is shared by every batch with the same `max_workers`,
+    and kept until `shutdown_workers()` is called or the interpreter exits.
+
+    Input is consumed lazily, keeping only a few tasks per worker in flight, so arbitrarily
+    large iterables can be processed without holding all of them in memory.
+
+    An item that fails with `Error.InvalidParams`, `Error.CalculationError` or a validation
+    error (TypeError/ValueError) yields a BatchResult with `error` set instead of aborting the batch.
+
+    Args:
+        params_iterable (Iterable[Params]): The params to calculate the payment plans for.
+        max_workers (Optional[int]): Number of worker threads; defaults to the number of CPUs.
+        ordered (bool): Yield results in input order; otherwise they are yielded as they complete.
+        trusted (bool): Only type-check the params, as within `payment_plan.trusted_inputs()`;
+            a `trusted_inputs()` block around this call applies to the whole batch.
+
+    Returns:
+        Iterator[BatchResult]: One result per params item, tagged with its input index.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return _run_many(
+        _executor(max_workers),
+        enumerate(params_iterable),
+        max_workers * _TASKS_PER_WORKER,
+        ordered,
+        # Thread-local modes don't reach the worker threads by themselves.
+        functools.partial(
+            _calculate,
+            trusted=trusted or _VALIDATION_MODE.trusted,
+            raw=_UNIFFI_TIMESTAMP_MODE.raw,
+        ),
+    )
+
+
+def _calculate(index, params, trusted, raw):
+    try:
+        with _timestamp_mode(raw):
+            result = calculate_payment_plan(params, trusted=trusted)
+        return BatchResult(index, params, result, None)
+    except _ITEM_ERRORS as e:
+        return BatchResult(index, params, None, e)
+
+
+def _run_many(executor, items, window, ordered, task):
+    # Yields `task(index, params)` for every (index, params) of `items`, run on `executor`
+    # with at most `window` tasks in flight, in input order or as they complete.
+    if ordered:
+        pending = collections.deque()
+        for index, params in items:
+            pending.append(executor.submit(task, index, params))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    else:
+        pending = set()
+        for index, params in items:
+            pending.add(executor.submit(task, index, params))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+class ProcessPoolEngine:
+    """
+    Calculates payment plans on a pool of worker processes, for bulk simulations.
+
+    Lowering params and lifting results is pure Python and holds the GIL, so threads stop
+    scaling after a few cores; worker processes don't share that limit.
+    Each worker loads the Rust library once and is sent params in chunks. It returns every
+    plan list in its encoded form, which is decoded in the calling process, instead of
+    pickling the full Response objects.
+
+    The pool is started on first use and reused until `close()` is called; the engine can
+    also be used as a context manager.
+
+    Args:
+        max_workers (Optional[int]): Number of worker processes; defaults to the number of CPUs.
+        chunk_size (int): Number of params sent to a worker at a time.
+        mp_context: Optional multiprocessing context used to start the workers.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, chunk_size: int = 64, mp_context=None
+    ):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._mp_context = mp_context
+        self._executor = None  # type: Optional[ProcessPoolExecutor]
+        self._lock = threading.Lock()
+
+    def calculate_payment_plan_many(
+        self, params_iterable: Iterable[Params], ordered: bool = True, trusted: bool = False
+    ) -> Iterator[BatchResult]:
+        """
+        Same as `payment_plan.calculate_payment_plan_many`, but running on the worker processes.
+
+        Args:
+            params_iterable (Iterable[Params]): The params to calculate the payment plans for.
+            ordered (bool): Yield results in input order; otherwise they are yielded chunk by chunk as they complete.
+            trusted (bool): Only type-check the params, as within `payment_plan.trusted_inputs()`;
+                a `trusted_inputs()` block around this call applies to the whole batch.
+
+        Returns:
+            Iterator[BatchResult]: One result per params item, tagged with its input index.
+        """
+        chunks = _chunked(enumerate(params_iterable), self.chunk_size)
+        window = self.max_workers * 2
+        trusted = trusted or _VALIDATION_MODE.trusted
+        return self._run_chunks(
+            self._get_executor(), chunks, window, ordered, trusted, _UNIFFI_TIMESTAMP_MODE.raw
+        )
+
+    def close(self) -> None:
+        """Shut the worker processes down, waiting for running chunks to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self._mp_context
+                )
+            return self._executor
+
+    @staticmethod
+    def _run_chunks(executor, chunks, window, ordered, trusted, raw):
+        pending = collections.OrderedDict()
+        for chunk in chunks:
+            pending[executor.submit(_calculate_chunk, chunk, trusted)] = chunk
+            while len(pending) >= window:
+                yield from _decode_chunks(pending, ordered, raw)
+        while pending:
+            yield from _decode_chunks(pending, ordered, raw)
+
+
+def _calculate_chunk(chunk, trusted):
+    # Runs in a worker process, which imports this module, and so loads the Rust library,
+    # once, when it unpickles its first task.
+    results = []
+    for index, params in chunk:
+        try:
+            results.append((index, _calculate_payment_plan_bytes(params, trusted), None))
+        except _ITEM_ERRORS as e:
+            results.append((index, None, e))
+    return results
+
+
+def _decode_chunks(pending, ordered, raw):
+    # Decodes the first pending chunk when ordered, otherwise every chunk that is done.
+    if ordered:
+        future, chunk = pending.popitem(last=False)
+        done = [(future, chunk)]
+    else:
+        finished, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+        done = [(future, pending.pop(future)) for future in finished]
+    for future, chunk in done:
+        params = dict(chunk)
+        for index, data, error in future.result():
+            if error is not None:
+                yield BatchResult(index, params[index], None, error)
+            else:
+                # Decoded in the mode of the call, not the one around the iteration.
+                with _timestamp_mode(raw):
+                    result = _UniffiConverterSequenceTypeInternalResponse.lift_bytes(data)
+                yield BatchResult(index, params[index], result, None)
+
+
+def _chunked(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def shutdown_workers(wait: bool = True) -> None:
+    """
+    Shuts down the worker threads kept for `calculate_payment_plan_many` and the columnar
+    and Arrow exports, one pool per `max_workers` value used so far.
+
+    Batches that are still being consumed can't schedule more work once their pool is shut
+    down; later batches start new pools. This is called when the interpreter exits.
+
+    Args:
+        wait (bool): Wait for the calculations already running to finish.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+atexit.register(shutdown_workers)
+
+
+def _executor(max_workers):
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = _executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="payment-plan"
+            )
+        return executor
+
+
+__all__ = [
+    "BatchResult",
+    "ProcessPoolEngine",
+    "calculate_payment_plan_many",
+    "shutdown_workers",
+]
@@ -0,0 +1,198 @@
+"""
+Memory management of the buffers params are lowered into.
+
+With `use_buffer_pool()`, params are encoded into staging memory kept per thread and per
+size, and copied into the buffer handed to the Rust library with a single
+`rustbuffer_from_bytes` call, instead of being encoded straight into a freshly allocated
+buffer. `buffer_pool_stats()` reports how much of that memory is held and reused.
+
+`count_allocations()` counts the buffers allocated on the Python side of the calls made
+within it, e.g. to confirm that params are lowered with a single allocation.
+"""
+
+import contextlib
+import ctypes
+import threading
+import weakref
+from typing import NamedTuple
+from ._internal.payment_plan_uniffi import _UniffiForeignBytes, _UniffiRustBuffer
+
+
+class BufferPoolStats(NamedTuple):
+    """Point-in-time counters of the lowering buffer pool, over the threads still alive."""
+
+    enabled: bool
+    threads: int
+    staging_buffers: int
+    staging_bytes: int
+    reuses: int
+    allocations: int
+
+
+class _StagingBuffers:
+    # One thread's staging memory: per payload size, a reusable ctypes buffer along with
+    # the _UniffiForeignBytes pointing at it.
+    MAX_SIZES = 8
+
+    def __init__(self):
+        self.buffers = {}
+        self.reuses = 0
+        self.allocations = 0
+
+    def get(self, size):
+        try:
+            entry = self.buffers[size]
+        except KeyError:
+            if len(self.buffers) >= self.MAX_SIZES:
+                self.buffers.clear()
+            buffer = (ctypes.c_char * size)()
+            entry = self.buffers[size] = (buffer, _UniffiForeignBytes(size, buffer))
+            self.allocations += 1
+        else:
+            self.reuses += 1
+        return entry
+
+
+class _BufferPool:
+    def __init__(self):
+        self.enabled = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Staging memory of every thread, dropped along with the thread.
+        self._all = weakref.WeakSet()
+
+    def staging(self):
+        try:
+            return self._local.staging
+        except AttributeError:
+            staging = self._local.staging = _StagingBuffers()
+            with self._lock:
+                self._all.add(staging)
+            return staging
+
+    def alloc_filled(self, size, fill):
+        # The `_UniffiRustBuffer.alloc_filled_hook` of the pool.
+        staging, foreign_bytes = self.staging().get(size)
+        fill(staging)
+        return _UniffiRustBuffer.from_bytes(foreign_bytes)
+
+    def stats(self):
+        with self._lock:
+            all_staging = list(self._all)
+        return BufferPoolStats(
+            enabled=self.enabled,
+            threads=len(all_staging),
+            staging_buffers=sum(len(staging.buffers) for staging in all_staging),
+            staging_bytes=sum(size for staging in all_staging for size in list(staging.buffers)),
+            reuses=sum(staging.reuses for staging in all_staging),
+            allocations=sum(staging.allocations for staging in all_staging),
+        )
+
+
+_pool = _BufferPool()
+
+
+def use_buffer_pool(enabled: bool = True) -> None:
+    """Enable or disable the pool of staging buffers used to lower params."""
+    _pool.enabled = enabled
+    _UniffiRustBuffer.alloc_filled_hook = _pool.alloc_filled if enabled else None
+
+
+def buffer_pool_stats() -> BufferPoolStats:
+    """Return the counters of the lowering buffer pool."""
+    return _pool.stats()
+
+
+class RustBufferAllocations:
+    """Counts of the RustBuffer allocations made within `count_allocations()`."""
+
+    __slots__ = ("allocations", "reserves", "allocated_bytes")
+
+    def __init__(self):
+        self.allocations = 0
+        self.reserves = 0
+        self.allocated_bytes = 0
+
+    def __repr__(self):
+        return "RustBufferAllocations(allocations={}, reserves={}, allocated_bytes={})".format(
+            self.allocations, self.reserves, self.allocated_bytes
+        )
+
+
+class _AllocationCounts(threading.local):
+    # The counts being updated by the current thread, if any.
+    current = None
+
+
+_counts = _AllocationCounts()
+
+# The allocating functions of _UniffiRustBuffer, which are wrapped by counting ones while
+# any count_allocations() block is open, in any thread.
+_alloc = _UniffiRustBuffer.alloc
+_reserve = _UniffiRustBuffer.reserve
+_from_bytes = _UniffiRustBuffer.from_bytes
+_counting = 0
+_counting_lock = threading.Lock()
+
+
+def _counted_alloc(size):
+    counts = _counts.current
+    if counts is not None:
+        counts.allocations += 1
+        counts.allocated_bytes += size
+    return _alloc(size)
+
+
+def _counted_reserve(rbuf, additional):
+    counts = _counts.current
+    if counts is not None:
+        counts.reserves += 1
+    return _reserve(rbuf, additional)
+
+
+def _counted_from_bytes(foreign_bytes):
+    counts = _counts.current
+    if counts is not None:
+        counts.allocations += 1
+        counts.allocated_bytes += foreign_bytes.len
+    return _from_bytes(foreign_bytes)
+
+
+def _set_counting(delta):
+    global _counting
+    with _counting_lock:
+        _counting += delta
+        counting = _counting > 0
+        _UniffiRustBuffer.alloc = staticmethod(_counted_alloc if counting else _alloc)
+        _UniffiRustBuffer.reserve = staticmethod(_counted_reserve if counting else _reserve)
+        _UniffiRustBuffer.from_bytes = staticmethod(
+            _counted_from_bytes if counting else _from_bytes
+        )
+
+
+@contextlib.contextmanager
+def count_allocations():
+    """
+    Context-manager counting the RustBuffer allocations made from the current thread.
+
+    Yields a RustBufferAllocations, updated as buffers are allocated (`allocations`,
+    `allocated_bytes`) or grown (`reserves`) on the Python side of the calls made within it.
+    Buffers allocated by the Rust library for results are not counted.
+    """
+    _set_counting(1)
+    previous = _counts.current
+    counts = _counts.current = RustBufferAllocations()
+    try:
+        yield counts
+    finally:
+        _counts.current = previous
+        _set_counting(-1)
+
+
+__all__ = [
+    "BufferPoolStats",
+    "RustBufferAllocations",
+    "buffer_pool_stats",
+    "count_allocations",
+    "use_buffer_pool",
+]
@@ -0,0 +1,264 @@
+import bisect
+import time as _time
+from array import array
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from ._internal.payment_plan_uniffi import (
+    _UniffiConverterTimestamp,
+    _UNIFFI_EPOCH,
+    _UNIFFI_TIMESTAMP_MODE,
+)
+from ._calls import (
+    disbursement_date_range as _disbursement_date_range,
+    get_non_business_days_between as _get_non_business_days_between,
+    next_disbursement_date as _next_disbursement_date,
+)
+
+# Calendar dates are returned at this time of day, 07:00 in Brasília.
+_DISBURSEMENT_TIME = time(10, 0, tzinfo=timezone.utc)
+
+_EPOCH_ORDINAL = _UNIFFI_EPOCH.date().toordinal()
+
+_SECONDS_PER_DAY = 24 * 3600
+
+_NANOSECONDS_PER_DAY = _SECONDS_PER_DAY * 1_000_000_000
+
+_DISBURSEMENT_NANOSECONDS = 10 * 3600 * 1_000_000_000
+
+
+class BusinessCalendar:
+    """
+    Pure Python index of the non-business days of a span of years.
+
+    The calendar is built once, with a single `get_non_business_days_between` call covering
+    the whole span, and then answers the disbursement date functions without crossing into
+    the Rust library. Results are identical to the module-level functions: dates are taken
+    in UTC, the disbursement day can't be the system's current (local) date, and every date
+    is returned at 07:00 in Brasília, as integer nanoseconds within `raw_timestamps()`.
+    Queries that reach outside of the span are delegated to the Rust library.
+
+    Args:
+        start_year (Optional[int]): First year of the span; defaults to last year.
+        end_year (Optional[int]): Last year of the span; defaults to ten years from now.
+    """
+
+    def __init__(self, start_year: Optional[int] = None, end_year: Optional[int] = None):
+        this_year = date.today().year
+        if start_year is None:
+            start_year = this_year - 1
+        if end_year is None:
+            end_year = this_year + 10
+        if end_year < start_year:
+            raise ValueError("end_year must not be before start_year")
+        self.start = date(start_year, 1, 1)
+        self.end = date(end_year, 12, 31)
+
+        self._first = self.start.toordinal()
+        size = self.end.toordinal() - self._first + 1
+        non_business = _get_non_business_days_between(
+            datetime.combine(self.start, _DISBURSEMENT_TIME),
+            datetime.combine(self.end, _DISBURSEMENT_TIME),
+        )
+        # Sorted ordinals of the non-business days, for range queries.
+        self._non_business = array("l", sorted(_ordinal(d) for d in non_business))
+        # `_business_before[i]` is the number of business days in the first `i` days of the
+        # span; it is non-decreasing, so the n-th business day can be found by bisection.
+        is_business = bytearray(b"\x01") * size
+        for ordinal in self._non_business:
+            is_business[ordinal - self._first] = 0
+        self._business_before = array("l", [0]) * (size + 1)
+        count = 0
+        for i, flag in enumerate(is_business):
+            count += flag
+            self._business_before[i + 1] = count
+
+    def is_business_day(self, day: date) -> bool:
+        """
+        Tells whether the given date, or the UTC date of the given datetime, is a business day.
+
+        Raises:
+            ValueError: If the date is outside of the calendar span.
+        """
+        index = self._index(_ordinal(day))
+        if index is None:
+            raise ValueError("{} is outside of the calendar span".format(day))
+        return self._business_before[index + 1] > self._business_before[index]
+
+    def next_disbursement_date(self, base_date: datetime) -> datetime:
+        """Same as `payment_plan.next_disbursement_date`."""
+        start = self._next_disbursement_index(base_date)
+        if start is None:
+            return _next_disbursement_date(base_date)
+        return self._datetime(start)
+
+    def disbursement_date_range(
+        self, base_date: datetime, days: int
+    ) -> Tuple[datetime, datetime]:
+        """Same as `payment_plan.disbursement_date_range`."""
+        start = self._next_disbursement_index(base_date)
+        end = None
+        if start is not None and 0 <= days < 2**32:
+            end = self._nth_business_index(start, max(days, 1))
+        if end is None:
+            result = _disbursement_date_range(base_date, days)
+            return result[0], result[1]
+        return self._datetime(start), self._datetime(end)
+
+    def get_non_business_days_between(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        """Same as `payment_plan.get_non_business_days_between`."""
+        start, end = _ordinal(start_date), _ordinal(end_date)
+        if start > end:
+            return []
+        if self._index(start) is None or self._index(end) is None:
+            return _get_non_business_days_between(start_date, end_date)
+        lo = bisect.bisect_left(self._non_business, start)
+        hi = bisect.bisect_right(self._non_business, end)
+        return [_disbursement_datetime(ordinal) for ordinal in self._non_business[lo:hi]]
+
+    def business_days_between(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        Counts the business days between the given start and end dates, both inclusive.
+
+        Args:
+            start_date (datetime): The start date of the range.
+            end_date (datetime): The end date of the range.
+
+        Returns:
+            int: The number of business days within the range.
+        """
+        start, end = _ordinal(start_date), _ordinal(end_date)
+        if start > end:
+            return 0
+        lo, hi = self._index(start), self._index(end)
+        if lo is None or hi is None:
+            return end - start + 1 - len(_get_non_business_days_between(start_date, end_date))
+        return self._business_before[hi + 1] - self._business_before[lo]
+
+    def _index(self, ordinal):
+        index = ordinal - self._first
+        if 0 <= index < len(self._business_before) - 1:
+            return index
+        return None
+
+    def _next_disbursement_index(self, base_date):
+        ordinal = _ordinal(base_date)
+        if ordinal == date.today().toordinal():
+            ordinal += 1
+        index = self._index(ordinal)
+        if index is None:
+            return None
+        return self._nth_business_index(index, 1)
+
+    def _nth_business_index(self, index, n):
+        # Index of the n-th business day (1-based) counting from `index`, if within the span.
+        target = self._business_before[index] + n
+        position = bisect.bisect_left(self._business_before, target)
+        if position == len(self._business_before):
+            return None
+        return position - 1
+
+    def _datetime(self, index):
+        return _disbursement_datetime(self._first + index)
+
+
+class DisbursementDateCache:
+    """
+    Memoizes `next_disbursement_date` and `disbursement_date_range` for the current day.
+
+    Both functions only depend on the UTC date of `base_date` (and on `days`) and on the
+    system's current date, since the disbursement day can't be the same day as the system
+    date. Results are therefore cached per (base date, days) and the whole cache is dropped
+    when the system's local date changes, i.e. at midnight in the timezone of the host
+    (Brasília time on hosts configured with it). Results returned within `raw_timestamps()`
+    are cached apart from the others.
+
+    Args:
+        calendar (Optional[BusinessCalendar]): Calendar used to compute missing entries;
+            by default they are computed by the Rust library.
+        max_entries (int): Number of cached results above which the cache is emptied.
+    """
+
+    def __init__(self, calendar: Optional[BusinessCalendar] = None, max_entries: int = 4096):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.calendar = calendar
+        self.max_entries = max_entries
+        self._entries = {}
+        self._expires_at = 0.0
+
+    def next_disbursement_date(self, base_date: datetime) -> datetime:
+        """Same as `payment_plan.next_disbursement_date`."""
+        entries = self._current_entries()
+        key = (_ordinal(base_date), None, _UNIFFI_TIMESTAMP_MODE.raw)
+        try:
+            return entries[key]
+        except KeyError:
+            pass
+        if self.calendar is not None:
+            result = self.calendar.next_disbursement_date(base_date)
+        else:
+            result = _next_disbursement_date(base_date)
+        self._store(entries, key, result)
+        return result
+
+    def disbursement_date_range(
+        self, base_date: datetime, days: int
+    ) -> Tuple[datetime, datetime]:
+        """Same as `payment_plan.disbursement_date_range`."""
+        entries = self._current_entries()
+        key = (_ordinal(base_date), days, _UNIFFI_TIMESTAMP_MODE.raw)
+        try:
+            return entries[key]
+        except KeyError:
+            pass
+        if self.calendar is not None:
+            result = self.calendar.disbursement_date_range(base_date, days)
+        else:
+            start, end = _disbursement_date_range(base_date, days)
+            result = (start, end)
+        self._store(entries, key, result)
+        return result
+
+    def clear(self) -> None:
+        self._entries = {}
+
+    def _current_entries(self):
+        now = _time.time()
+        if now >= self._expires_at:
+            # Roll over: the "not the same day as the system date" rule may now give other results.
+            today = date.fromtimestamp(now)
+            tomorrow = datetime.combine(today + timedelta(days=1), time())
+            self._entries = {}
+            self._expires_at = tomorrow.timestamp()
+        return self._entries
+
+    def _store(self, entries, key, result):
+        if len(entries) >= self.max_entries:
+            entries.clear()
+        entries[key] = result
+
+
+def _ordinal(value):
+    # Proleptic ordinal of the UTC date of a datetime, the way the Rust library reads it.
+    # Integers are timestamps decoded within `raw_timestamps()`.
+    if isinstance(value, int):
+        return _EPOCH_ORDINAL + value // _NANOSECONDS_PER_DAY
+    if not isinstance(value, datetime):
+        return value.toordinal()
+    seconds, _ = _UniffiConverterTimestamp.split(value)
+    return _EPOCH_ORDINAL + seconds // _SECONDS_PER_DAY
+
+
+def _disbursement_datetime(ordinal):
+    # The date at the disbursement time, decoded like the Rust library results are.
+    if _UNIFFI_TIMESTAMP_MODE.raw:
+        return (ordinal - _EPOCH_ORDINAL) * _NANOSECONDS_PER_DAY + _DISBURSEMENT_NANOSECONDS
+    return datetime.combine(date.fromordinal(ordinal), _DISBURSEMENT_TIME)
+
+
+__all__ = [
+    "BusinessCalendar",
+    "DisbursementDateCache",
+]
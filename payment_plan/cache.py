@@ -0,0 +1,139 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, NamedTuple, Optional
+from ._calls import _calculate_down_payment_plan_bytes, _calculate_payment_plan_bytes
+from ._internal.payment_plan_uniffi import (
+    InternalDownPaymentParams as DownPaymentParams,
+    InternalDownPaymentResponse as DownPaymentResponse,
+    InternalParams as Params,
+    InternalResponse as Response,
+    _UniffiConverterSequenceTypeInternalDownPaymentResponse,
+    _UniffiConverterSequenceTypeInternalResponse,
+)
+
+
+class CacheStats(NamedTuple):
+    """Point-in-time counters of a `PaymentPlanCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class PaymentPlanCache:
+    """
+    Bounded LRU cache around `calculate_payment_plan` and `calculate_down_payment_plan`.
+
+    Results are keyed on the frozen form of the params (see `Params.freeze`), so params that
+    compare equal share an entry no matter how their timestamps are expressed.
+    Results are kept in their encoded form and decoded again on every hit, which is much
+    cheaper than copying the decoded records: every call returns fresh objects the caller is
+    free to mutate, decoded as `payment_plan.raw_timestamps()` asks for at that call.
+    Failed calculations are not cached.
+
+    Args:
+        max_entries (Optional[int]): Maximum number of cached results, or None for no limit.
+        max_bytes (Optional[int]): Maximum estimated memory held by cached results, or None for no limit.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, bytes]
+        self._sizes = {}  # type: dict[Hashable, int]
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def calculate_payment_plan(self, params: Params) -> List[Response]:
+        """Cached `payment_plan.calculate_payment_plan`."""
+        return self._get_or_calculate(
+            (Params, params.freeze()),
+            _calculate_payment_plan_bytes,
+            _UniffiConverterSequenceTypeInternalResponse.lift_bytes,
+            params,
+        )
+
+    def calculate_down_payment_plan(
+        self, params: DownPaymentParams
+    ) -> List[DownPaymentResponse]:
+        """Cached `payment_plan.calculate_down_payment_plan`."""
+        return self._get_or_calculate(
+            (DownPaymentParams, params.freeze()),
+            _calculate_down_payment_plan_bytes,
+            _UniffiConverterSequenceTypeInternalDownPaymentResponse.lift_bytes,
+            params,
+        )
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached result; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_or_calculate(self, key, calculate, lift, params):
+        with self._lock:
+            try:
+                data = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                data = None
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if data is not None:
+            return lift(data)
+
+        # Calculate outside the lock; concurrent misses on one key just store it twice.
+        data = calculate(params)
+        size = sys.getsizeof(data)
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._sizes[key]
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._size_bytes += size
+            self._evict()
+        return lift(data)
+
+    def _evict(self):
+        # The entry just stored is never evicted, even when it alone exceeds max_bytes.
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._size_bytes > self.max_bytes)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self._size_bytes -= self._sizes.pop(key)
+            self._evictions += 1
+
+
+__all__ = [
+    "CacheStats",
+    "PaymentPlanCache",
+]
@@ -0,0 +1,308 @@
+"""
+NumPy columnar versions of `calculate_payment_plan`.
+
+Requires NumPy, which is an optional dependency (`pip install payment-plan-python-sdk[numpy]`).
+
+Results are decoded from the encoded plan list straight into NumPy arrays, without building
+Response or Invoice objects:
+
+- a plans table, with one row per plan and a column per Response field (timestamps as
+  `datetime64[ns]`), plus `params_index`, `invoice_start` and `invoice_count`;
+- an invoices table, with one row per invoice and a column per Invoice field, plus `plan`,
+  the row of the plans table the invoice belongs to. The invoices of plan `i` are the rows
+  `invoice_start[i]:invoice_start[i] + invoice_count[i]`.
+"""
+
+import functools
+import os
+from typing import Dict, Iterable, NamedTuple, Optional, Union
+from ._internal.payment_plan_uniffi import (
+    InternalError,
+    InternalParams as Params,
+)
+from ._calls import _VALIDATION_MODE, _calculate_payment_plan_bytes
+from .batch import _ITEM_ERRORS, _TASKS_PER_WORKER, _executor, _run_many
+from .responses import LazyResponses
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "payment_plan.columnar requires NumPy; install it with "
+        "`pip install payment-plan-python-sdk[numpy]`"
+    ) from e
+
+_TIMESTAMP_FIELDS = ("due_date", "disbursement_date")
+
+_RESPONSE_DOUBLE_FIELDS = (
+    "days_index",
+    "accumulated_days_index",
+    "interest_rate",
+    "installment_amount",
+    "installment_amount_without_tac",
+    "total_amount",
+    "debit_service",
+    "customer_debit_service_amount",
+    "customer_amount",
+    "calculation_basis_for_effective_interest_rate",
+    "merchant_debit_service_amount",
+    "merchant_total_amount",
+    "settled_to_merchant",
+    "mdr_amount",
+    "effective_interest_rate",
+    "total_effective_cost",
+    "eir_yearly",
+    "tec_yearly",
+    "eir_monthly",
+    "tec_monthly",
+    "total_iof",
+    "contract_amount",
+    "contract_amount_without_tac",
+    "tac_amount",
+    "iof_percentage",
+    "overall_iof",
+    "pre_disbursement_amount",
+    "paid_total_iof",
+    "paid_contract_amount",
+)
+
+_INVOICE_DOUBLE_FIELDS = ("factor", "accumulated_factor", "main_iof_tac", "debit_service")
+
+# Wire layouts: big-endian and packed, exactly as the Rust library writes them.
+_WIRE_RESPONSE_HEAD = np.dtype(
+    [
+        ("installment", ">u4"),
+        ("due_date_seconds", ">i8"),
+        ("due_date_nanoseconds", ">u4"),
+        ("disbursement_date_seconds", ">i8"),
+        ("disbursement_date_nanoseconds", ">u4"),
+        ("accumulated_days", ">i8"),
+    ]
+    + [(name, ">f8") for name in _RESPONSE_DOUBLE_FIELDS]
+    + [("invoice_count", ">i4")]
+)
+
+_WIRE_INVOICE = np.dtype(
+    [("accumulated_days", ">i8")]
+    + [(name, ">f8") for name in _INVOICE_DOUBLE_FIELDS]
+    + [("due_date_seconds", ">i8"), ("due_date_nanoseconds", ">u4")]
+)
+
+PLAN_DTYPE = np.dtype(
+    [
+        ("params_index", np.int64),
+        ("installment", np.uint32),
+        ("due_date", "datetime64[ns]"),
+        ("disbursement_date", "datetime64[ns]"),
+        ("accumulated_days", np.int64),
+    ]
+    + [(name, np.float64) for name in _RESPONSE_DOUBLE_FIELDS]
+    + [("invoice_start", np.int64), ("invoice_count", np.int64)]
+)
+
+INVOICE_DTYPE = np.dtype(
+    [("plan", np.int64), ("accumulated_days", np.int64)]
+    + [(name, np.float64) for name in _INVOICE_DOUBLE_FIELDS]
+    + [("due_date", "datetime64[ns]")]
+)
+
+
+class ColumnarPlans(NamedTuple):
+    """
+    Plans and invoices tables of a columnar calculation.
+
+    Each table is a structured array, or a dict of contiguous column arrays with `as_columns=True`.
+    """
+
+    plans: Union["np.ndarray", Dict[str, "np.ndarray"]]
+    invoices: Union["np.ndarray", Dict[str, "np.ndarray"]]
+
+
+class ColumnarBatch(NamedTuple):
+    """
+    Tables of a columnar batch calculation.
+
+    `params_index` in the plans table tells which params each plan was calculated for.
+    Params that failed with `Error.InvalidParams`, `Error.CalculationError` or a validation
+    error (TypeError/ValueError) have no rows; their error is in `errors`, keyed by index.
+    """
+
+    plans: Union["np.ndarray", Dict[str, "np.ndarray"]]
+    invoices: Union["np.ndarray", Dict[str, "np.ndarray"]]
+    errors: Dict[int, Exception]
+
+
+def calculate_payment_plan_columnar(
+    params: Params, as_columns: bool = False
+) -> ColumnarPlans:
+    """
+    Calculates the payment plans of the given params into NumPy tables.
+
+    Args:
+        params (Params): The params to calculate the payment plans for.
+        as_columns (bool): Return dicts of column arrays instead of structured arrays.
+
+    Returns:
+        ColumnarPlans: The plans and invoices tables.
+    """
+    table = _Table(0, 0)
+    table.append(0, _calculate_payment_plan_bytes(params))
+    plans, invoices = table.finish(as_columns)
+    return ColumnarPlans(plans, invoices)
+
+
+def calculate_payment_plan_columnar_many(
+    params_iterable: Iterable[Params],
+    max_workers: Optional[int] = None,
+    as_columns: bool = False,
+) -> ColumnarBatch:
+    """
+    Calculates the payment plans of many params into a single pair of NumPy tables.
+
+    The calculations run on the thread pool of `payment_plan.calculate_payment_plan_many`,
+    which consumes the input lazily with a few tasks per worker in flight. Results are
+    decoded in input order into one pair of arrays, reserved from the requested number of
+    installments of each params as they are read.
+
+    Args:
+        params_iterable (Iterable[Params]): The params to calculate the payment plans for.
+        max_workers (Optional[int]): Number of worker threads; defaults to the number of CPUs.
+        as_columns (bool): Return dicts of column arrays instead of structured arrays.
+
+    Returns:
+        ColumnarBatch: The plans and invoices tables of every params, and the failed ones.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    table = _Table(0, 0)
+    plan_capacity = invoice_capacity = 0
+
+    def items():
+        nonlocal plan_capacity, invoice_capacity
+        # There is at most one plan per installment count, and plan k has k invoices.
+        for index, params in enumerate(params_iterable):
+            installments = getattr(params, "installments", 0)
+            if isinstance(installments, int) and installments > 0:
+                plan_capacity += installments
+                invoice_capacity += installments * (installments + 1) // 2
+                table.reserve(plan_capacity, invoice_capacity)
+            yield index, params
+
+    errors = {}
+    # trusted_inputs() doesn't reach the worker threads by itself.
+    task = functools.partial(_calculate_bytes, trusted=_VALIDATION_MODE.trusted)
+    for index, data, error in _run_many(
+        _executor(max_workers), items(), max_workers * _TASKS_PER_WORKER, True, task
+    ):
+        if error is not None:
+            errors[index] = error
+        else:
+            table.append(index, data)
+    plans, invoices = table.finish(as_columns)
+    return ColumnarBatch(plans, invoices, errors)
+
+
+def _calculate_bytes(index, params, trusted=False):
+    try:
+        return index, _calculate_payment_plan_bytes(params, trusted), None
+    except _ITEM_ERRORS as e:
+        return index, None, e
+
+
+class _Table:
+    # Plans and invoices arrays filled one encoded plan list at a time, grown if they fill up.
+
+    def __init__(self, plan_capacity, invoice_capacity):
+        self.plans = np.zeros(plan_capacity, dtype=PLAN_DTYPE)
+        self.invoices = np.zeros(invoice_capacity, dtype=INVOICE_DTYPE)
+        self.plan_count = 0
+        self.invoice_count = 0
+
+    def append(self, params_index, data):
+        offsets = LazyResponses._index(data)
+        head_size = _WIRE_RESPONSE_HEAD.itemsize
+        heads = np.frombuffer(
+            b"".join(data[offset : offset + head_size] for offset in offsets),
+            dtype=_WIRE_RESPONSE_HEAD,
+        )
+        invoice_counts = heads["invoice_count"].astype(np.int64)
+        invoice_total = int(invoice_counts.sum())
+        invoices = np.frombuffer(
+            b"".join(
+                data[offset + head_size : offset + head_size + count * _WIRE_INVOICE.itemsize]
+                for offset, count in zip(offsets, invoice_counts.tolist())
+            ),
+            dtype=_WIRE_INVOICE,
+        )
+        if len(invoices) != invoice_total:
+            raise InternalError("read past end of rust buffer")
+
+        start, stop = self.plan_count, self.plan_count + len(heads)
+        invoice_start = self.invoice_count
+        invoice_stop = invoice_start + invoice_total
+        self.reserve(stop, invoice_stop)
+
+        plans = self.plans[start:stop]
+        plans["params_index"] = params_index
+        plans["installment"] = heads["installment"]
+        for name in _TIMESTAMP_FIELDS:
+            plans[name] = _datetime64(heads, name)
+        plans["accumulated_days"] = heads["accumulated_days"]
+        for name in _RESPONSE_DOUBLE_FIELDS:
+            plans[name] = heads[name]
+        plans["invoice_count"] = invoice_counts
+        plans["invoice_start"] = invoice_start + np.cumsum(invoice_counts) - invoice_counts
+
+        rows = self.invoices[invoice_start:invoice_stop]
+        rows["plan"] = np.repeat(np.arange(start, stop, dtype=np.int64), invoice_counts)
+        rows["accumulated_days"] = invoices["accumulated_days"]
+        for name in _INVOICE_DOUBLE_FIELDS:
+            rows[name] = invoices[name]
+        rows["due_date"] = _datetime64(invoices, "due_date")
+
+        self.plan_count = stop
+        self.invoice_count = invoice_stop
+
+    def finish(self, as_columns):
+        plans = self.plans[: self.plan_count]
+        invoices = self.invoices[: self.invoice_count]
+        if as_columns:
+            return _columns(plans), _columns(invoices)
+        return plans, invoices
+
+    def reserve(self, plans, invoices):
+        if plans > len(self.plans):
+            self.plans = _grow(self.plans, plans)
+        if invoices > len(self.invoices):
+            self.invoices = _grow(self.invoices, invoices)
+
+
+def _grow(array, needed):
+    grown = np.zeros(max(needed, 2 * len(array)), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _datetime64(wire, name):
+    # A negative seconds count means the nanoseconds also count back from the epoch.
+    seconds = wire[name + "_seconds"].astype(np.int64)
+    nanoseconds = wire[name + "_nanoseconds"].astype(np.int64)
+    nanoseconds = np.where(seconds >= 0, nanoseconds, -nanoseconds)
+    return (seconds * 1_000_000_000 + nanoseconds).view("datetime64[ns]")
+
+
+def _columns(table):
+    return {name: np.ascontiguousarray(table[name]) for name in table.dtype.names}
+
+
+__all__ = [
+    "ColumnarBatch",
+    "ColumnarPlans",
+    "INVOICE_DTYPE",
+    "PLAN_DTYPE",
+    "calculate_payment_plan_columnar",
+    "calculate_payment_plan_columnar_many",
+]
@@ -0,0 +1,292 @@
+"""
+In-process metrics of the payment plan functions.
+
+A MetricsRegistry counts the calls and errors of `calculate_payment_plan`,
+`calculate_down_payment_plan`, `next_disbursement_date`, `disbursement_date_range` and
+`get_non_business_days_between`, and keeps latency histograms of each call and of each of
+its phases (see `payment_plan.instrumentation`). It is fed by a timing hook, so it costs
+nothing until enabled.
+
+Example:
+    from payment_plan.metrics import REGISTRY
+
+    REGISTRY.enable()
+    ...
+    text = REGISTRY.to_prometheus()
+"""
+
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from ._internal.payment_plan_uniffi import Error, InternalError
+from .instrumentation import CallTiming, add_hook, remove_hook
+
+PHASES = ("check", "lower", "call", "lift")
+
+ERROR_KINDS = ("invalid_params", "calculation_error", "internal_error", "other")
+
+_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class HistogramSnapshot(NamedTuple):
+    """
+    Point-in-time copy of a LatencyHistogram, in seconds.
+
+    `buckets` holds the (upper bound, count) of every non-empty bucket, in increasing order.
+    """
+
+    count: int
+    sum: float
+    min: Optional[float]
+    max: Optional[float]
+    buckets: List[Tuple[float, int]]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the `q` quantile, or None if nothing was recorded."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for upper_bound, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return min(upper_bound, self.max)
+        return self.max
+
+
+class LatencyHistogram:
+    """
+    Log-linear (HDR-style) histogram of durations, recorded with nanosecond resolution.
+
+    Each power of two is split into `2 ** (precision_bits - 1)` equal buckets, so recorded
+    values are kept with a relative error below `2 ** (1 - precision_bits)`: about 3% for
+    the default of 6 bits, whatever the magnitude. Not thread-safe on its own.
+    """
+
+    def __init__(self, precision_bits: int = 6):
+        if not 1 <= precision_bits <= 16:
+            raise ValueError("precision_bits must be between 1 and 16")
+        self.precision_bits = precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self._counts = {}  # type: Dict[int, int]
+        self.count = 0
+        self._sum = 0
+        self._min = None  # type: Optional[int]
+        self._max = None  # type: Optional[int]
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1e9))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.count,
+            sum=self._sum / 1e9,
+            min=None if self._min is None else self._min / 1e9,
+            max=None if self._max is None else self._max / 1e9,
+            buckets=[
+                (self._upper_bound(index) / 1e9, self._counts[index])
+                for index in sorted(self._counts)
+            ],
+        )
+
+    def _index(self, value):
+        # Values below 2**precision_bits get a bucket each; above, every power of two gets
+        # `_half` buckets, indexed by the leading `precision_bits` bits of the value.
+        shift = max(0, value.bit_length() - self.precision_bits)
+        return shift * self._half + (value >> shift)
+
+    def _upper_bound(self, index):
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return ((mantissa + 1) << shift) - 1
+
+
+class FunctionMetrics(NamedTuple):
+    """Point-in-time metrics of one function."""
+
+    calls: int
+    errors: Dict[str, int]
+    latency: HistogramSnapshot
+    phases: Dict[str, HistogramSnapshot]
+    plans: int
+    invoices: int
+
+
+class _FunctionStats:
+    def __init__(self, precision_bits):
+        self.calls = 0
+        self.errors = dict.fromkeys(ERROR_KINDS, 0)
+        self.latency = LatencyHistogram(precision_bits)
+        self.phases = {phase: LatencyHistogram(precision_bits) for phase in PHASES}
+        self.plans = 0
+        self.invoices = 0
+
+    def record(self, timing):
+        self.calls += 1
+        if timing.error is not None:
+            self.errors[_error_kind(timing.error)] += 1
+        self.latency.record(timing.total_seconds)
+        for phase, duration in zip(
+            PHASES,
+            (timing.check_seconds, timing.lower_seconds, timing.call_seconds, timing.lift_seconds),
+        ):
+            if duration is not None:
+                self.phases[phase].record(duration)
+        self.plans += timing.plans
+        self.invoices += timing.invoices
+
+    def snapshot(self):
+        return FunctionMetrics(
+            calls=self.calls,
+            errors=dict(self.errors),
+            latency=self.latency.snapshot(),
+            phases={phase: histogram.snapshot() for phase, histogram in self.phases.items()},
+            plans=self.plans,
+            invoices=self.invoices,
+        )
+
+
+class MetricsRegistry:
+    """
+    Counters and latency histograms of the payment plan functions, keyed by function name.
+
+    Args:
+        precision_bits (int): Precision of the histograms; see LatencyHistogram.
+    """
+
+    def __init__(self, precision_bits: int = 6):
+        self.precision_bits = precision_bits
+        self._functions = {}  # type: Dict[str, _FunctionStats]
+        self._lock = threading.Lock()
+        self._enabled = False
+
+    def enable(self) -> None:
+        """Start recording the calls made from now on."""
+        with self._lock:
+            if self._enabled:
+                return
+            self._enabled = True
+        add_hook(self.record)
+
+    def disable(self) -> None:
+        """Stop recording; what was recorded so far is kept."""
+        with self._lock:
+            if not self._enabled:
+                return
+            self._enabled = False
+        remove_hook(self.record)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def record(self, timing: CallTiming) -> None:
+        """Record one call; this is the hook registered by `enable()`."""
+        with self._lock:
+            stats = self._functions.get(timing.function)
+            if stats is None:
+                stats = self._functions[timing.function] = _FunctionStats(self.precision_bits)
+            stats.record(timing)
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._functions.clear()
+
+    def snapshot(self) -> Dict[str, FunctionMetrics]:
+        """Metrics of every function called so far, by function name."""
+        with self._lock:
+            return {name: stats.snapshot() for name, stats in self._functions.items()}
+
+    def to_prometheus(self, prefix: str = "payment_plan") -> str:
+        """
+        Render a snapshot in the Prometheus text exposition format.
+
+        Latencies are exported as summaries, with the 0.5, 0.9, 0.99 and 0.999 quantiles.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append("# HELP {}_{} {}".format(prefix, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+
+        def sample(name, labels, value):
+            rendered = ",".join('{}="{}"'.format(key, val) for key, val in labels)
+            lines.append("{}_{}{{{}}} {}".format(prefix, name, rendered, _format_value(value)))
+
+        def summary(name, labels, histogram):
+            for q in _QUANTILES:
+                value = histogram.quantile(q)
+                sample(name, labels + (("quantile", q),), float("nan") if value is None else value)
+            sample(name + "_sum", labels, histogram.sum)
+            sample(name + "_count", labels, histogram.count)
+
+        metric("calls_total", "counter", "Calls of each payment plan function.")
+        for function, metrics in sorted(snapshot.items()):
+            sample("calls_total", (("function", function),), metrics.calls)
+        metric("errors_total", "counter", "Failed calls of each payment plan function, by error kind.")
+        for function, metrics in sorted(snapshot.items()):
+            for kind in ERROR_KINDS:
+                sample("errors_total", (("function", function), ("error", kind)), metrics.errors[kind])
+        metric("decoded_plans_total", "counter", "Plans decoded by each payment plan function.")
+        for function, metrics in sorted(snapshot.items()):
+            sample("decoded_plans_total", (("function", function),), metrics.plans)
+        metric("decoded_invoices_total", "counter", "Invoices decoded by each payment plan function.")
+        for function, metrics in sorted(snapshot.items()):
+            sample("decoded_invoices_total", (("function", function),), metrics.invoices)
+        metric("latency_seconds", "summary", "Latency of each payment plan function.")
+        for function, metrics in sorted(snapshot.items()):
+            summary("latency_seconds", (("function", function),), metrics.latency)
+        metric("phase_latency_seconds", "summary", "Latency of each phase of the payment plan functions.")
+        for function, metrics in sorted(snapshot.items()):
+            for phase in PHASES:
+                summary(
+                    "phase_latency_seconds",
+                    (("function", function), ("phase", phase)),
+                    metrics.phases[phase],
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _error_kind(error):
+    if isinstance(error, Error.InvalidParams):
+        return "invalid_params"
+    if isinstance(error, Error.CalculationError):
+        return "calculation_error"
+    if isinstance(error, InternalError):
+        return "internal_error"
+    return "other"
+
+
+def _format_value(value):
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+
+__all__ = [
+    "ERROR_KINDS",
+    "FunctionMetrics",
+    "HistogramSnapshot",
+    "LatencyHistogram",
+    "MetricsRegistry",
+    "PHASES",
+    "REGISTRY",
+]
@@ -0,0 +1,120 @@
+"""
+Immutable, hashable variants of the params records.
+
+`Params.freeze()` and `DownPaymentParams.freeze()` return a FrozenParams or a
+FrozenDownPaymentParams: a copy that can't be modified and hashes on the fields `__eq__`
+compares, with timestamps normalized to their wire value, so that equal params can key a
+cache no matter how their timestamps are expressed. Frozen params are accepted wherever
+params are.
+"""
+
+from ._internal.payment_plan_uniffi import (
+    InternalDownPaymentParams as DownPaymentParams,
+    InternalParams as Params,
+    _UniffiConverterTimestamp,
+)
+
+
+def _build_record(cls, fields):
+    # Unpickles records whose attributes can't be restored one at a time.
+    return cls(**fields)
+
+
+def _params_key(params):
+    return (
+        params.requested_amount,
+        _UniffiConverterTimestamp.split(params.first_payment_date),
+        _UniffiConverterTimestamp.split(params.disbursement_date),
+        params.installments,
+        params.debit_service_percentage,
+        params.mdr,
+        params.tac_percentage,
+        params.iof_overall,
+        params.iof_percentage,
+        params.interest_rate,
+        params.min_installment_amount,
+        params.max_total_amount,
+        params.disbursement_only_on_business_days,
+        params.min_installments,
+    )
+
+
+def _down_payment_params_key(params):
+    return (
+        _params_key(params.params),
+        params.requested_amount,
+        params.min_installment_amount,
+        _UniffiConverterTimestamp.split(params.first_payment_date),
+        params.installments,
+    )
+
+
+class _Frozen:
+    # Makes a record immutable once `_hash` is set, at the end of __init__.
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_hash"):
+            raise AttributeError("{} is immutable".format(type(self).__name__))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __hash__(self):
+        return self._hash
+
+    def freeze(self):
+        return self
+
+
+class FrozenParams(_Frozen, Params):
+    """Immutable `Params` that can be hashed; see `Params.freeze`."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_hash", hash(_params_key(self)))
+
+    def __reduce__(self):
+        return (_build_record, (type(self), {name: getattr(self, name) for name in Params.__slots__}))
+
+
+class FrozenDownPaymentParams(_Frozen, DownPaymentParams):
+    """Immutable `DownPaymentParams` that can be hashed; see `DownPaymentParams.freeze`."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, *, params: Params, **kwargs):
+        super().__init__(params=params.freeze(), **kwargs)
+        object.__setattr__(self, "_hash", hash(_down_payment_params_key(self)))
+
+    def __reduce__(self):
+        return (
+            _build_record,
+            (type(self), {name: getattr(self, name) for name in DownPaymentParams.__slots__}),
+        )
+
+
+def _freeze_params(self):
+    """Return an immutable, hashable copy of these params, suitable as a cache key."""
+    return FrozenParams(**{name: getattr(self, name) for name in Params.__slots__})
+
+
+def _freeze_down_payment_params(self):
+    """Return an immutable, hashable copy of these params, with `params` frozen as well."""
+    return FrozenDownPaymentParams(
+        **{name: getattr(self, name) for name in DownPaymentParams.__slots__}
+    )
+
+
+# The generated records can't be edited, so `freeze` is added to them here.
+Params.freeze = _freeze_params
+DownPaymentParams.freeze = _freeze_down_payment_params
+
+
+__all__ = [
+    "FrozenDownPaymentParams",
+    "FrozenParams",
+]
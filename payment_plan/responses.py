@@ -0,0 +1,289 @@
+"""
+Alternative decodings of the plan list returned by `calculate_payment_plan`.
+
+- ResponseProjection (`fields`, `include_invoices=False`): a Response holding only some of
+  its fields, decoded with a single unpack per plan;
+- LazyResponses (`lazy=True`): a sequence of ResponseView over one copy of the encoded plan
+  list, decoding each field or invoice list only when it is read.
+"""
+
+import collections.abc
+import functools
+import struct
+from typing import List
+from ._internal.payment_plan_uniffi import (
+    InternalError,
+    InternalInvoice as Invoice,
+    InternalResponse as Response,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeInternalInvoice,
+    _UniffiConverterTypeInternalResponse,
+    _UniffiRustBufferStream,
+    _UNIFFI_TIMESTAMP_MODE,
+)
+from .records import _build_record
+
+_I32 = _UniffiRustBufferStream._I32
+
+# Names of the fixed-width Response fields, i.e. all of them but `invoices`.
+_HEAD_FIELDS = Response.__slots__[:-1]
+
+# Wire format of every field of the fixed-width head, in order.
+_FIELD_FORMATS = (
+    ("installment", "I"),
+    ("due_date", _UniffiConverterTimestamp.FORMAT),
+    ("disbursement_date", _UniffiConverterTimestamp.FORMAT),
+    ("accumulated_days", "q"),
+) + tuple((name, "d") for name in _HEAD_FIELDS[4:])
+
+
+class ResponseProjection:
+    """
+    A light Response holding only some of its fields.
+
+    Fields that weren't projected are not set, so reading them raises AttributeError.
+    `fields` lists the projected field names, in declaration order.
+    """
+
+    __slots__ = ("fields",) + Response.__slots__
+
+    def __init__(self, **fields):
+        self.fields = tuple(name for name in Response.__slots__ if name in fields)
+        if len(self.fields) != len(fields):
+            unknown = sorted(set(fields) - set(self.fields))
+            raise TypeError("unknown Response fields: {}".format(", ".join(unknown)))
+        for name in self.fields:
+            setattr(self, name, fields[name])
+
+    def __str__(self):
+        return "ResponseProjection({})".format(
+            ", ".join("{}={}".format(name, getattr(self, name)) for name in self.fields)
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ResponseProjection) or self.fields != other.fields:
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self.fields)
+
+    def __reduce__(self):
+        return (_build_record, (type(self), {name: getattr(self, name) for name in self.fields}))
+
+
+class _Projection:
+    # Decodes the projected fields of a Response with a single unpack, using pad bytes to
+    # step over the other fields, and skips the invoices unless they are wanted.
+
+    def __init__(self, fields, include_invoices):
+        formats = []
+        # (name, is_timestamp) of each projected field, in wire order.
+        self.steps = []
+        for name, fmt in _FIELD_FORMATS:
+            if name in fields:
+                formats.append(fmt)
+                self.steps.append((name, fmt == _UniffiConverterTimestamp.FORMAT))
+            else:
+                formats.append("{}x".format(struct.calcsize(">" + fmt)))
+        # The invoice count is always read, to find where the next response starts.
+        self.head = struct.Struct(">" + "".join(formats) + "i")
+        self.include_invoices = include_invoices
+        self.fields = tuple(name for name, _ in self.steps) + (
+            ("invoices",) if include_invoices else ()
+        )
+
+    def read_list(self, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+        return [self.read(buf) for _ in range(count)]
+
+    def read(self, buf):
+        values = buf.read_struct(self.head)
+        invoice_count = values[-1]
+        if invoice_count < 0:
+            raise InternalError("Unexpected negative sequence length")
+        record = object.__new__(ResponseProjection)
+        record.fields = self.fields
+        # Timestamps take two wire values, so values and fields drift apart by one per timestamp.
+        position = 0
+        for name, is_timestamp in self.steps:
+            if is_timestamp:
+                value = _UniffiConverterTimestamp.read_parts(
+                    buf, values[position], values[position + 1]
+                )
+                position += 2
+            else:
+                value = values[position]
+                position += 1
+            setattr(record, name, value)
+        invoice_size = _UniffiConverterTypeInternalInvoice._STRUCT.size * invoice_count
+        if self.include_invoices:
+            record.invoices = [
+                _UniffiConverterTypeInternalInvoice.from_values(buf, invoice_values)
+                for invoice_values in buf.read_records(
+                    _UniffiConverterTypeInternalInvoice._STRUCT, invoice_count
+                )
+            ]
+        elif buf.offset + invoice_size > buf.len:
+            raise InternalError("read past end of rust buffer")
+        else:
+            buf.offset += invoice_size
+        return record
+
+
+def _projection(fields, include_invoices):
+    # The projection decoding `fields` (None for all of them), validated and shared by every
+    # call asking for the same set of fields, whatever their order.
+    if isinstance(fields, str):
+        raise TypeError("fields must be a collection of field names, not a string")
+    fields = _HEAD_FIELDS if fields is None else tuple(sorted(set(fields)))
+    return _compiled_projection(fields, bool(include_invoices))
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_projection(fields, include_invoices):
+    unknown = sorted(set(fields) - set(_HEAD_FIELDS))
+    if unknown:
+        if "invoices" in unknown:
+            raise ValueError("invoices are projected with include_invoices=True, not through fields")
+        raise ValueError("unknown Response fields: {}".format(", ".join(unknown)))
+    return _Projection(frozenset(fields), include_invoices)
+
+
+class ResponseView:
+    """
+    Read-only Response backed by the encoded result of `calculate_payment_plan(lazy=True)`.
+
+    Each field is decoded from the buffer when it is read; the invoice list is decoded on
+    first access and then kept, once with datetimes and once within `raw_timestamps()`. `to_response()` decodes the whole Response.
+    """
+
+    __slots__ = ("_plans", "_offset", "_invoices")
+
+    def __init__(self, plans, offset):
+        self._plans = plans
+        self._offset = offset
+        # The decoded invoice lists, with datetimes and with raw timestamps.
+        self._invoices = [None, None]
+
+    @property
+    def invoices(self) -> List[Invoice]:
+        raw = bool(_UNIFFI_TIMESTAMP_MODE.raw)
+        invoices = self._invoices[raw]
+        if invoices is None:
+            invoice_struct = _UniffiConverterTypeInternalInvoice._STRUCT
+            start = self._offset + _UniffiConverterTypeInternalResponse._HEAD.size
+            end = start + invoice_struct.size * self._invoice_count()
+            invoices = self._invoices[raw] = [
+                _UniffiConverterTypeInternalInvoice.from_values(self._plans, values)
+                for values in invoice_struct.iter_unpack(self._plans.data[start:end])
+            ]
+        return invoices
+
+    def to_response(self) -> Response:
+        stream = _UniffiRustBufferStream(self._plans.data, len(self._plans.data))
+        stream.offset = self._offset
+        stream.timestamps = self._plans.timestamps
+        return _UniffiConverterTypeInternalResponse.read(stream)
+
+    def __str__(self):
+        return "ResponseView(installment={})".format(self.installment)
+
+    def _invoice_count(self):
+        return _I32.unpack_from(
+            self._plans.data, self._offset + _UniffiConverterTypeInternalResponse._HEAD.size - 4
+        )[0]
+
+
+def _view_field(offset, fmt):
+    # Property decoding one fixed-width field, `offset` bytes into the response.
+    field_struct = struct.Struct(">" + fmt)
+    if fmt == _UniffiConverterTimestamp.FORMAT:
+
+        def get(self):
+            seconds, nanoseconds = field_struct.unpack_from(self._plans.data, self._offset + offset)
+            return _UniffiConverterTimestamp.read_parts(self._plans, seconds, nanoseconds)
+
+    else:
+
+        def get(self):
+            return field_struct.unpack_from(self._plans.data, self._offset + offset)[0]
+
+    return property(get)
+
+
+def _add_view_fields():
+    offset = 0
+    for name, fmt in _FIELD_FORMATS:
+        setattr(ResponseView, name, _view_field(offset, fmt))
+        offset += struct.calcsize(">" + fmt)
+
+
+_add_view_fields()
+
+
+class LazyResponses(collections.abc.Sequence):
+    """
+    Sequence of ResponseView over a single copy of an encoded plan list.
+
+    Building it only indexes where each response starts; nothing is decoded until read.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        # Timestamps decoded so far as datetimes and as raw integers, shared by every view.
+        self._timestamps = ({}, {})
+        self._offsets = self._index(data)
+        self._views = [None] * len(self._offsets)
+
+    @property
+    def timestamps(self):
+        # The table `_UniffiConverterTimestamp.read_parts` interns timestamps into, for the
+        # current `raw_timestamps()` mode, since views may be read in and out of it.
+        return self._timestamps[bool(_UNIFFI_TIMESTAMP_MODE.raw)]
+
+    @staticmethod
+    def _index(data):
+        head_size = _UniffiConverterTypeInternalResponse._HEAD.size
+        invoice_size = _UniffiConverterTypeInternalInvoice._STRUCT.size
+        if len(data) < _I32.size:
+            raise InternalError("read past end of rust buffer")
+        count = _I32.unpack_from(data, 0)[0]
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+        offsets = []
+        offset = _I32.size
+        for _ in range(count):
+            if offset + head_size > len(data):
+                raise InternalError("read past end of rust buffer")
+            invoice_count = _I32.unpack_from(data, offset + head_size - _I32.size)[0]
+            if invoice_count < 0:
+                raise InternalError("Unexpected negative sequence length")
+            offsets.append(offset)
+            offset += head_size + invoice_size * invoice_count
+        if offset != len(data):
+            raise InternalError(
+                "read past end of rust buffer" if offset > len(data) else "junk data left in buffer"
+            )
+        return offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        view = self._views[index]
+        if view is None:
+            view = self._views[index] = ResponseView(self, self._offsets[index])
+        return view
+
+    def to_list(self) -> List[Response]:
+        """Decode every response, as `calculate_payment_plan` without `lazy` would return them."""
+        return [view.to_response() for view in self]
+
+
+__all__ = [
+    "LazyResponses",
+    "ResponseProjection",
+    "ResponseView",
+]
@@ -0,0 +1,258 @@
+import ctypes
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Union
+from ._internal.payment_plan_uniffi import (
+    InternalError,
+    InternalDownPaymentParams as DownPaymentParams,
+    InternalDownPaymentResponse as DownPaymentResponse,
+    InternalParams as Params,
+    InternalResponse as Response,
+    _UniffiConverterBool,
+    _UniffiConverterDouble,
+    _UniffiConverterSequenceTypeInternalDownPaymentResponse,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeInternalDownPaymentParams,
+    _UniffiConverterTypeInternalParams,
+    _UniffiConverterUInt16,
+    _UniffiConverterUInt32,
+    _UniffiRustBuffer,
+)
+from ._calls import (
+    _VALIDATION_MODE,
+    _calculate_down_payment_plan_call,
+    _calculate_payment_plan_call,
+    _payment_plan_lifter,
+)
+from . import instrumentation
+from .instrumentation import _call
+from .responses import LazyResponses, ResponseProjection
+
+# Converter of the fixed-width fields, by wire format.
+_CONVERTERS = (
+    (_UniffiConverterTimestamp.FORMAT, _UniffiConverterTimestamp),
+    ("d", _UniffiConverterDouble),
+    ("I", _UniffiConverterUInt32),
+    ("H", _UniffiConverterUInt16),
+    ("B", _UniffiConverterBool),
+)
+
+
+def _fields(names, fmt):
+    # Splits the wire format of a record, as packed by its converter, into the
+    # (name, fmt, converter) of each of its fields `names`, in declaration order.
+    fields = []
+    for name in names:
+        for field_fmt, converter in _CONVERTERS:
+            if fmt.startswith(field_fmt):
+                break
+        else:
+            raise InternalError("can't lay out field {!r} from format {!r}".format(name, fmt))
+        fields.append((name, field_fmt, converter))
+        fmt = fmt[len(field_fmt):]
+    if fmt:
+        raise InternalError("format {!r} left over after the last field".format(fmt))
+    return tuple(fields)
+
+
+# Every fixed-width field, in wire order; `min_installments` is laid out by _params_layout.
+_PARAMS_FIELDS = _fields(Params.__slots__[:-1], _UniffiConverterTypeInternalParams.FORMAT)
+
+# The fixed-width fields that follow the nested params.
+_DOWN_PAYMENT_FIELDS = _fields(
+    DownPaymentParams.__slots__[1:], _UniffiConverterTypeInternalDownPaymentParams.FORMAT
+)
+
+
+class _Field:
+    __slots__ = ("offset", "struct", "converter")
+
+    def __init__(self, offset, fmt, converter):
+        self.offset = offset
+        self.struct = struct.Struct(">" + fmt)
+        self.converter = converter
+
+    def patch(self, view, value, trusted):
+        if not trusted:
+            self.converter.check_lower(value)
+        try:
+            if self.converter is _UniffiConverterTimestamp:
+                self.struct.pack_into(view, self.offset, *_UniffiConverterTimestamp.split(value))
+            else:
+                self.struct.pack_into(view, self.offset, value)
+        except struct.error as e:
+            raise ValueError("can't encode value: {}".format(e)) from None
+
+
+def _layout(fields, offset=0):
+    layout = {}
+    for name, fmt, converter in fields:
+        layout[name] = _Field(offset, fmt, converter)
+        offset += struct.calcsize(">" + fmt)
+    return layout, offset
+
+
+def _params_layout(has_min_installments):
+    layout, offset = _layout(_PARAMS_FIELDS)
+    # `min_installments` is an Option<u32>: a presence flag, then the value if present.
+    # Only its value can be patched, since setting or clearing it changes the layout.
+    tail = _UniffiConverterTypeInternalParams.MIN_INSTALLMENTS_FORMATS[has_min_installments]
+    if has_min_installments:
+        flag_size = struct.calcsize(">" + tail[0])
+        layout["min_installments"] = _Field(offset + flag_size, tail[1:], _UniffiConverterUInt32)
+    return layout, offset + struct.calcsize(">" + tail)
+
+
+def _copy(params_type, params, overrides):
+    # A plain `params_type` copy of `params` with the `overrides` of its fields applied;
+    # overrides of unknown fields are left for `_Template._lower` to reject.
+    values = {name: getattr(params, name) for name in params_type.__slots__}
+    values.update((name, value) for name, value in overrides.items() if name in values)
+    return params_type(**values)
+
+
+def _check_size(data, size):
+    if len(data) != size:
+        raise InternalError(
+            "encoded params take {} bytes, but the template layout {}".format(len(data), size)
+        )
+
+
+class _Template:
+    # Encoded params that are copied into a fresh buffer and patched for every call.
+
+    def __init__(self, data, layout):
+        self._data = data
+        self._layout = layout
+
+    def _lower(self, overrides, trusted):
+        trusted = trusted or _VALIDATION_MODE.trusted
+
+        def fill(view):
+            ctypes.memmove(view, self._data, len(self._data))
+            for name, value in overrides.items():
+                try:
+                    field = self._layout[name]
+                except KeyError:
+                    raise self._unknown_field(name) from None
+                field.patch(view, value, trusted)
+
+        return _UniffiRustBuffer.alloc_filled(len(self._data), fill)
+
+    @staticmethod
+    def _unknown_field(name):
+        if isinstance(name, tuple):
+            name = ".".join(name)
+        if name in ("min_installments", "params.min_installments"):
+            return ValueError(
+                "min_installments can only be patched on templates of params that set it"
+            )
+        return TypeError("can't patch unknown params field {!r}".format(name))
+
+
+class ParamsTemplate(_Template):
+    """
+    Params encoded once, for calculating plans that only differ in a few fields.
+
+    Every call copies the encoded params and writes the given fields over them, at their
+    fixed offsets, instead of encoding the whole params again. Any field but
+    `min_installments` can be patched; `min_installments` can be patched only when the
+    template params set it, since setting or clearing it changes the encoded layout.
+
+    Patched values are validated like params fields, unless `trusted=True` is given or the
+    call is made within `payment_plan.trusted_inputs()`.
+
+    Args:
+        params (Params): The params holding the constant fields; they are validated once, here.
+    """
+
+    def __init__(self, params: Params):
+        _UniffiConverterTypeInternalParams.check_lower(params)
+        self.params = params.freeze()
+        layout, size = _params_layout(params.min_installments is not None)
+        data = _UniffiConverterTypeInternalParams.record_struct(params).pack(
+            *_UniffiConverterTypeInternalParams.pack_values(params)
+        )
+        _check_size(data, size)
+        super().__init__(data, layout)
+
+    def calculate_payment_plan(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        include_invoices: bool = True,
+        lazy: bool = False,
+        trusted: bool = False,
+        **overrides: Any
+    ) -> Union[List[Response], List[ResponseProjection], LazyResponses]:
+        """
+        Same as `payment_plan.calculate_payment_plan` for the template params with `overrides` applied.
+
+        Example:
+            template.calculate_payment_plan(requested_amount=5000, installments=12)
+        """
+        # Timing hooks get the params as patched; they are only built while hooks are registered.
+        params = _copy(Params, self.params, overrides) if instrumentation._hooks else None
+        return _call(
+            "calculate_payment_plan",
+            lambda: _payment_plan_lifter(fields, include_invoices, lazy),
+            lambda: (self._lower(overrides, trusted),),
+            _calculate_payment_plan_call,
+            params,
+        )
+
+
+class DownPaymentParamsTemplate(_Template):
+    """
+    Down payment params encoded once; see `ParamsTemplate`.
+
+    Down payment fields are patched by keyword and fields of the nested params through the
+    `params` mapping.
+
+    Args:
+        params (DownPaymentParams): The params holding the constant fields; they are validated once, here.
+    """
+
+    def __init__(self, params: DownPaymentParams):
+        _UniffiConverterTypeInternalDownPaymentParams.check_lower(params)
+        self.params = params.freeze()
+        nested, offset = _params_layout(params.params.min_installments is not None)
+        layout, size = _layout(_DOWN_PAYMENT_FIELDS, offset)
+        layout.update((("params", name), field) for name, field in nested.items())
+        data = _UniffiConverterTypeInternalDownPaymentParams.record_struct(params).pack(
+            *_UniffiConverterTypeInternalDownPaymentParams.pack_values(params)
+        )
+        _check_size(data, size)
+        super().__init__(data, layout)
+
+    def calculate_down_payment_plan(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        trusted: bool = False,
+        **overrides: Any
+    ) -> List[DownPaymentResponse]:
+        """
+        Same as `payment_plan.calculate_down_payment_plan` for the template params with the
+        overrides applied.
+
+        Example:
+            template.calculate_down_payment_plan(requested_amount=1500, params={"installments": 12})
+        """
+        patched = None
+        if instrumentation._hooks:
+            # Timing hooks get the params as patched.
+            patched = _copy(DownPaymentParams, self.params, overrides)
+            patched.params = _copy(Params, self.params.params, params or {})
+        if params:
+            overrides.update((("params", name), value) for name, value in params.items())
+        return _call(
+            "calculate_down_payment_plan",
+            lambda: _UniffiConverterSequenceTypeInternalDownPaymentResponse.lift,
+            lambda: (self._lower(overrides, trusted),),
+            _calculate_down_payment_plan_call,
+            patched,
+        )
+
+
+__all__ = [
+    "DownPaymentParamsTemplate",
+    "ParamsTemplate",
+]
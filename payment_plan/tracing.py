@@ -0,0 +1,199 @@
+"""
+OpenTelemetry spans of the payment plan functions.
+
+While enabled, every call to a payment plan function (see `payment_plan.instrumentation`)
+is traced as a span named after the function, with three child spans:
+
+- `payment_plan.lower`: validation and encoding of the arguments;
+- `payment_plan.rust_call`: the Rust call itself;
+- `payment_plan.lift`: decoding of the result.
+
+The parent span is a child of the span active at the call site, and carries the requested
+installments, the number of decoded plans and invoices and the encoded payload sizes as
+`payment_plan.*` attributes. Failed calls have an error status and the recorded exception.
+
+OpenTelemetry is not a dependency of the SDK, and is only imported by `enable_tracing()`.
+If the application has configured a tracer provider by the time of the first payment plan
+call (as with `opentelemetry-instrument`), tracing is enabled then, from the next call on;
+otherwise nothing is traced until `enable_tracing()` is called.
+"""
+
+import sys
+import threading
+import time
+from typing import Any, Optional
+from ._internal.payment_plan_uniffi import InternalDownPaymentParams, InternalParams
+from .instrumentation import CallTiming, add_hook, remove_hook
+
+_TRACER_NAME = "payment_plan"
+
+_lock = threading.Lock()
+_hook = None  # type: Optional[_SpanHook]
+# Whether _enable_if_configured is still registered, waiting for the first call.
+_pending = False
+# The opentelemetry.trace module, once imported by enable_tracing().
+_trace = None
+
+
+class _SpanHook:
+    # Timing hook turning each CallTiming into a span tree. Spans are created once the call
+    # is over, from its phase durations, so the calls themselves are not slowed down.
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def __call__(self, timing: CallTiming) -> None:
+        end = _now_ns()
+        start = end - _ns(timing.total_seconds)
+        span = self.tracer.start_span(
+            "payment_plan." + timing.function,
+            start_time=start,
+            attributes=_attributes(timing),
+        )
+        context = _trace.set_span_in_context(span)
+        phases = (
+            ("payment_plan.lower", _sum(timing.check_seconds, timing.lower_seconds)),
+            ("payment_plan.rust_call", timing.call_seconds),
+            ("payment_plan.lift", timing.lift_seconds),
+        )
+        # A failed call stops at the phase that raised, which is the last one timed.
+        children = [(name, seconds) for name, seconds in phases if seconds is not None]
+        status = None
+        if timing.error is not None:
+            status = _trace.Status(_trace.StatusCode.ERROR, str(timing.error))
+        for position, (name, seconds) in enumerate(children, 1):
+            child = self.tracer.start_span(name, context=context, start_time=start)
+            start += _ns(seconds)
+            if status is not None and position == len(children):
+                child.set_status(status)
+            child.end(end_time=start)
+        if status is not None:
+            span.set_status(status)
+            span.record_exception(timing.error)
+        span.end(end_time=end)
+
+
+def enable_tracing(tracer_provider: Optional[Any] = None) -> None:
+    """
+    Trace the payment plan functions with OpenTelemetry.
+
+    Args:
+        tracer_provider: The TracerProvider creating the spans; defaults to the global one.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+    """
+    global _hook
+    trace = _import_api()
+    hook = _SpanHook(trace.get_tracer(_TRACER_NAME, tracer_provider=tracer_provider))
+    with _lock:
+        _cancel_pending()
+        previous, _hook = _hook, hook
+        add_hook(hook)
+        if previous is not None:
+            remove_hook(previous)
+
+
+def disable_tracing() -> None:
+    """Stop tracing the payment plan functions, including when tracing was enabled automatically."""
+    global _hook
+    with _lock:
+        _cancel_pending()
+        previous, _hook = _hook, None
+        if previous is not None:
+            remove_hook(previous)
+
+
+def tracing_enabled() -> bool:
+    return _hook is not None
+
+
+def _import_api():
+    global _trace
+    if _trace is None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "payment_plan.tracing requires the OpenTelemetry API; install it with "
+                "`pip install payment-plan-python-sdk[opentelemetry]`"
+            ) from None
+        _trace = trace
+    return _trace
+
+
+def _enable_when_configured():
+    # Called when payment_plan is imported: the tracer provider is usually configured after
+    # that, so it is only looked at once the first call is over.
+    global _pending
+    with _lock:
+        if _hook is None and not _pending:
+            _pending = True
+            add_hook(_enable_if_configured)
+
+
+def _enable_if_configured(timing: CallTiming) -> None:
+    with _lock:
+        if not _pending:
+            return
+        _cancel_pending()
+    # An application with a configured provider has imported the API already; looking it up
+    # in sys.modules doesn't import OpenTelemetry into applications that don't use it.
+    trace = sys.modules.get("opentelemetry.trace")
+    if trace is not None and _hook is None and _is_configured(trace, trace.get_tracer_provider()):
+        enable_tracing()
+
+
+def _cancel_pending():
+    # Called with _lock held.
+    global _pending
+    if _pending:
+        _pending = False
+        remove_hook(_enable_if_configured)
+
+
+def _is_configured(trace, tracer_provider):
+    # The default provider is a proxy until the application sets one.
+    return not isinstance(tracer_provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider))
+
+
+def _attributes(timing):
+    attributes = {
+        "payment_plan.function": timing.function,
+        "payment_plan.plans": timing.plans,
+        "payment_plan.invoices": timing.invoices,
+        "payment_plan.input_bytes": timing.input_bytes,
+        "payment_plan.output_bytes": timing.output_bytes,
+    }
+    params = timing.params
+    if isinstance(params, InternalDownPaymentParams):
+        _set_int(attributes, "payment_plan.down_payment_installments", params.installments)
+        params = params.params
+    if isinstance(params, InternalParams):
+        _set_int(attributes, "payment_plan.installments", params.installments)
+    return attributes
+
+
+def _set_int(attributes, key, value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        attributes[key] = value
+
+
+def _sum(*durations):
+    durations = [duration for duration in durations if duration is not None]
+    return sum(durations) if durations else None
+
+
+def _ns(seconds):
+    return int(seconds * 1e9)
+
+
+def _now_ns():
+    return int(time.time() * 1e9)
+
+
+__all__ = [
+    "disable_tracing",
+    "enable_tracing",
+    "tracing_enabled",
+]
@@ -19,4 +19,9 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"],
+        "arrow": ["numpy", "pyarrow"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
 )
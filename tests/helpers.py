@@ -0,0 +1,46 @@
+"""Params factories shared by the test modules."""
+
+from datetime import datetime, timedelta, timezone
+from payment_plan import DownPaymentParams, Params
+
+
+def make_params(min_installments=None):
+    return Params(
+        requested_amount=7800,
+        first_payment_date=datetime(2025, 5, 3, tzinfo=timezone(timedelta(hours=-3))),
+        disbursement_date=datetime(2025, 4, 5, tzinfo=timezone(timedelta(hours=-3))),
+        installments=4,
+        debit_service_percentage=0,
+        mdr=0.05,
+        tac_percentage=0,
+        iof_overall=0.0038,
+        iof_percentage=0.000082,
+        interest_rate=0.0235,
+        min_installment_amount=100,
+        max_total_amount=1000000,
+        disbursement_only_on_business_days=True,
+        min_installments=min_installments,
+    )
+
+
+def make_down_payment_params(min_installments=None):
+    return DownPaymentParams(
+        params=make_params(min_installments),
+        requested_amount=1000,
+        min_installment_amount=100,
+        first_payment_date=datetime(2025, 5, 3, tzinfo=timezone(timedelta(hours=-3))),
+        installments=4,
+    )
+
+
+def make_batch():
+    # Params for one to six installments, with invalid params at index 3.
+    params = []
+    for installments in range(1, 7):
+        p = make_params()
+        p.installments = installments
+        params.append(p)
+    invalid = make_params()
+    invalid.requested_amount = -1
+    params.insert(3, invalid)
+    return params
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timezone
+import payment_plan
+from payment_plan import aio
+from helpers import make_down_payment_params, make_params
+
+
+class TestAio(unittest.TestCase):
+    def tearDown(self):
+        aio.configure()
+
+    def test_functions_match_sync_versions(self):
+        base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+        end_date = datetime(2025, 4, 30, tzinfo=timezone.utc)
+
+        async def run():
+            return await asyncio.gather(
+                aio.calculate_payment_plan(make_params()),
+                aio.calculate_down_payment_plan(make_down_payment_params()),
+                aio.next_disbursement_date(base_date),
+                aio.disbursement_date_range(base_date, 5),
+                aio.get_non_business_days_between(base_date, end_date),
+            )
+
+        self.assertEqual(
+            asyncio.run(run()),
+            [
+                payment_plan.calculate_payment_plan(make_params()),
+                payment_plan.calculate_down_payment_plan(make_down_payment_params()),
+                payment_plan.next_disbursement_date(base_date),
+                payment_plan.disbursement_date_range(base_date, 5),
+                payment_plan.get_non_business_days_between(base_date, end_date),
+            ],
+        )
+
+    def test_projections_and_lazy_results(self):
+        async def run():
+            return await asyncio.gather(
+                aio.calculate_payment_plan(
+                    make_params(), fields=["installment", "due_date"], include_invoices=False
+                ),
+                aio.calculate_payment_plan(make_params(), lazy=True),
+            )
+
+        projected, lazy = asyncio.run(run())
+
+        self.assertEqual(
+            projected,
+            payment_plan.calculate_payment_plan(
+                make_params(), fields=["installment", "due_date"], include_invoices=False
+            ),
+        )
+        self.assertIsInstance(lazy, payment_plan.LazyResponses)
+        self.assertEqual(list(lazy), payment_plan.calculate_payment_plan(make_params()))
+
+    def test_errors_propagate(self):
+        params = make_params()
+        params.requested_amount = -1
+
+        with self.assertRaises(payment_plan.Error.InvalidParams):
+            asyncio.run(aio.calculate_payment_plan(params))
+
+    def test_raw_timestamps(self):
+        async def run():
+            with payment_plan.raw_timestamps():
+                return await asyncio.gather(
+                    aio.calculate_payment_plan(make_params()),
+                    aio.next_disbursement_date(datetime(2025, 4, 3, tzinfo=timezone.utc)),
+                )
+
+        plans, date = asyncio.run(run())
+
+        self.assertIsInstance(plans[0].due_date, int)
+        self.assertIsInstance(date, int)
+
+    def test_trusted_inputs(self):
+        params = make_params()
+        params.mdr = "0.05"
+
+        async def run():
+            with payment_plan.trusted_inputs():
+                return await aio.calculate_payment_plan(params)
+
+        # Trusted params skip the value checks and fail to encode instead.
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+        with self.assertRaises(ValueError):
+            asyncio.run(aio.calculate_payment_plan(params, trusted=True))
+        with self.assertRaises(TypeError):
+            asyncio.run(aio.calculate_payment_plan(params))
+
+    def test_concurrency_limit_and_cancellation(self):
+        aio.configure(max_concurrency=1, max_waiting=1)
+        release = threading.Event()
+        started = []
+
+        def blocking(name):
+            started.append(name)
+            release.wait(5)
+            return name
+
+        async def run():
+            runner = aio._get_runner()
+            first = asyncio.ensure_future(runner.run(blocking, "first"))
+            second = asyncio.ensure_future(runner.run(blocking, "second"))
+            await asyncio.sleep(0.05)
+            with self.assertRaises(asyncio.QueueFull):
+                await runner.run(blocking, "third")
+            second.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return await first, second.cancelled()
+
+        self.assertEqual(asyncio.run(run()), ("first", True))
+        self.assertEqual(started, ["first"])
+
+    def test_reconfigure_while_calls_are_waiting(self):
+        aio.configure(max_concurrency=1)
+        release = threading.Event()
+
+        def blocking(name):
+            release.wait(5)
+            return name
+
+        async def run():
+            runner = aio._get_runner()
+            first = asyncio.ensure_future(runner.run(blocking, "first"))
+            second = asyncio.ensure_future(runner.run(blocking, "second"))
+            await asyncio.sleep(0.05)
+            aio.configure(max_concurrency=2)
+            self.assertFalse(runner.executor._shutdown)
+            third = await aio.next_disbursement_date(datetime(2025, 4, 3, tzinfo=timezone.utc))
+            release.set()
+            results = await asyncio.gather(first, second)
+            await asyncio.sleep(0)
+            return runner, results, third
+
+        runner, results, third = asyncio.run(run())
+        self.assertEqual(results, ["first", "second"])
+        self.assertIsInstance(third, datetime)
+        self.assertTrue(runner.executor._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import unittest
+from payment_plan import Error, calculate_payment_plan
+from helpers import make_batch
+
+try:
+    import pyarrow.parquet as pq
+    from payment_plan.arrow import (
+        INVOICES_SCHEMA,
+        PLANS_SCHEMA,
+        payment_plan_record_batches,
+        write_payment_plans_parquet,
+    )
+except ImportError:
+    pq = None
+
+
+@unittest.skipIf(pq is None, "PyArrow is not installed")
+class TestArrowExport(unittest.TestCase):
+    def test_record_batches(self):
+        params = make_batch()
+        errors = {}
+
+        batches = list(payment_plan_record_batches(params, batch_size=4, max_workers=2, errors=errors))
+
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(list(errors), [3])
+        self.assertIsInstance(errors[3], Error.InvalidParams)
+        plans = [row for batch, _ in batches for row in batch.to_pylist()]
+        invoices = [row for _, batch in batches for row in batch.to_pylist()]
+        expected = [
+            (index, plan)
+            for index, p in enumerate(params)
+            if index != 3
+            for plan in calculate_payment_plan(p)
+        ]
+        self.assertEqual(len(plans), len(expected))
+        for row, (index, plan) in zip(plans, expected):
+            self.assertEqual(row["params_index"], index)
+            self.assertEqual(row["installment"], plan.installment)
+            self.assertEqual(row["due_date"], plan.due_date)
+            self.assertEqual(row["total_amount"], plan.total_amount)
+            self.assertEqual(row["invoice_count"], len(plan.invoices))
+            plan_invoices = [
+                i for i in invoices
+                if (i["params_index"], i["installment"]) == (index, plan.installment)
+            ]
+            self.assertEqual([i["factor"] for i in plan_invoices], [i.factor for i in plan.invoices])
+            self.assertEqual([i["due_date"] for i in plan_invoices], [i.due_date for i in plan.invoices])
+
+    def test_write_parquet(self):
+        plans_file, invoices_file = io.BytesIO(), io.BytesIO()
+
+        summary = write_payment_plans_parquet(make_batch(), plans_file, invoices_file, batch_size=5)
+
+        plans = pq.read_table(io.BytesIO(plans_file.getvalue()))
+        invoices = pq.read_table(io.BytesIO(invoices_file.getvalue()))
+        self.assertEqual(plans.schema, PLANS_SCHEMA)
+        self.assertEqual(invoices.schema, INVOICES_SCHEMA)
+        self.assertEqual(summary.params, 7)
+        self.assertEqual(summary.plans, plans.num_rows)
+        self.assertEqual(summary.invoices, invoices.num_rows)
+        self.assertEqual(plans.num_rows, 21)
+        self.assertEqual(list(summary.errors), [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
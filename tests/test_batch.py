@@ -0,0 +1,121 @@
+import unittest
+from payment_plan import (
+    Error,
+    ProcessPoolEngine,
+    calculate_payment_plan,
+    calculate_payment_plan_many,
+    raw_timestamps,
+    shutdown_workers,
+    trusted_inputs,
+)
+from payment_plan import batch
+from helpers import make_batch, make_params
+
+
+class TestCalculatePaymentPlanMany(unittest.TestCase):
+    def test_ordered(self):
+        params = make_batch()
+
+        results = list(calculate_payment_plan_many(params, max_workers=3))
+
+        self.assertEqual([r.index for r in results], list(range(len(params))))
+        for r in results:
+            self.assertIs(r.params, params[r.index])
+            if r.index == 3:
+                self.assertIsNone(r.result)
+                self.assertIsInstance(r.error, Error.InvalidParams)
+            else:
+                self.assertIsNone(r.error)
+                self.assertEqual(r.result, calculate_payment_plan(params[r.index]))
+
+    def test_unordered(self):
+        params = make_batch() * 5
+
+        results = list(calculate_payment_plan_many(iter(params), max_workers=2, ordered=False))
+
+        self.assertEqual(sorted(r.index for r in results), list(range(len(params))))
+        self.assertEqual(sum(r.error is not None for r in results), 5)
+
+    def test_raw_timestamps(self):
+        with raw_timestamps():
+            results = calculate_payment_plan_many([make_params()], max_workers=2)
+        (result,) = results
+
+        self.assertIsInstance(result.result[0].due_date, int)
+
+    def test_trusted_inputs(self):
+        params = make_params()
+        params.mdr = "0.05"
+
+        with trusted_inputs():
+            (result,) = calculate_payment_plan_many([params], max_workers=2)
+
+        # Trusted params skip the value checks and fail to encode instead.
+        self.assertIsInstance(result.error, ValueError)
+
+    def test_shutdown_workers(self):
+        list(calculate_payment_plan_many([make_params()], max_workers=3))
+        executor = batch._executors[3]
+
+        shutdown_workers()
+
+        self.assertEqual(batch._executors, {})
+        with self.assertRaises(RuntimeError):
+            executor.submit(int)
+        (result,) = calculate_payment_plan_many([make_params()], max_workers=3)
+        self.assertIsNone(result.error)
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            calculate_payment_plan_many([], max_workers=0)
+
+
+class TestProcessPoolEngine(unittest.TestCase):
+    def test_ordered(self):
+        params = make_batch()
+
+        with ProcessPoolEngine(max_workers=2, chunk_size=2) as engine:
+            results = list(engine.calculate_payment_plan_many(params))
+
+        self.assertEqual([r.index for r in results], list(range(len(params))))
+        for r in results:
+            self.assertIs(r.params, params[r.index])
+            if r.index == 3:
+                self.assertIsInstance(r.error, Error.InvalidParams)
+            else:
+                self.assertEqual(r.result, calculate_payment_plan(params[r.index]))
+
+    def test_unordered(self):
+        params = make_batch() * 5
+
+        with ProcessPoolEngine(max_workers=2, chunk_size=4) as engine:
+            results = list(engine.calculate_payment_plan_many(params, ordered=False))
+
+        self.assertEqual(sorted(r.index for r in results), list(range(len(params))))
+        self.assertEqual(sum(r.error is not None for r in results), 5)
+
+    def test_raw_timestamps(self):
+        with ProcessPoolEngine(max_workers=1) as engine:
+            with raw_timestamps():
+                results = engine.calculate_payment_plan_many([make_params()])
+            (result,) = results
+
+        self.assertIsInstance(result.result[0].due_date, int)
+
+    def test_trusted(self):
+        params = make_params()
+        params.mdr = "0.05"
+
+        with ProcessPoolEngine(max_workers=1) as engine:
+            (untrusted,) = engine.calculate_payment_plan_many([params])
+            (trusted,) = engine.calculate_payment_plan_many([params], trusted=True)
+            with trusted_inputs():
+                (scoped,) = engine.calculate_payment_plan_many([params])
+
+        self.assertIsInstance(untrusted.error, TypeError)
+        self.assertIsInstance(trusted.error, ValueError)
+        self.assertIsInstance(scoped.error, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import tempfile
+import unittest
+from benchmarks import compare
+from benchmarks.__main__ import main
+from benchmarks.cases import all_benchmarks
+from benchmarks.harness import Benchmark, Result, load_results, measure, results_document
+from benchmarks.stats import mann_whitney_greater
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_names_are_unique(self):
+        names = [benchmark.name for benchmark in all_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_measure(self):
+        calls = []
+        result = measure(Benchmark("noop", "test", lambda: calls.append(None)), repeat=3, min_time=0.001)
+        self.assertEqual(len(result.samples), 3)
+        self.assertGreater(result.number, 1)
+        # The warm-up and calibration calls come on top of the timed ones.
+        self.assertGreater(len(calls), result.number * 3)
+        self.assertLessEqual(result.min, result.median)
+
+    def test_json_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            main(
+                [
+                    "--filter",
+                    r"^codec\.params_lower$|^next_disbursement_date$",
+                    "--repeat",
+                    "2",
+                    "--min-time",
+                    "0.001",
+                    "-o",
+                    path,
+                ]
+            )
+            with open(path) as f:
+                results = load_results(json.load(f))
+
+        self.assertEqual(set(results), {"codec.params_lower", "next_disbursement_date"})
+        self.assertEqual(len(results["codec.params_lower"].samples), 2)
+
+
+def make_results(medians, seed=0, samples=10):
+    rng = random.Random(seed)
+    return [
+        Result(name, "test", {}, 100, [median * rng.gauss(1, 0.01) for _ in range(samples)])
+        for name, median in medians.items()
+    ]
+
+
+class TestMannWhitney(unittest.TestCase):
+    def test_exact_p_value_matches_permutations(self):
+        rng = random.Random(1)
+        current = [rng.random() for _ in range(4)]
+        baseline = [rng.random() for _ in range(5)]
+        values = current + baseline
+
+        def u(x, y):
+            return sum(a > b for a in x for b in y)
+
+        observed = u(current, baseline)
+        splits = list(itertools.combinations(range(9), 4))
+        extreme = sum(
+            u([values[i] for i in split], [values[i] for i in range(9) if i not in split]) >= observed
+            for split in splits
+        )
+        self.assertAlmostEqual(mann_whitney_greater(current, baseline), extreme / len(splits))
+
+    def test_separated_samples(self):
+        self.assertAlmostEqual(mann_whitney_greater([2, 3, 4, 5, 6], [1, 1.1, 1.2, 1.3, 1.4]), 1 / 252)
+        self.assertGreater(mann_whitney_greater([1, 1.1, 1.2, 1.3, 1.4], [2, 3, 4, 5, 6]), 0.99)
+
+    def test_ties_use_normal_approximation(self):
+        self.assertGreater(mann_whitney_greater([1, 2, 2, 3], [1, 2, 2, 3]), 0.3)
+
+
+class TestCompare(unittest.TestCase):
+    def run_compare(self, baseline, current, *args):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, results in (("baseline", baseline), ("current", current)):
+                paths.append(os.path.join(directory, name + ".json"))
+                with open(paths[-1], "w") as f:
+                    json.dump(results_document(results, 10, 0.05), f)
+            report = os.path.join(directory, "report.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = compare.main(paths + ["--json", report] + list(args))
+            with open(report) as f:
+                return status, {c["name"]: c for c in json.load(f)["comparisons"]}
+
+    def test_noise_passes(self):
+        medians = {"calculate_payment_plan[installments=12]": 1e-3, "codec.params_lower": 2e-5}
+        status, comparisons = self.run_compare(
+            make_results(medians, seed=1), make_results(medians, seed=2)
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual({c["status"] for c in comparisons.values()}, {"unchanged"})
+
+    def test_tracked_regression_fails(self):
+        baseline = {"calculate_payment_plan[installments=12]": 1e-3, "next_disbursement_date": 4e-5}
+        current = {"calculate_payment_plan[installments=12]": 1.2e-3, "next_disbursement_date": 4e-5}
+        status, comparisons = self.run_compare(make_results(baseline), make_results(current, seed=1))
+
+        self.assertEqual(status, 1)
+        regression = comparisons["calculate_payment_plan[installments=12]"]
+        self.assertEqual(regression["status"], "regressed")
+        self.assertTrue(regression["failed"])
+        self.assertAlmostEqual(regression["ratio"], 1.2, delta=0.02)
+
+    def test_untracked_and_small_regressions_pass(self):
+        baseline = {"next_disbursement_date": 4e-5, "codec.params_lower": 2e-5}
+        current = {"next_disbursement_date": 8e-5, "codec.params_lower": 2.04e-5}
+        status, comparisons = self.run_compare(make_results(baseline), make_results(current, seed=1))
+
+        self.assertEqual(status, 0)
+        self.assertEqual(comparisons["next_disbursement_date"]["status"], "regressed")
+        self.assertEqual(comparisons["codec.params_lower"]["status"], "unchanged")
+        status, _ = self.run_compare(
+            make_results(baseline), make_results(current, seed=1), "--threshold", "0.01"
+        )
+        self.assertEqual(status, 1)
+
+    def test_missing_tracked_benchmark_fails(self):
+        status, comparisons = self.run_compare(
+            make_results({"codec.response_lift[installments=1]": 2e-5}), []
+        )
+        self.assertEqual(status, 1)
+        self.assertEqual(comparisons["codec.response_lift[installments=1]"]["status"], "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import time
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+from payment_plan import (
+    BusinessCalendar,
+    DisbursementDateCache,
+    disbursement_date_range,
+    get_non_business_days_between,
+    next_disbursement_date,
+    raw_timestamps,
+)
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = BusinessCalendar(2025, 2025)
+
+    def test_matches_rust_functions(self):
+        base = datetime(2025, 3, 25, 23, 0, tzinfo=timezone(timedelta(hours=-3)))
+        for i in range(45):
+            base_date = base + timedelta(days=i)
+            end_date = base_date + timedelta(days=9)
+
+            self.assertEqual(
+                self.calendar.next_disbursement_date(base_date),
+                next_disbursement_date(base_date),
+            )
+            for days in (0, 1, 5):
+                self.assertEqual(
+                    self.calendar.disbursement_date_range(base_date, days),
+                    disbursement_date_range(base_date, days),
+                )
+            self.assertEqual(
+                self.calendar.get_non_business_days_between(base_date, end_date),
+                get_non_business_days_between(base_date, end_date),
+            )
+
+    def test_next_disbursement_date_not_today(self):
+        calendar = BusinessCalendar()
+        today = datetime.now(timezone.utc)
+
+        self.assertEqual(calendar.next_disbursement_date(today), next_disbursement_date(today))
+
+    def test_outside_of_span_delegates_to_rust(self):
+        base_date = datetime(2025, 12, 30, tzinfo=timezone.utc)
+
+        self.assertEqual(
+            self.calendar.disbursement_date_range(base_date, 10),
+            disbursement_date_range(base_date, 10),
+        )
+        self.assertEqual(
+            self.calendar.business_days_between(
+                datetime(2025, 12, 1, tzinfo=timezone.utc),
+                datetime(2026, 1, 31, tzinfo=timezone.utc),
+            ),
+            62
+            - len(
+                get_non_business_days_between(
+                    datetime(2025, 12, 1, tzinfo=timezone.utc),
+                    datetime(2026, 1, 31, tzinfo=timezone.utc),
+                )
+            ),
+        )
+
+    def test_business_days_between(self):
+        # April 2025 has 30 days, 10 of them non-business (see test_get_non_business_days_between).
+        self.assertEqual(
+            self.calendar.business_days_between(
+                datetime(2025, 4, 1, tzinfo=timezone.utc),
+                datetime(2025, 4, 30, tzinfo=timezone.utc),
+            ),
+            20,
+        )
+        self.assertEqual(
+            self.calendar.business_days_between(
+                datetime(2025, 4, 30, tzinfo=timezone.utc),
+                datetime(2025, 4, 1, tzinfo=timezone.utc),
+            ),
+            0,
+        )
+
+    def test_raw_timestamps(self):
+        base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+        end_date = datetime(2025, 4, 30, tzinfo=timezone.utc)
+        with raw_timestamps():
+            calendar = BusinessCalendar(2025, 2025)
+            self.assertEqual(
+                calendar.next_disbursement_date(base_date), next_disbursement_date(base_date)
+            )
+            self.assertEqual(
+                calendar.disbursement_date_range(base_date, 5),
+                disbursement_date_range(base_date, 5),
+            )
+            self.assertEqual(
+                calendar.get_non_business_days_between(base_date, end_date),
+                get_non_business_days_between(base_date, end_date),
+            )
+            self.assertIsInstance(calendar.next_disbursement_date(base_date), int)
+        self.assertEqual(
+            calendar.next_disbursement_date(base_date), next_disbursement_date(base_date)
+        )
+
+    def test_is_business_day(self):
+        self.assertTrue(self.calendar.is_business_day(date(2025, 4, 17)))
+        self.assertFalse(self.calendar.is_business_day(date(2025, 4, 18)))
+        with self.assertRaises(ValueError):
+            self.calendar.is_business_day(date(2026, 1, 1))
+
+
+class TestDisbursementDateCache(unittest.TestCase):
+    def test_matches_rust_functions(self):
+        for cache in (DisbursementDateCache(), DisbursementDateCache(BusinessCalendar(2025, 2025))):
+            for hours in (0, 12, 23, 0):
+                base_date = datetime(2025, 4, 3, hours, tzinfo=timezone.utc)
+                self.assertEqual(
+                    cache.next_disbursement_date(base_date), next_disbursement_date(base_date)
+                )
+                self.assertEqual(
+                    cache.disbursement_date_range(base_date, 5),
+                    disbursement_date_range(base_date, 5),
+                )
+
+    def test_results_are_memoized_per_day(self):
+        cache = DisbursementDateCache()
+        first = cache.next_disbursement_date(datetime(2025, 4, 3, 1, tzinfo=timezone.utc))
+        second = cache.next_disbursement_date(datetime(2025, 4, 3, 22, tzinfo=timezone.utc))
+
+        self.assertIs(first, second)
+
+    def test_raw_timestamps_are_cached_apart(self):
+        base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+        for cache in (DisbursementDateCache(), DisbursementDateCache(BusinessCalendar(2025, 2025))):
+            with raw_timestamps():
+                self.assertIsInstance(cache.next_disbursement_date(base_date), int)
+                self.assertIsInstance(cache.disbursement_date_range(base_date, 5)[0], int)
+            self.assertEqual(
+                cache.next_disbursement_date(base_date), next_disbursement_date(base_date)
+            )
+            self.assertEqual(
+                cache.disbursement_date_range(base_date, 5), disbursement_date_range(base_date, 5)
+            )
+
+    def test_rolls_over_at_midnight(self):
+        cache = DisbursementDateCache()
+        base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+        first = cache.next_disbursement_date(base_date)
+        tomorrow = cache._expires_at
+
+        with mock.patch.object(time, "time", return_value=tomorrow - 1):
+            self.assertIs(cache.next_disbursement_date(base_date), first)
+        with mock.patch.object(time, "time", return_value=tomorrow):
+            self.assertIsNot(cache.next_disbursement_date(base_date), first)
+        self.assertGreater(cache._expires_at, tomorrow)
+
+
+if __name__ == "__main__":
+    unittest.main()
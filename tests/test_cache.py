@@ -0,0 +1,86 @@
+import unittest
+from datetime import timezone
+from payment_plan import calculate_down_payment_plan, calculate_payment_plan, raw_timestamps
+from payment_plan.cache import PaymentPlanCache
+from helpers import make_down_payment_params, make_params
+
+
+class TestPaymentPlanCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = PaymentPlanCache()
+        params = make_params()
+
+        first = cache.calculate_payment_plan(params)
+        params.disbursement_date = params.disbursement_date.astimezone(timezone.utc)
+        second = cache.calculate_payment_plan(params)
+
+        self.assertEqual(first, calculate_payment_plan(make_params()))
+        self.assertEqual(second, first)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertGreater(stats.size_bytes, 0)
+
+    def test_results_are_copies(self):
+        cache = PaymentPlanCache()
+
+        first = cache.calculate_payment_plan(make_params())
+        first[0].installment_amount = -1
+        first[0].invoices.clear()
+        second = cache.calculate_payment_plan(make_params())
+
+        self.assertEqual(second, calculate_payment_plan(make_params()))
+
+    def test_down_payment_plan(self):
+        cache = PaymentPlanCache()
+
+        cache.calculate_down_payment_plan(make_down_payment_params())
+        result = cache.calculate_down_payment_plan(make_down_payment_params())
+
+        self.assertEqual(result, calculate_down_payment_plan(make_down_payment_params()))
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_hits_follow_raw_timestamps(self):
+        cache = PaymentPlanCache()
+
+        with raw_timestamps():
+            raw = cache.calculate_payment_plan(make_params())
+        plans = cache.calculate_payment_plan(make_params())
+        with raw_timestamps():
+            raw_hit = cache.calculate_payment_plan(make_params())
+
+        self.assertIsInstance(raw[0].due_date, int)
+        self.assertEqual(raw_hit, raw)
+        self.assertEqual(plans, calculate_payment_plan(make_params()))
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (2, 1))
+
+    def test_lru_eviction_by_entries(self):
+        cache = PaymentPlanCache(max_entries=2)
+        params = [make_params() for _ in range(3)]
+        for i, p in enumerate(params):
+            p.installments = i + 1
+
+        cache.calculate_payment_plan(params[0])
+        cache.calculate_payment_plan(params[1])
+        cache.calculate_payment_plan(params[0])
+        cache.calculate_payment_plan(params[2])
+        cache.calculate_payment_plan(params[0])
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 3, 1))
+        self.assertEqual(stats.entries, 2)
+
+    def test_eviction_by_bytes(self):
+        cache = PaymentPlanCache(max_entries=None, max_bytes=1)
+        other = make_params()
+        other.installments = 2
+
+        cache.calculate_payment_plan(make_params())
+        cache.calculate_payment_plan(other)
+
+        stats = cache.stats()
+        self.assertEqual((stats.entries, stats.evictions), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+import pickle
+import unittest
+from datetime import datetime, timedelta, timezone
+from payment_plan import (
+    LazyResponses,
+    Response,
+    ResponseProjection,
+    ResponseView,
+    buffer_pool_stats,
+    calculate_payment_plan,
+    count_allocations,
+    next_disbursement_date,
+    raw_timestamps,
+    use_buffer_pool,
+)
+from payment_plan._calls import _calculate_payment_plan_bytes
+from payment_plan.responses import _compiled_projection, _projection
+from payment_plan._internal.payment_plan_uniffi import (
+    InternalError,
+    _UniffiConverterSequenceTypeInternalResponse,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeInternalDownPaymentParams,
+    _UniffiConverterTypeInternalParams,
+    _UniffiRustBuffer,
+)
+from helpers import make_down_payment_params, make_params
+
+
+class TestParamsEncoding(unittest.TestCase):
+    def assertRoundTrips(self, converter, value):
+        rbuf = converter.lower(value)
+        self.assertEqual(rbuf.len, converter.record_struct(value).size)
+        with rbuf.consume_with_stream() as stream:
+            self.assertEqual(converter.read(stream), value)
+
+    def test_params_round_trip(self):
+        self.assertRoundTrips(_UniffiConverterTypeInternalParams, make_params())
+        self.assertRoundTrips(_UniffiConverterTypeInternalParams, make_params(2))
+
+    def test_down_payment_params_round_trip(self):
+        self.assertRoundTrips(
+            _UniffiConverterTypeInternalDownPaymentParams, make_down_payment_params()
+        )
+        self.assertRoundTrips(
+            _UniffiConverterTypeInternalDownPaymentParams, make_down_payment_params(2)
+        )
+
+
+class TestAllocations(unittest.TestCase):
+    def test_lowering_allocates_once(self):
+        plans = calculate_payment_plan(make_params())
+        for converter, value in [
+            (_UniffiConverterTypeInternalParams, make_params()),
+            (_UniffiConverterTypeInternalParams, make_params(2)),
+            (_UniffiConverterTypeInternalDownPaymentParams, make_down_payment_params()),
+            (_UniffiConverterSequenceTypeInternalResponse, plans),
+            (_UniffiConverterTimestamp, plans[0].due_date),
+        ]:
+            with count_allocations() as counts:
+                rbuf = converter.lower(value)
+            rbuf.free()
+            self.assertEqual(counts.allocations, 1)
+            self.assertEqual(counts.reserves, 0)
+            self.assertEqual(counts.allocated_bytes, rbuf.len)
+
+    def test_counts_are_scoped(self):
+        with count_allocations() as counts:
+            calculate_payment_plan(make_params())
+        calculate_payment_plan(make_params())
+
+        self.assertEqual(counts.allocations, 1)
+
+    def test_counting_is_only_installed_within_blocks(self):
+        alloc = _UniffiRustBuffer.alloc
+        with count_allocations() as outer:
+            with count_allocations() as inner:
+                calculate_payment_plan(make_params())
+            calculate_payment_plan(make_params())
+            self.assertIsNot(_UniffiRustBuffer.alloc, alloc)
+
+        self.assertIs(_UniffiRustBuffer.alloc, alloc)
+        self.assertEqual((inner.allocations, outer.allocations), (1, 1))
+
+
+class TestBufferPool(unittest.TestCase):
+    def tearDown(self):
+        use_buffer_pool(False)
+
+    def test_pooled_lowering(self):
+        use_buffer_pool()
+        before = buffer_pool_stats()
+        for params in [make_params(), make_params(2), make_params()]:
+            with count_allocations() as counts:
+                rbuf = _UniffiConverterTypeInternalParams.lower(params)
+            self.assertEqual(counts.allocations, 1)
+            with rbuf.consume_with_stream() as stream:
+                self.assertEqual(_UniffiConverterTypeInternalParams.read(stream), params)
+        self.assertEqual(
+            calculate_payment_plan(make_params()), calculate_payment_plan(make_params(), lazy=True).to_list()
+        )
+
+        stats = buffer_pool_stats()
+        self.assertTrue(stats.enabled)
+        self.assertGreaterEqual(stats.threads, 1)
+        self.assertGreaterEqual(stats.reuses - before.reuses, 2)
+        self.assertLessEqual(stats.allocations - before.allocations, 2)
+
+    def test_encoding_errors(self):
+        use_buffer_pool()
+        params = make_params()
+        params.installments = -1
+        with self.assertRaises(ValueError):
+            calculate_payment_plan(params, trusted=True)
+        self.assertEqual(calculate_payment_plan(make_params()), calculate_payment_plan(make_params()))
+
+
+class TestResponseDecoding(unittest.TestCase):
+    def test_response_round_trip(self):
+        plans = calculate_payment_plan(make_params())
+        rbuf = _UniffiConverterSequenceTypeInternalResponse.lower(plans)
+        self.assertEqual(_UniffiConverterSequenceTypeInternalResponse.lift(rbuf), plans)
+
+    def test_equal_timestamps_are_shared(self):
+        params = make_params()
+        params.installments = 12
+        plans = calculate_payment_plan(params)
+
+        self.assertTrue(all(p.disbursement_date is plans[0].disbursement_date for p in plans))
+        for previous, plan in zip(plans, plans[1:]):
+            for a, b in zip(previous.invoices, plan.invoices):
+                if a.due_date == b.due_date:
+                    self.assertIs(a.due_date, b.due_date)
+
+
+class TestProjectedDecoding(unittest.TestCase):
+    FIELDS = ["installment", "installment_amount", "total_amount", "tec_monthly", "due_date"]
+
+    def test_projected_fields_match_full_decode(self):
+        params = make_params()
+        params.installments = 12
+        plans = calculate_payment_plan(params)
+        projected = calculate_payment_plan(params, fields=self.FIELDS, include_invoices=False)
+
+        self.assertEqual(len(projected), len(plans))
+        for plan, record in zip(plans, projected):
+            self.assertIsInstance(record, ResponseProjection)
+            self.assertEqual(
+                record.fields,
+                ("installment", "due_date", "installment_amount", "total_amount", "tec_monthly"),
+            )
+            for name in self.FIELDS:
+                self.assertEqual(getattr(record, name), getattr(plan, name))
+            with self.assertRaises(AttributeError):
+                record.invoices
+
+    def test_include_invoices(self):
+        plans = calculate_payment_plan(make_params())
+        projected = calculate_payment_plan(make_params(), fields=["installment"])
+
+        self.assertEqual([r.invoices for r in projected], [p.invoices for p in plans])
+        self.assertEqual(projected[0].fields, ("installment", "invoices"))
+        self.assertEqual(pickle.loads(pickle.dumps(projected)), projected)
+
+    def test_unknown_fields(self):
+        for fields in (["installment", "nope"], ["invoices"]):
+            with self.assertRaises(ValueError):
+                calculate_payment_plan(make_params(), fields=fields)
+        with self.assertRaises(TypeError):
+            calculate_payment_plan(make_params(), fields="installment")
+
+    def test_projections_are_shared_and_bounded(self):
+        self.assertIs(
+            _projection(["installment", "due_date"], False),
+            _projection(("due_date", "installment", "due_date"), False),
+        )
+        self.assertIsNot(_projection(["installment"], False), _projection(["installment"], True))
+        self.assertIsNotNone(_compiled_projection.cache_info().maxsize)
+
+
+class TestLazyResponses(unittest.TestCase):
+    def test_views_match_full_decode(self):
+        params = make_params()
+        params.installments = 12
+        plans = calculate_payment_plan(params)
+        lazy = calculate_payment_plan(params, lazy=True)
+
+        self.assertIsInstance(lazy, LazyResponses)
+        self.assertEqual(len(lazy), len(plans))
+        self.assertEqual(lazy.to_list(), plans)
+        for plan, view in zip(plans, lazy):
+            self.assertIsInstance(view, ResponseView)
+            for name in Response.__slots__:
+                self.assertEqual(getattr(view, name), getattr(plan, name), name)
+        self.assertIs(lazy[2], lazy[2])
+        self.assertIs(lazy[2].invoices, lazy[2].invoices)
+        self.assertEqual([v.installment for v in lazy[-2:]], [p.installment for p in plans[-2:]])
+
+    def test_raw_timestamps(self):
+        lazy = calculate_payment_plan(make_params(), lazy=True)
+
+        with raw_timestamps():
+            self.assertIsInstance(lazy[0].due_date, int)
+            self.assertIsInstance(lazy[0].invoices[0].due_date, int)
+        self.assertIsInstance(lazy[0].due_date, datetime)
+        self.assertIsInstance(lazy[0].invoices[0].due_date, datetime)
+        self.assertIsInstance(lazy[0].to_response().due_date, datetime)
+        with raw_timestamps():
+            self.assertIsInstance(lazy[0].to_response().due_date, int)
+
+    def test_truncated_buffer(self):
+        data = _calculate_payment_plan_bytes(make_params())
+        with self.assertRaises(InternalError):
+            LazyResponses(data[:-1])
+        with self.assertRaises(InternalError):
+            LazyResponses(data + b"\0")
+
+    def test_lazy_excludes_projection(self):
+        with self.assertRaises(ValueError):
+            calculate_payment_plan(make_params(), fields=["installment"], lazy=True)
+
+
+class TestTimestampCodec(unittest.TestCase):
+    def test_split_and_from_parts_round_trip(self):
+        for value in [
+            datetime(2025, 4, 7, 7, 0, 0, 123456, tzinfo=timezone(timedelta(hours=-3))),
+            datetime(1969, 12, 31, 23, 59, 58, 250000, tzinfo=timezone.utc),
+        ]:
+            seconds, nanoseconds = _UniffiConverterTimestamp.split(value)
+            self.assertEqual(_UniffiConverterTimestamp.from_parts(seconds, nanoseconds), value)
+
+    def test_raw_timestamps(self):
+        base_date = datetime(2025, 4, 3, tzinfo=timezone.utc)
+        expected = next_disbursement_date(base_date)
+
+        with raw_timestamps():
+            raw = next_disbursement_date(base_date)
+
+        self.assertEqual(raw, int(expected.timestamp()) * 1_000_000_000)
+        self.assertIsInstance(next_disbursement_date(base_date), datetime)
+
+
+class TestRecords(unittest.TestCase):
+    def test_records_are_slotted(self):
+        plans = calculate_payment_plan(make_params())
+        for record in [make_params(), make_down_payment_params(), plans[0], plans[0].invoices[0]]:
+            self.assertFalse(hasattr(record, "__dict__"), type(record).__name__)
+            with self.assertRaises(AttributeError):
+                record.not_a_field = 1
+
+    def test_records_pickle(self):
+        plans = calculate_payment_plan(make_params())
+        self.assertEqual(pickle.loads(pickle.dumps(plans)), plans)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(make_down_payment_params())), make_down_payment_params()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
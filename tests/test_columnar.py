@@ -0,0 +1,121 @@
+import unittest
+from unittest import mock
+from payment_plan import Error, calculate_payment_plan, trusted_inputs
+from helpers import make_params
+
+try:
+    import numpy as np
+    from payment_plan import columnar
+    from payment_plan.columnar import (
+        calculate_payment_plan_columnar,
+        calculate_payment_plan_columnar_many,
+    )
+except ImportError:
+    np = None
+
+
+def datetime64(value):
+    return np.datetime64(value.replace(tzinfo=None), "ns")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestColumnar(unittest.TestCase):
+    def assertTablesMatch(self, plans, invoices, expected, rows):
+        for row, plan in zip(rows, expected):
+            self.assertEqual(plans["installment"][row], plan.installment)
+            self.assertEqual(plans["due_date"][row], datetime64(plan.due_date))
+            self.assertEqual(plans["disbursement_date"][row], datetime64(plan.disbursement_date))
+            self.assertEqual(plans["tec_monthly"][row], plan.tec_monthly)
+            self.assertEqual(plans["paid_contract_amount"][row], plan.paid_contract_amount)
+            start, count = plans["invoice_start"][row], plans["invoice_count"][row]
+            self.assertEqual(count, len(plan.invoices))
+            self.assertTrue((invoices["plan"][start : start + count] == row).all())
+            self.assertEqual(
+                list(invoices["factor"][start : start + count]),
+                [invoice.factor for invoice in plan.invoices],
+            )
+            self.assertEqual(
+                list(invoices["due_date"][start : start + count]),
+                [datetime64(invoice.due_date) for invoice in plan.invoices],
+            )
+
+    def test_matches_calculate_payment_plan(self):
+        params = make_params()
+        params.installments = 12
+        expected = calculate_payment_plan(params)
+
+        plans, invoices = calculate_payment_plan_columnar(params)
+
+        self.assertEqual(len(plans), len(expected))
+        self.assertEqual(plans["due_date"].dtype, np.dtype("datetime64[ns]"))
+        self.assertTablesMatch(plans, invoices, expected, range(len(expected)))
+
+    def test_as_columns(self):
+        plans, invoices = calculate_payment_plan_columnar(make_params(), as_columns=True)
+
+        self.assertIsInstance(plans, dict)
+        self.assertTrue(plans["total_amount"].flags["C_CONTIGUOUS"])
+        self.assertEqual(len(invoices["factor"]), plans["invoice_count"].sum())
+
+    def test_many(self):
+        params = []
+        for installments in (3, 1, 6):
+            p = make_params()
+            p.installments = installments
+            params.append(p)
+        invalid = make_params()
+        invalid.requested_amount = -1
+        params.insert(1, invalid)
+
+        plans, invoices, errors = calculate_payment_plan_columnar_many(params, max_workers=2)
+
+        self.assertEqual(list(errors), [1])
+        self.assertIsInstance(errors[1], Error.InvalidParams)
+        row = 0
+        for index in (0, 2, 3):
+            expected = calculate_payment_plan(params[index])
+            rows = range(row, row + len(expected))
+            self.assertTrue((plans["params_index"][rows.start : rows.stop] == index).all())
+            self.assertTablesMatch(plans, invoices, expected, rows)
+            row = rows.stop
+        self.assertEqual(len(plans), row)
+
+    def test_many_trusted_inputs(self):
+        params = make_params()
+        params.mdr = "0.05"
+
+        with trusted_inputs():
+            _, _, errors = calculate_payment_plan_columnar_many([params], max_workers=2)
+
+        # Trusted params skip the value checks and fail to encode instead.
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_many_consumes_input_lazily(self):
+        read = []
+
+        def params_iterable():
+            for installments in range(1, 21):
+                read.append(installments)
+                p = make_params()
+                p.installments = installments
+                yield p
+
+        first_appended = []
+        append = columnar._Table.append
+
+        def record_append(table, params_index, data):
+            if not first_appended:
+                first_appended.append(len(read))
+            append(table, params_index, data)
+
+        with mock.patch.object(columnar._Table, "append", record_append):
+            plans, _, errors = calculate_payment_plan_columnar_many(params_iterable(), max_workers=1)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(first_appended, [columnar._TASKS_PER_WORKER])
+        self.assertEqual(sorted(set(plans["params_index"].tolist())), list(range(20)))
+        self.assertTrue((np.diff(plans["params_index"]) >= 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from datetime import datetime, timezone
+from payment_plan import (
+    DownPaymentParamsTemplate,
+    Error,
+    ParamsTemplate,
+    calculate_down_payment_plan,
+    calculate_payment_plan,
+    next_disbursement_date,
+)
+from payment_plan import instrumentation
+from payment_plan._calls import _calculate_payment_plan_bytes
+from payment_plan.instrumentation import add_hook, remove_hook, timing_hook
+from helpers import make_down_payment_params, make_params
+
+
+class TestTimingHooks(unittest.TestCase):
+    def test_phases_and_counts(self):
+        timings = []
+        with timing_hook(timings.append):
+            plans = calculate_payment_plan(make_params())
+            calculate_payment_plan(make_params(), fields=["installment"], include_invoices=False)
+            down_payment_plans = calculate_down_payment_plan(make_down_payment_params())
+            next_disbursement_date(datetime(2025, 4, 3, tzinfo=timezone.utc))
+
+        self.assertEqual(
+            [t.function for t in timings],
+            [
+                "calculate_payment_plan",
+                "calculate_payment_plan",
+                "calculate_down_payment_plan",
+                "next_disbursement_date",
+            ],
+        )
+        full, projected, down_payment, dates = timings
+        for timing in timings:
+            self.assertIsNone(timing.error)
+            for duration in (timing.check_seconds, timing.lower_seconds, timing.call_seconds, timing.lift_seconds):
+                self.assertGreaterEqual(duration, 0)
+            self.assertGreater(timing.input_bytes, 0)
+            self.assertGreater(timing.output_bytes, 0)
+        self.assertEqual(full.plans, len(plans))
+        self.assertEqual(full.invoices, sum(len(p.invoices) for p in plans))
+        self.assertEqual((projected.plans, projected.invoices), (len(plans), 0))
+        self.assertEqual(
+            down_payment.plans, sum(len(r.plans) for r in down_payment_plans)
+        )
+        self.assertEqual((dates.input_bytes, dates.output_bytes, dates.plans), (12, 12, 0))
+
+    def test_templates_and_encoded_results_are_reported(self):
+        template = ParamsTemplate(make_params())
+        down_payment_template = DownPaymentParamsTemplate(make_down_payment_params())
+        timings = []
+        with timing_hook(timings.append):
+            plans = template.calculate_payment_plan(installments=6)
+            down_payment_template.calculate_down_payment_plan()
+            _calculate_payment_plan_bytes(make_params())
+
+        self.assertEqual(
+            [t.function for t in timings],
+            ["calculate_payment_plan", "calculate_down_payment_plan", "calculate_payment_plan"],
+        )
+        self.assertEqual(timings[0].plans, len(plans))
+        self.assertEqual(timings[0].params.installments, 6)
+        for timing in timings:
+            self.assertGreater(timing.input_bytes, 0)
+            self.assertGreater(timing.output_bytes, 0)
+
+    def test_errors_are_reported(self):
+        params = make_params()
+        params.requested_amount = -1
+        timings = []
+        with timing_hook(timings.append):
+            with self.assertRaises(Error.InvalidParams):
+                calculate_payment_plan(params)
+
+        (timing,) = timings
+        self.assertIsInstance(timing.error, Error.InvalidParams)
+        self.assertIsNotNone(timing.call_seconds)
+        self.assertIsNone(timing.lift_seconds)
+
+    def test_failing_hook_does_not_break_calls(self):
+        def hook(timing):
+            raise RuntimeError("boom")
+
+        with timing_hook(hook):
+            with self.assertLogs("payment_plan.instrumentation"):
+                self.assertEqual(calculate_payment_plan(make_params()), calculate_payment_plan(make_params()))
+
+    def test_disabled_when_no_hook_is_left(self):
+        timings = []
+        add_hook(timings.append)
+        remove_hook(timings.append)
+
+        calculate_payment_plan(make_params())
+
+        self.assertEqual(timings, [])
+        self.assertEqual(instrumentation._hooks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from payment_plan import Error, calculate_payment_plan, instrumentation
+from payment_plan._internal import payment_plan_uniffi
+from payment_plan.instrumentation import CallTiming
+from payment_plan.metrics import LatencyHistogram, MetricsRegistry
+from helpers import make_params
+
+
+def make_timing(function="calculate_payment_plan", seconds=0.001, error=None):
+    return CallTiming(function, 0.0, 0.0, seconds, 0.0, 10, 20, 1, 1, error)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_relative_error_is_bounded(self):
+        histogram = LatencyHistogram(precision_bits=6)
+        for seconds in (1e-7, 3.3e-6, 4.2e-4, 0.017, 2.5):
+            histogram.record(seconds)
+            value = histogram.snapshot().max
+            upper_bound = histogram.snapshot().buckets[-1][0]
+            self.assertGreaterEqual(upper_bound, value)
+            self.assertLessEqual(upper_bound, value * (1 + 2 ** -5) + 1e-9)
+
+    def test_quantiles(self):
+        histogram = LatencyHistogram()
+        for microseconds in range(1, 101):
+            histogram.record(microseconds * 1e-6)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot.count, 100)
+        self.assertAlmostEqual(snapshot.sum, 5050e-6)
+        self.assertAlmostEqual(snapshot.quantile(0.5), 50e-6, delta=50e-6 / 16)
+        self.assertAlmostEqual(snapshot.quantile(0.99), 99e-6, delta=99e-6 / 16)
+        self.assertEqual(snapshot.quantile(1), snapshot.max)
+        self.assertIsNone(LatencyHistogram().snapshot().quantile(0.5))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_errors_are_split_by_kind(self):
+        registry = MetricsRegistry()
+        registry.record(make_timing())
+        registry.record(make_timing(error=Error.InvalidParams()))
+        registry.record(make_timing(error=Error.CalculationError()))
+        registry.record(make_timing(error=payment_plan_uniffi.InternalError("panic")))
+        registry.record(make_timing(error=TypeError("real number")))
+
+        metrics = registry.snapshot()["calculate_payment_plan"]
+        self.assertEqual(metrics.calls, 5)
+        self.assertEqual(
+            metrics.errors,
+            {"invalid_params": 1, "calculation_error": 1, "internal_error": 1, "other": 1},
+        )
+        self.assertEqual(metrics.latency.count, 5)
+        self.assertEqual(metrics.phases["call"].count, 5)
+        self.assertEqual((metrics.plans, metrics.invoices), (5, 5))
+
+    def test_records_calls_while_enabled(self):
+        registry = MetricsRegistry()
+        registry.enable()
+        try:
+            calculate_payment_plan(make_params())
+            params = make_params()
+            params.requested_amount = -1
+            with self.assertRaises(Error.InvalidParams):
+                calculate_payment_plan(params)
+        finally:
+            registry.disable()
+        calculate_payment_plan(make_params())
+
+        metrics = registry.snapshot()["calculate_payment_plan"]
+        self.assertEqual(metrics.calls, 2)
+        self.assertEqual(metrics.errors["invalid_params"], 1)
+        self.assertEqual(metrics.phases["lift"].count, 1)
+        self.assertEqual(instrumentation._hooks, [])
+
+        registry.reset()
+        self.assertEqual(registry.snapshot(), {})
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.record(make_timing(error=Error.InvalidParams()))
+        text = registry.to_prometheus()
+
+        self.assertIn("# TYPE payment_plan_calls_total counter\n", text)
+        self.assertIn('payment_plan_calls_total{function="calculate_payment_plan"} 1\n', text)
+        self.assertIn(
+            'payment_plan_errors_total{function="calculate_payment_plan",error="invalid_params"} 1\n',
+            text,
+        )
+        self.assertIn(
+            'payment_plan_latency_seconds_count{function="calculate_payment_plan"} 1\n', text
+        )
+        self.assertIn(
+            'payment_plan_phase_latency_seconds_count{function="calculate_payment_plan",phase="call"} 1\n',
+            text,
+        )
+        self.assertIn(
+            'payment_plan_latency_seconds{function="calculate_payment_plan",quantile="0.99"} ', text
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
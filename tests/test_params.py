@@ -0,0 +1,119 @@
+import pickle
+import unittest
+from datetime import timezone
+from payment_plan import (
+    FrozenDownPaymentParams,
+    FrozenParams,
+    calculate_down_payment_plan,
+    calculate_payment_plan,
+    calculate_payment_plan_many,
+    trusted_inputs,
+)
+from helpers import make_down_payment_params, make_params
+
+
+class TestFrozenParams(unittest.TestCase):
+    def test_freeze_is_hashable_and_equal(self):
+        frozen = make_params().freeze()
+
+        self.assertIsInstance(frozen, FrozenParams)
+        self.assertEqual(frozen, make_params())
+        self.assertEqual(hash(frozen), hash(make_params().freeze()))
+        self.assertIs(frozen.freeze(), frozen)
+
+    def test_hash_normalizes_timestamps(self):
+        params = make_params()
+        params.disbursement_date = params.disbursement_date.astimezone(timezone.utc)
+        params.requested_amount = 7800.0
+
+        self.assertEqual(params.freeze(), make_params().freeze())
+        self.assertEqual(hash(params.freeze()), hash(make_params().freeze()))
+
+    def test_different_params_hash_apart(self):
+        params = make_params()
+        params.installments = 5
+
+        self.assertNotEqual(params.freeze(), make_params().freeze())
+        self.assertEqual(len({params.freeze(), make_params().freeze()}), 2)
+
+    def test_frozen_params_are_immutable(self):
+        frozen = make_params().freeze()
+
+        with self.assertRaises(AttributeError):
+            frozen.installments = 5
+        with self.assertRaises(AttributeError):
+            del frozen.installments
+
+    def test_frozen_down_payment_params_nest_frozen_params(self):
+        frozen = make_down_payment_params().freeze()
+
+        self.assertIsInstance(frozen, FrozenDownPaymentParams)
+        self.assertIsInstance(frozen.params, FrozenParams)
+        self.assertEqual(frozen, make_down_payment_params())
+        self.assertEqual(hash(frozen), hash(make_down_payment_params(None).freeze()))
+        self.assertNotEqual(hash(frozen), hash(make_down_payment_params(2).freeze()))
+
+    def test_frozen_params_pickle(self):
+        frozen = make_down_payment_params().freeze()
+        restored = pickle.loads(pickle.dumps(frozen))
+
+        self.assertEqual(restored, frozen)
+        self.assertEqual(hash(restored), hash(frozen))
+
+    def test_frozen_params_calculate(self):
+        self.assertEqual(
+            calculate_payment_plan(make_params().freeze()),
+            calculate_payment_plan(make_params()),
+        )
+        self.assertEqual(
+            calculate_down_payment_plan(make_down_payment_params().freeze()),
+            calculate_down_payment_plan(make_down_payment_params()),
+        )
+
+
+class TestTrustedInputs(unittest.TestCase):
+    def test_same_results(self):
+        expected = calculate_payment_plan(make_params())
+
+        self.assertEqual(calculate_payment_plan(make_params(), trusted=True), expected)
+        with trusted_inputs():
+            self.assertEqual(calculate_payment_plan(make_params()), expected)
+        self.assertEqual(
+            calculate_down_payment_plan(make_down_payment_params(), trusted=True),
+            calculate_down_payment_plan(make_down_payment_params()),
+        )
+        self.assertEqual(
+            [r.result for r in calculate_payment_plan_many([make_params()], trusted=True)],
+            [expected],
+        )
+
+    def test_type_is_still_checked(self):
+        down_payment_params = make_down_payment_params()
+        down_payment_params.params = object()
+        with trusted_inputs():
+            with self.assertRaises(TypeError):
+                calculate_payment_plan(object())
+            with self.assertRaises(TypeError):
+                calculate_down_payment_plan(down_payment_params)
+
+    def test_bad_values_fail_to_encode(self):
+        params = make_params()
+        params.installments = -1
+        with self.assertRaises(ValueError):
+            calculate_payment_plan(params, trusted=True)
+        params = make_params()
+        params.mdr = "0.05"
+        with self.assertRaises(ValueError):
+            calculate_payment_plan(params, trusted=True)
+
+    def test_scope_is_restored(self):
+        params = make_params()
+        params.mdr = "0.05"
+        with trusted_inputs():
+            pass
+        with self.assertRaisesRegex(TypeError, "real number"):
+            calculate_payment_plan(params)
+
+
+if __name__ == "__main__":
+    unittest.main()
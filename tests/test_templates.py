@@ -0,0 +1,168 @@
+import unittest
+from datetime import datetime, timezone
+from payment_plan import (
+    DownPaymentParamsTemplate,
+    ParamsTemplate,
+    calculate_down_payment_plan,
+    calculate_payment_plan,
+    trusted_inputs,
+)
+from payment_plan import templates
+from payment_plan.instrumentation import timing_hook
+from payment_plan._internal.payment_plan_uniffi import (
+    InternalError,
+    _UniffiConverterTimestamp,
+    _UniffiConverterTypeInternalDownPaymentParams,
+    _UniffiConverterTypeInternalParams,
+)
+from helpers import make_down_payment_params, make_params
+
+
+class TestParamsTemplate(unittest.TestCase):
+    def test_patched_fields_match_params(self):
+        template = ParamsTemplate(make_params())
+        for installments, requested_amount in ((1, 7800), (6, 5000.5), (12, 12000)):
+            params = make_params()
+            params.installments = installments
+            params.requested_amount = requested_amount
+
+            self.assertEqual(
+                template.calculate_payment_plan(
+                    installments=installments, requested_amount=requested_amount
+                ),
+                calculate_payment_plan(params),
+            )
+
+    def test_timestamps_and_options(self):
+        template = ParamsTemplate(make_params(min_installments=2))
+        params = make_params(min_installments=3)
+        params.disbursement_date = datetime(2025, 4, 8, tzinfo=timezone.utc)
+        params.installments = 6
+
+        plans = template.calculate_payment_plan(
+            fields=["installment", "total_amount"],
+            include_invoices=False,
+            disbursement_date=params.disbursement_date,
+            installments=6,
+            min_installments=3,
+        )
+
+        self.assertEqual(
+            [(p.installment, p.total_amount) for p in plans],
+            [(p.installment, p.total_amount) for p in calculate_payment_plan(params)],
+        )
+
+    def test_template_is_not_modified(self):
+        template = ParamsTemplate(make_params())
+        template.calculate_payment_plan(installments=12)
+
+        self.assertEqual(template.calculate_payment_plan(), calculate_payment_plan(make_params()))
+
+    def test_invalid_patches(self):
+        template = ParamsTemplate(make_params())
+        with self.assertRaises(TypeError):
+            template.calculate_payment_plan(not_a_field=1)
+        with self.assertRaises(ValueError):
+            template.calculate_payment_plan(min_installments=2)
+        with self.assertRaises(ValueError):
+            template.calculate_payment_plan(installments=-1)
+        with self.assertRaisesRegex(TypeError, "real number"):
+            template.calculate_payment_plan(mdr="0.05")
+        with trusted_inputs():
+            with self.assertRaises(ValueError):
+                template.calculate_payment_plan(mdr="0.05")
+
+    def test_timing_hooks_get_patched_params(self):
+        template = ParamsTemplate(make_params())
+        timings = []
+
+        with timing_hook(timings.append):
+            template.calculate_payment_plan(installments=2)
+            with self.assertRaises(TypeError):
+                template.calculate_payment_plan(not_a_field=1)
+
+        self.assertEqual(timings[0].params.installments, 2)
+        self.assertEqual(template.params.installments, 4)
+        self.assertIsInstance(timings[1].error, TypeError)
+
+
+class TestDownPaymentParamsTemplate(unittest.TestCase):
+    def test_patched_fields_match_params(self):
+        template = DownPaymentParamsTemplate(make_down_payment_params())
+        params = make_down_payment_params()
+        params.requested_amount = 1500
+        params.params.installments = 6
+
+        self.assertEqual(
+            template.calculate_down_payment_plan(
+                requested_amount=1500, params={"installments": 6}
+            ),
+            calculate_down_payment_plan(params),
+        )
+
+    def test_invalid_patches(self):
+        template = DownPaymentParamsTemplate(make_down_payment_params())
+        with self.assertRaises(TypeError):
+            template.calculate_down_payment_plan(params={"not_a_field": 1})
+        with self.assertRaises(ValueError):
+            template.calculate_down_payment_plan(params={"min_installments": 2})
+
+    def test_timing_hooks_get_patched_params(self):
+        template = DownPaymentParamsTemplate(make_down_payment_params())
+        timings = []
+
+        with timing_hook(timings.append):
+            template.calculate_down_payment_plan(requested_amount=1500, params={"installments": 2})
+
+        (timing,) = timings
+        self.assertEqual(timing.params.requested_amount, 1500)
+        self.assertEqual(timing.params.params.installments, 2)
+        self.assertEqual(template.params.params.installments, 4)
+
+
+
+def other_value(converter, value):
+    if converter is _UniffiConverterTimestamp:
+        return datetime(2026, 1, 2, tzinfo=timezone.utc)
+    if isinstance(value, bool):
+        return not value
+    return value + 1
+
+
+class TestLayout(unittest.TestCase):
+    def test_every_field_is_patched_at_its_offset(self):
+        params = make_params(min_installments=2)
+        other = make_params(min_installments=3)
+        overrides = {}
+        for name, _, converter in templates._PARAMS_FIELDS:
+            overrides[name] = other_value(converter, getattr(params, name))
+            setattr(other, name, overrides[name])
+        overrides["min_installments"] = 3
+
+        self.assertEqual(
+            ParamsTemplate(params)._lower(overrides, False).consume_bytes(),
+            _UniffiConverterTypeInternalParams.lower(other).consume_bytes(),
+        )
+
+    def test_every_down_payment_field_is_patched_at_its_offset(self):
+        params = make_down_payment_params()
+        other = make_down_payment_params()
+        overrides = {}
+        for name, _, converter in templates._DOWN_PAYMENT_FIELDS:
+            overrides[name] = other_value(converter, getattr(params, name))
+            setattr(other, name, overrides[name])
+
+        self.assertEqual(
+            DownPaymentParamsTemplate(params)._lower(overrides, False).consume_bytes(),
+            _UniffiConverterTypeInternalDownPaymentParams.lower(other).consume_bytes(),
+        )
+
+    def test_mismatched_format(self):
+        with self.assertRaises(InternalError):
+            templates._fields(("installments",), "Id")
+        with self.assertRaises(InternalError):
+            templates._fields(("installments",), "Q")
+
+
+if __name__ == "__main__":
+    unittest.main()
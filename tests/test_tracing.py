@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+from payment_plan import Error, calculate_down_payment_plan, calculate_payment_plan
+from payment_plan import instrumentation, tracing
+from payment_plan.tracing import disable_tracing, enable_tracing, tracing_enabled
+from helpers import make_down_payment_params, make_params
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    trace = None
+
+
+@unittest.skipIf(trace is None, "OpenTelemetry SDK is not installed")
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        self.provider = TracerProvider()
+        self.provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        enable_tracing(self.provider)
+        self.addCleanup(disable_tracing)
+
+    def spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def test_call_spans(self):
+        with self.provider.get_tracer("test").start_as_current_span("request") as request:
+            plans = calculate_payment_plan(make_params())
+
+        spans = self.spans()
+        call = spans["payment_plan.calculate_payment_plan"]
+        self.assertEqual(call.parent.span_id, request.get_span_context().span_id)
+        self.assertEqual(call.attributes["payment_plan.installments"], make_params().installments)
+        self.assertEqual(call.attributes["payment_plan.plans"], len(plans))
+        self.assertGreater(call.attributes["payment_plan.output_bytes"], 0)
+        for name in ("payment_plan.lower", "payment_plan.rust_call", "payment_plan.lift"):
+            self.assertEqual(spans[name].parent.span_id, call.get_span_context().span_id)
+            self.assertGreaterEqual(spans[name].start_time, call.start_time)
+            self.assertLessEqual(spans[name].end_time, call.end_time)
+        self.assertLessEqual(spans["payment_plan.lower"].end_time, spans["payment_plan.rust_call"].start_time)
+
+    def test_down_payment_attributes(self):
+        params = make_down_payment_params()
+        calculate_down_payment_plan(params)
+
+        call = self.spans()["payment_plan.calculate_down_payment_plan"]
+        self.assertEqual(call.attributes["payment_plan.down_payment_installments"], params.installments)
+        self.assertEqual(call.attributes["payment_plan.installments"], params.params.installments)
+
+    def test_errors(self):
+        params = make_params()
+        params.requested_amount = -1
+        with self.assertRaises(Error.InvalidParams):
+            calculate_payment_plan(params)
+
+        spans = self.spans()
+        call = spans["payment_plan.calculate_payment_plan"]
+        self.assertEqual(call.status.status_code, trace.StatusCode.ERROR)
+        self.assertEqual(call.events[0].name, "exception")
+        self.assertEqual(spans["payment_plan.rust_call"].status.status_code, trace.StatusCode.ERROR)
+        self.assertNotIn("payment_plan.lift", spans)
+
+    def test_disable(self):
+        self.assertTrue(tracing_enabled())
+        disable_tracing()
+        self.assertFalse(tracing_enabled())
+        self.assertEqual(instrumentation._hooks, [])
+        calculate_payment_plan(make_params())
+        self.assertEqual(self.exporter.get_finished_spans(), ())
+
+
+class TestImport(unittest.TestCase):
+    def test_opentelemetry_is_not_imported(self):
+        code = "import sys, payment_plan; print('opentelemetry' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+        self.assertEqual(output.strip(), b"False")
+
+
+@unittest.skipIf(trace is None, "OpenTelemetry SDK is not installed")
+class TestAutomaticTracing(unittest.TestCase):
+    def setUp(self):
+        # Drops the check left pending since payment_plan was imported, if still there.
+        disable_tracing()
+        self.addCleanup(disable_tracing)
+        tracing._enable_when_configured()
+
+    def test_enabled_once_configured(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        with mock.patch.object(trace, "get_tracer_provider", return_value=provider):
+            calculate_payment_plan(make_params())
+            self.assertTrue(tracing_enabled())
+            calculate_payment_plan(make_params())
+
+        names = [span.name for span in exporter.get_finished_spans()]
+        self.assertEqual(names.count("payment_plan.calculate_payment_plan"), 1)
+
+    def test_not_enabled_without_provider(self):
+        calculate_payment_plan(make_params())
+
+        self.assertFalse(tracing_enabled())
+        self.assertEqual(instrumentation._hooks, [])
+
+    def test_disable_cancels_the_check(self):
+        disable_tracing()
+
+        self.assertEqual(instrumentation._hooks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()